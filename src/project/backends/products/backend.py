@@ -1,5 +1,9 @@
 import abc
+from typing import Dict, Iterable
 
+from asgiref.sync import sync_to_async
+
+from project.backends.products.exceptions import ProductNotFoundException
 from project.backends.products.interfaces import Product
 
 
@@ -8,3 +12,47 @@ class ProductAbstractBackend(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def get_product(self, product_id: str) -> Product:
         pass
+
+    def get_products(self, product_ids: Iterable[str]) -> Dict[str, Product]:
+        """
+        Returns the products of the given ids indexed by id. Products that do
+        not exist are left out of the result. Backends that can resolve many
+        products at once should override this method.
+        """
+        products = {}
+        for product_id in dict.fromkeys(map(str, product_ids)):
+            try:
+                products[product_id] = self.get_product(product_id)
+            except ProductNotFoundException:
+                continue
+
+        return products
+
+    def invalidate_products(
+        self,
+        product_ids: Iterable[str],
+        refresh: bool = False
+    ) -> None:
+        """
+        Drops the given products from the caches of the backend, fetching
+        them again when `refresh` is set. Backends without caches have
+        nothing to invalidate.
+        """
+
+    async def aget_product(self, product_id: str) -> Product:
+        """
+        Async version of `get_product`. Backends with a non-blocking client
+        should override it, by default the blocking call runs on a thread.
+        """
+        return await sync_to_async(self.get_product, thread_sensitive=False)(
+            product_id
+        )
+
+    async def aget_products(
+        self,
+        product_ids: Iterable[str]
+    ) -> Dict[str, Product]:
+        return await sync_to_async(
+            self.get_products,
+            thread_sensitive=False
+        )(list(product_ids))
@@ -0,0 +1,25 @@
+import abc
+from typing import Iterator, List
+
+from django.utils.module_loading import import_string
+
+from simple_settings import settings
+
+
+class ProductEventConsumer(metaclass=abc.ABCMeta):
+    """
+    Source of product change events, such as a queue or a topic of a broker.
+    Consumers yield batches of ids of changed products, whose caches are
+    then invalidated.
+    """
+
+    @abc.abstractmethod
+    def consume(self) -> Iterator[List[str]]:
+        pass
+
+
+def get_product_event_consumer() -> ProductEventConsumer:
+    consumer_class = import_string(
+        settings.EXTENSIONS_CONFIG['challenge']['invalidation']['consumer']
+    )
+    return consumer_class()
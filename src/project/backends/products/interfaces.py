@@ -1,8 +1,11 @@
-from dataclasses import dataclass
+from typing import Iterable, List, NamedTuple
 
 
-@dataclass
-class Product:
+class Product(NamedTuple):
+    """
+    Immutable product value. Being a tuple it has no per-instance dict,
+    is cheap to build from a row of values and pickles as a plain tuple.
+    """
     id: str
     price: float
     image: str
@@ -10,20 +13,31 @@ class Product:
     title: str
 
     def as_dict(self):
-        return {
-            'id': self.id,
-            'price': self.price,
-            'image': self.image,
-            'brand': self.brand,
-            'title': self.title,
-        }
+        return self._asdict()
+
+    def as_tuple(self):
+        return tuple(self)
 
     @classmethod
     def from_dict(cls, data):
-        return Product(
-            id=data.get('id', None),
-            price=float(data.get('price', 0)),
-            image=data.get('image', None),
-            brand=data.get('brand', None),
-            title=data.get('title', None),
+        get = data.get
+        return cls(
+            get('id', None),
+            float(get('price', 0)),
+            get('image', None),
+            get('brand', None),
+            get('title', None),
         )
+
+    @classmethod
+    def from_tuple(cls, data):
+        return cls._make(data)
+
+    @staticmethod
+    def as_dict_many(products: Iterable['Product']) -> List[dict]:
+        fields = Product._fields
+        return [dict(zip(fields, product)) for product in products]
+
+    @classmethod
+    def from_dict_many(cls, data: Iterable[dict]) -> List['Product']:
+        return [cls.from_dict(item) for item in data]
@@ -0,0 +1,50 @@
+import threading
+from typing import List, Optional
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from simple_settings import settings
+
+from project.backends.products.backend import ProductAbstractBackend
+
+_backend: Optional[ProductAbstractBackend] = None
+_backend_lock = threading.Lock()
+
+
+def build_product_backend(paths: List[str]) -> ProductAbstractBackend:
+    """
+    Builds the chain of backends from their import paths. Each backend is
+    the fallback of the one before it, so the first one is asked first and
+    only the last one does not need to accept a `fallback` argument.
+    """
+    if not paths:
+        raise ImproperlyConfigured('PRODUCT_BACKENDS must not be empty')
+
+    backend = import_string(paths[-1])()
+    for path in reversed(paths[:-1]):
+        backend = import_string(path)(fallback=backend)
+
+    return backend
+
+
+def get_product_backend() -> ProductAbstractBackend:
+    """
+    Returns the product backend configured in PRODUCT_BACKENDS, built once
+    per worker.
+    """
+    global _backend
+
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = build_product_backend(settings.PRODUCT_BACKENDS)
+
+    return _backend
+
+
+def reset_product_backend() -> None:
+    global _backend
+
+    with _backend_lock:
+        _backend = None
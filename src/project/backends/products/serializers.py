@@ -59,8 +59,8 @@ class ProductSerializer(serializers.Serializer):
         return Product.from_dict(validated_data)
 
     def update(self, instance, validated_data):
-        instance.price = validated_data.get('price', instance.price)
-        instance.brand = validated_data.get('brand', instance.brand)
-        instance.image = validated_data.get('image', instance.image)
-        instance.title = validated_data.get('title', instance.title)
-        return instance
+        return instance._replace(**{
+            field: validated_data[field]
+            for field in ('price', 'brand', 'image', 'title')
+            if field in validated_data
+        })
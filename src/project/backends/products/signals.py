@@ -0,0 +1,10 @@
+from django.dispatch import Signal
+
+# Sent with `product_ids` after the products are invalidated on the backend,
+# so the data derived from them can be dropped as well
+products_invalidated = Signal()
+
+# Sent with `products`, the data of the products found indexed by id, and
+# `fetched_at` after the products are fetched from their source, so the
+# copies derived from them are stamped with the time of that data
+products_fetched = Signal()
@@ -1,3 +1,14 @@
+import asyncio
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from simple_settings import settings
+
+from project.backends.products.exceptions import (
+    ProductNotFoundException,
+    ProductTimeoutException
+)
 from project.backends.products.interfaces import Product
 from project.extensions.fake.challenge.products.backend import (
     ProductFakeBackend
@@ -14,3 +25,144 @@ class TestBackend:
             product_id='1bf0f365-fbdd-4e21-9786-da459d78dd1f'
         )
         assert isinstance(response, Product)
+
+    def test_should_return_products_indexed_by_id_when_get_products_is_called(  # noqa
+        self
+    ):
+        backend = ProductFakeBackend()
+        response = backend.get_products(
+            product_ids=['1bf0f365-fbdd-4e21-9786-da459d78dd1f']
+        )
+        assert list(response.keys()) == [
+            '1bf0f365-fbdd-4e21-9786-da459d78dd1f'
+        ]
+        assert isinstance(
+            response['1bf0f365-fbdd-4e21-9786-da459d78dd1f'],
+            Product
+        )
+
+    def test_should_validate_whether_aget_product_will_return_a_dataclass_when_called(  # noqa
+        self
+    ):
+        backend = ProductFakeBackend()
+        response = asyncio.run(
+            backend.aget_product(
+                product_id='1bf0f365-fbdd-4e21-9786-da459d78dd1f'
+            )
+        )
+        assert isinstance(response, Product)
+
+    def test_should_do_nothing_when_invalidating_products_of_the_fake_backend(  # noqa
+        self
+    ):
+        backend = ProductFakeBackend()
+
+        assert backend.invalidate_products(
+            ['1bf0f365-fbdd-4e21-9786-da459d78dd1f']
+        ) is None
+
+
+class TestFakeBackendCatalog:
+
+    @pytest.fixture
+    def fake_settings(self):
+        fake_settings = settings.EXTENSIONS_CONFIG['fake']
+        with patch.dict(fake_settings), patch.dict(fake_settings['latency']):
+            yield fake_settings
+
+    @pytest.fixture
+    def mock_sleep(self):
+        with patch(
+            'project.extensions.fake.challenge.products.backend.time.sleep'
+        ) as mock:
+            yield mock
+
+    @pytest.fixture
+    def product_ids(self):
+        return [str(uuid4()) for _ in range(200)]
+
+    def test_should_derive_the_same_product_from_the_same_id(
+        self,
+        fake_settings,
+    ):
+        product_id = '1bf0f365-fbdd-4e21-9786-da459d78dd1f'
+
+        product = ProductFakeBackend().get_product(product_id)
+
+        pytest.assume(product == ProductFakeBackend().get_product(product_id))
+        pytest.assume(product.id == product_id)
+        pytest.assume(product.price >= 10)
+        pytest.assume(product_id in product.image)
+
+    def test_should_not_find_the_configured_share_of_ids(
+        self,
+        fake_settings,
+        product_ids,
+    ):
+        fake_settings['not_found_rate'] = 0.5
+        backend = ProductFakeBackend()
+
+        products = backend.get_products(product_ids)
+
+        pytest.assume(50 < len(products) < 150)
+        pytest.assume(backend.get_products(product_ids) == products)
+        missing_id = next(
+            product_id
+            for product_id in product_ids
+            if product_id not in products
+        )
+        with pytest.raises(ProductNotFoundException):
+            backend.get_product(missing_id)
+
+    @pytest.mark.parametrize('error_rate,raises', [(1, True), (0, False)])
+    def test_should_inject_errors_at_the_configured_rate(
+        self,
+        fake_settings,
+        error_rate,
+        raises,
+    ):
+        fake_settings['error_rate'] = error_rate
+        backend = ProductFakeBackend()
+
+        if raises:
+            with pytest.raises(ProductTimeoutException):
+                backend.get_product(str(uuid4()))
+        else:
+            assert isinstance(backend.get_product(str(uuid4())), Product)
+
+    @pytest.mark.parametrize('distribution', [
+        'constant',
+        'uniform',
+        'lognormal',
+    ])
+    def test_should_sleep_the_latency_of_the_configured_distribution(
+        self,
+        fake_settings,
+        mock_sleep,
+        distribution,
+    ):
+        fake_settings['latency'].update(distribution=distribution, mean=0.05)
+        fake_settings['seed'] = 'seed'
+        backend = ProductFakeBackend()
+
+        for _ in range(200):
+            backend.get_product(str(uuid4()))
+
+        latencies = [call.args[0] for call in mock_sleep.call_args_list]
+        pytest.assume(all(latency >= 0 for latency in latencies))
+        pytest.assume(
+            sum(latencies) / len(latencies) == pytest.approx(0.05, rel=0.2)
+        )
+
+    def test_should_sleep_the_slowest_latency_of_the_batch(
+        self,
+        fake_settings,
+        mock_sleep,
+        product_ids,
+    ):
+        fake_settings['latency'].update(distribution='uniform', mean=0.05)
+
+        ProductFakeBackend().get_products(product_ids)
+
+        mock_sleep.assert_called_once()
+        assert 0.05 < mock_sleep.call_args.args[0] <= 0.1
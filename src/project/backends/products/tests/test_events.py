@@ -0,0 +1,12 @@
+from project.backends.products.events import get_product_event_consumer
+from project.extensions.challenge.products.events import (
+    RedisListProductEventConsumer
+)
+
+
+class TestGetProductEventConsumer:
+
+    def test_should_build_the_consumer_configured_in_the_settings(self):
+        consumer = get_product_event_consumer()
+
+        assert isinstance(consumer, RedisListProductEventConsumer)
@@ -1,3 +1,7 @@
+import pickle
+
+import pytest
+
 from project.backends.products.interfaces import Product
 
 
@@ -27,3 +31,40 @@ class TestProductInterface:
         }
         data = Product.from_dict(payload)
         assert isinstance(data, Product)
+
+    @pytest.fixture
+    def product(self):
+        return Product(
+            id='6a512e6c-6627-d286-5d18-583558359ab6',
+            price=1149.0,
+            image='https://challenge-api.luizalabs.com/images/6a512e66.jpg',
+            brand='bébé confort',
+            title='Moisés Dorel Windoo 1529'
+        )
+
+    def test_should_not_allow_changing_the_fields_of_the_product(
+        self,
+        product,
+    ):
+        with pytest.raises(AttributeError):
+            product.price = 10.0
+
+        assert not hasattr(product, '__dict__')
+
+    def test_should_convert_the_product_to_and_from_a_dict(self, product):
+        assert Product.from_dict(product.as_dict()) == product
+
+    def test_should_convert_the_product_to_and_from_a_tuple(self, product):
+        data = product.as_tuple()
+
+        pytest.assume(type(data) is tuple)
+        pytest.assume(Product.from_tuple(data) == product)
+
+    def test_should_convert_many_products_at_once(self, product):
+        data = Product.as_dict_many([product, product])
+
+        pytest.assume(data == [product.as_dict(), product.as_dict()])
+        pytest.assume(Product.from_dict_many(data) == [product, product])
+
+    def test_should_keep_the_product_when_pickled(self, product):
+        assert pickle.loads(pickle.dumps(product)) == product
@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+
+import pytest
+
+from project.backends.products.registry import (
+    build_product_backend,
+    get_product_backend,
+    reset_product_backend
+)
+from project.extensions.challenge.products.backend import ProductBackend
+from project.extensions.fake.challenge.products.backend import (
+    ProductFakeBackend
+)
+from project.products.backend import ProductLocalBackend
+
+
+class TestBuildProductBackend:
+
+    def test_should_chain_the_backends_in_the_order_of_the_settings(self):
+        backend = build_product_backend([
+            'project.products.backend.ProductLocalBackend',
+            'project.extensions.fake.challenge.products.backend.'
+            'ProductFakeBackend',
+        ])
+
+        pytest.assume(isinstance(backend, ProductLocalBackend))
+        pytest.assume(isinstance(backend.fallback, ProductFakeBackend))
+
+    def test_should_raise_an_error_when_there_are_no_backends(self):
+        with pytest.raises(ImproperlyConfigured):
+            build_product_backend([])
+
+
+class TestGetProductBackend:
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        reset_product_backend()
+        yield
+        reset_product_backend()
+
+    def test_should_return_the_backend_of_the_settings(self):
+        assert isinstance(get_product_backend(), ProductBackend)
+
+    def test_should_build_the_backend_only_once(self):
+        with patch(
+            'project.backends.products.registry.build_product_backend'
+        ) as mock_build:
+            backend = get_product_backend()
+
+            assert get_product_backend() is backend
+            mock_build.assert_called_once()
+
+    def test_should_build_the_backend_again_after_it_is_reset(self):
+        backend = get_product_backend()
+
+        reset_product_backend()
+
+        assert get_product_backend() is not backend
@@ -0,0 +1,30 @@
+import pytest
+
+from project.backends.products.interfaces import Product
+from project.backends.products.serializers import ProductSerializer
+
+
+class TestProductSerializer:
+
+    @pytest.fixture
+    def product(self):
+        return Product(
+            id='6a512e6c-6627-d286-5d18-583558359ab6',
+            price=1149.0,
+            image='https://challenge-api.luizalabs.com/images/6a512e66.jpg',
+            brand='bébé confort',
+            title='Moisés Dorel Windoo 1529'
+        )
+
+    def test_should_return_a_new_product_when_it_is_updated(self, product):
+        serializer = ProductSerializer(
+            product,
+            data={'price': 10.5},
+            partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+
+        updated = serializer.save()
+
+        pytest.assume(updated == product._replace(price=10.5))
+        pytest.assume(product.price == 1149.0)
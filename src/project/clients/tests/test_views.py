@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 import pytest
+from django_redis.serializers.json import JSONSerializer
 from django_toolkit.concurrent.locks import LockActiveError
 from model_bakery import baker
 
@@ -436,9 +437,201 @@ class TestClientFavoritesDetailView:
         data = response.json()
 
         assert response.status_code == 200
-        assert data == favorite_list
+        assert data['results'] == favorite_list
         mock_get_details_product.assert_called_once()
 
+    def test_should_serve_the_cached_response_until_favorites_change(
+        self,
+        settings,
+        client_authenticated,
+        client_model,
+        favorite_model,
+        mock_get_details_product,
+    ):
+        settings.CACHES = {
+            alias: {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': alias,
+            }
+            for alias in ('default', 'concurrent')
+        }
+        path = f'/v1/clients/{str(client_model.id)}/favorites/'
+
+        first = client_authenticated.get(path=path, format='json')
+        second = client_authenticated.get(path=path, format='json')
+        pytest.assume(mock_get_details_product.call_count == 1)
+        pytest.assume(first.json() == second.json())
+
+        client_authenticated.delete(
+            path=f'/v1/favorites/{str(favorite_model.id)}/',
+            format='json'
+        )
+        client_authenticated.get(path=path, format='json')
+        pytest.assume(mock_get_details_product.call_count == 2)
+
+    def test_should_expire_the_cached_response_of_an_uppercase_client_id(
+        self,
+        settings,
+        client_authenticated,
+        client_model,
+        favorite_model,
+        mock_get_details_product,
+    ):
+        settings.CACHES = {
+            alias: {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': alias,
+            }
+            for alias in ('default', 'concurrent')
+        }
+        path = f'/v1/clients/{str(client_model.id).upper()}/favorites/'
+
+        client_authenticated.get(path=path, format='json')
+        client_authenticated.get(path=path, format='json')
+        pytest.assume(mock_get_details_product.call_count == 1)
+
+        client_authenticated.delete(
+            path=f'/v1/favorites/{str(favorite_model.id)}/',
+            format='json'
+        )
+        client_authenticated.get(path=path, format='json')
+        pytest.assume(mock_get_details_product.call_count == 2)
+
+    @pytest.mark.parametrize('client_id', [
+        'a' * 36,
+        '-' * 36,
+        '6a512e6c6627-d286-5d18-583558359ab6-',
+    ])
+    def test_should_return_not_found_when_client_id_is_not_an_uuid(
+        self,
+        client_authenticated,
+        client_id,
+        mock_get_details_product,
+    ):
+        response = client_authenticated.get(
+            path=f'/v1/clients/{client_id}/favorites/',
+            format='json'
+        )
+
+        pytest.assume(response.status_code == 404)
+        pytest.assume(mock_get_details_product.call_count == 0)
+
+    def test_should_render_the_cached_response_as_the_one_built(
+        self,
+        settings,
+        client_authenticated,
+        client_model,
+    ):
+        settings.CACHES = {
+            alias: {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': alias,
+            }
+            for alias in ('default', 'concurrent')
+        }
+        baker.make(
+            'Favorite',
+            client=client_model,
+            product_snapshot={
+                'id': '6a512e6c-6627-d286-5d18-583558359ab6',
+                'price': 1149.0,
+                'image': 'http://challenge-api.luizalabs.com/images/6.jpg',
+                'brand': 'bébé confort',
+                'title': 'Moisés Dorel Windoo 1529'
+            },
+            _fill_optional=['snapshot_at'],
+        )
+        path = f'/v1/clients/{str(client_model.id)}/favorites/'
+
+        class JSONCache(dict):
+            # Stores the values as the default cache does in Redis
+            serializer = JSONSerializer(options={})
+
+            def get(self, key, default=None):
+                value = super().get(key)
+                if value is None:
+                    return default
+                return self.serializer.loads(value)
+
+            def set(self, key, value, timeout=None):
+                self[key] = self.serializer.dumps(value)
+
+        with patch('project.clients.views.cache', JSONCache()) as mock_cache:
+            miss = client_authenticated.get(path=path, format='json')
+            hit = client_authenticated.get(path=path, format='json')
+
+        pytest.assume(len(mock_cache) == 1)
+        pytest.assume(miss.content == hit.content)
+
+    def test_should_only_list_the_favorites_of_the_client(
+        self,
+        client_authenticated,
+        client_model,
+        favorite_model,
+        mock_get_details_product,
+    ):
+        baker.make('Favorite', _quantity=2)
+
+        client_authenticated.get(
+            path=f'/v1/clients/{str(client_model.id)}/favorites/',
+            format='json'
+        )
+
+        favorites = mock_get_details_product.call_args.kwargs['favorites']
+        assert [favorite['id'] for favorite in favorites] == [
+            favorite_model.id
+        ]
+
+    def test_should_paginate_the_favorites_with_a_cursor(
+        self,
+        client_authenticated,
+        client_model,
+    ):
+        baker.make('Favorite', client=client_model, _quantity=3)
+        with patch(
+            'project.clients.views.get_details_products_favorites',
+            side_effect=lambda favorites: favorites
+        ):
+            first = client_authenticated.get(
+                path=f'/v1/clients/{str(client_model.id)}/favorites/',
+                data={'page_size': 2},
+            ).json()
+            second = client_authenticated.get(first['next']).json()
+
+        ids = [
+            favorite['id']
+            for favorite in first['results'] + second['results']
+        ]
+        pytest.assume(len(first['results']) == 2)
+        pytest.assume(second['next'] is None)
+        pytest.assume(sorted(ids) == sorted(
+            str(favorite_id)
+            for favorite_id in client_model.favorite_client.values_list(
+                'id',
+                flat=True
+            )
+        ))
+
+    def test_should_limit_the_page_size_to_the_maximum(
+        self,
+        client_authenticated,
+        client_model,
+        mock_get_details_product,
+    ):
+        baker.make('Favorite', client=client_model, _quantity=3)
+
+        with patch(
+            'project.clients.views.FavoriteCursorPagination.max_page_size',
+            2
+        ):
+            client_authenticated.get(
+                path=f'/v1/clients/{str(client_model.id)}/favorites/',
+                data={'page_size': 50},
+            )
+
+        favorites = mock_get_details_product.call_args.kwargs['favorites']
+        assert len(favorites) == 2
+
     def test_should_validate_return_when_an_error_occurs_for_fetching_product_data(  # noqa
         self,
         client_authenticated,
@@ -1,14 +1,19 @@
+import uuid
+
+from django.core.cache import cache
 from django.db.models.deletion import ProtectedError
 from django.http import Http404
 
 import structlog
 from django_toolkit.concurrent.locks import CacheLock, LockActiveError
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
+from simple_settings import settings
 
 from project.backends.products.exceptions import ProductException
 from project.clients.exceptions import (
@@ -25,27 +30,78 @@ from project.clients.serializers import (
     ClientUpdateSerializer
 )
 from project.core.exceptions import Conflict
-from project.favorites.helpers import get_details_products_favorites
+from project.favorites.helpers import (
+    get_details_products_favorites,
+    get_favorites_response_cache_key
+)
 from project.favorites.models import Favorite
-from project.favorites.serializers import FavoriteDetailSerializer
+from project.favorites.pagination import FavoriteCursorPagination
+from project.favorites.serializers import (
+    FavoriteDetailPageSerializer,
+    FavoriteDetailSerializer
+)
 
 logger = structlog.get_logger(__name__)
 
 
 class ClientFavoriteDetailView(GenericViewSet):
     lookup_field = 'client_id'
+    lookup_value_regex = (
+        '[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+        '[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    )
     queryset = Favorite.objects
     serializer_class = FavoriteDetailSerializer
+    pagination_class = FavoriteCursorPagination
+    filter_backends = []
+
+    def get_queryset(self):
+        return super().get_queryset().filter(
+            client_id=self.kwargs[self.lookup_field]
+        )
 
     @swagger_auto_schema(
         operation_summary='List the client favorite products',
+        manual_parameters=[
+            openapi.Parameter(
+                FavoriteCursorPagination.cursor_query_param,
+                openapi.IN_QUERY,
+                description='Cursor of the page, taken from next or previous',
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                FavoriteCursorPagination.page_size_query_param,
+                openapi.IN_QUERY,
+                description='Number of favorites per page',
+                type=openapi.TYPE_INTEGER
+            ),
+        ],
         responses={
-            200: FavoriteDetailSerializer(many=True),
-            404: 'Favorites not found for client',
+            200: FavoriteDetailPageSerializer(),
+            429: 'Another request of the client is being processed',
+            500: 'Product error',
         },
     )
     @action(methods=['GET'], detail=True, url_path='favorites')
     def retrieve_favorites(self, request, client_id=None):
+        # The versions are bumped with the canonical form of the id, so an
+        # uppercase id in the path must read the same cache keys
+        client_id = str(uuid.UUID(client_id))
+        cache_timeout = settings.FAVORITES['cache']['timeout']
+        if cache_timeout:
+            cache_key = get_favorites_response_cache_key(
+                client_id,
+                cursor=request.query_params.get(
+                    self.paginator.cursor_query_param
+                ),
+                page_size=request.query_params.get(
+                    self.paginator.page_size_query_param
+                )
+            )
+            data = cache.get(cache_key)
+            if data is not None:
+                return Response(data=data, status=status.HTTP_200_OK)
+
         try:
             with CacheLock(
                 key=f'cachelock:retrieve_favorites_{client_id}',
@@ -57,16 +113,25 @@ class ClientFavoriteDetailView(GenericViewSet):
                     client_id=client_id
                 )
 
-                queryset = self.get_queryset()
-                serializer = self.get_serializer(queryset, many=True)
-                favorites = get_details_products_favorites(
-                    favorites=serializer.data
+                page = self.paginate_queryset(
+                    self.get_queryset().values(
+                        'id',
+                        'client_id',
+                        'product_id',
+                        'created_at',
+                        'product_snapshot',
+                        'snapshot_at',
+                    )
                 )
+                favorites = get_details_products_favorites(favorites=page)
+                serializer = self.get_serializer(favorites, many=True)
 
-                return Response(
-                    data=favorites,
-                    status=status.HTTP_200_OK
-                )
+                # The serialized data holds only JSON types, so a cached
+                # response is rendered exactly as the one built here
+                response = self.get_paginated_response(data=serializer.data)
+                if cache_timeout:
+                    cache.set(cache_key, response.data, cache_timeout)
+                return response
         except ProductException:
             raise ClientProductFavoritesException
         except LockActiveError:
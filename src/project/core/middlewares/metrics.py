@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+from prometheus_client import Histogram
+
+request_duration = Histogram(
+    'http_request_duration_seconds',
+    'Duration of the requests by route, method and status',
+    ['route', 'method', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+response_size = Histogram(
+    'http_response_size_bytes',
+    'Size of the responses by route and method',
+    ['route', 'method'],
+    buckets=(100, 1000, 10000, 100000, 1000000),
+)
+
+UNMATCHED_ROUTE = 'unmatched'
+
+
+class MetricsMiddleware:
+    """
+    Records the duration, status and size of the responses labelled by the
+    name of the resolved route, such as `v1:clients-detail`, instead of the
+    raw path. It runs natively on both WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(self.get_response):
+            # Marks the instance as a coroutine function for Django
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+
+        started_at = time.perf_counter()
+        response = self.get_response(request)
+        self._observe(request, response, time.perf_counter() - started_at)
+        return response
+
+    async def __acall__(self, request):
+        started_at = time.perf_counter()
+        response = await self.get_response(request)
+        self._observe(request, response, time.perf_counter() - started_at)
+        return response
+
+    @staticmethod
+    def _get_route(request) -> str:
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None or not resolver_match.view_name:
+            return UNMATCHED_ROUTE
+        return resolver_match.view_name
+
+    @staticmethod
+    def _get_size(response) -> int:
+        if response.has_header('Content-Length'):
+            return int(response['Content-Length'])
+        if response.streaming:
+            return 0
+        return len(response.content)
+
+    def _observe(self, request, response, duration: float) -> None:
+        route = self._get_route(request)
+        request_duration.labels(
+            route=route,
+            method=request.method,
+            status=response.status_code
+        ).observe(duration)
+        response_size.labels(
+            route=route,
+            method=request.method
+        ).observe(self._get_size(response))
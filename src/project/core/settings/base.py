@@ -122,6 +122,7 @@ LOCAL_APPS = [
     'project.ping.apps.PingConfig',
     'project.clients.apps.ClientsConfig',
     'project.favorites.apps.FavoritesConfig',
+    'project.products.apps.ProductsConfig',
 ]
 
 INSTALLED_APPS = DEFAULT_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -149,7 +150,13 @@ LOCAL_MIDDLEWARE = [
     'project.core.middlewares.version_header.VersionHeaderMiddleware',
 ]
 
-MIDDLEWARE = DEFAULT_MIDDLEWARE + THIRD_PARTY_MIDDLEWARE + LOCAL_MIDDLEWARE
+# The metrics middleware comes first so the duration includes the others
+MIDDLEWARE = (
+    ['project.core.middlewares.metrics.MetricsMiddleware'] +
+    DEFAULT_MIDDLEWARE +
+    THIRD_PARTY_MIDDLEWARE +
+    LOCAL_MIDDLEWARE
+)
 
 # Database django connection settings (https://docs.djangoproject.com/en/3.2/ref/databases) # noqa
 DATABASES = {
@@ -394,19 +401,151 @@ structlog.configure(
 )
 
 # Custom environment variables to use in the application
+# Chain of product backends, each one falls back to the next
+PRODUCT_BACKENDS = [
+    path.strip()
+    for path in os.getenv(
+        'PRODUCT_BACKENDS',
+        'project.extensions.challenge.products.backend.ProductBackend'
+    ).split(';')
+    if path.strip()
+]
+
+FAVORITES = {
+    'snapshot': {
+        # Snapshots older than max_age seconds are fetched again, 0 disables
+        # the threshold and the snapshot is always served
+        'max_age': int(os.getenv('FAVORITES_SNAPSHOT_MAX_AGE', '3600')),
+    },
+    'pagination': {
+        'page_size': int(os.getenv('FAVORITES_PAGE_SIZE', '20')),
+        'max_page_size': int(os.getenv('FAVORITES_MAX_PAGE_SIZE', '100')),
+    },
+    'bulk': {
+        'max_size': int(os.getenv('FAVORITES_BULK_MAX_SIZE', '100')),
+    },
+    'cache': {
+        # Timeout of the cached listings of a client, 0 disables the cache
+        'timeout': int(os.getenv('FAVORITES_CACHE_TIMEOUT', '300')),
+    },
+}
+
 EXTENSIONS_CONFIG = {
     'challenge': {
         'timeout': float(os.getenv('CHALLENGE_API_TIMEOUT', '2')),
+        'concurrency': int(os.getenv('CHALLENGE_API_CONCURRENCY', '8')),
+        'session': {
+            'pool_size': int(os.getenv('CHALLENGE_API_POOL_SIZE', '10')),
+            'keep_alive': bool(
+                strtobool(os.getenv('CHALLENGE_API_KEEP_ALIVE', 'True'))
+            ),
+            'retries': int(os.getenv('CHALLENGE_API_RETRIES', '2')),
+            'backoff_factor': float(
+                os.getenv('CHALLENGE_API_RETRY_BACKOFF_FACTOR', '0.1')
+            ),
+        },
         'host': os.getenv('CHALLENGE_API_HOST', 'https://localhost'),
+        'circuit_breaker': {
+            'enabled': bool(
+                strtobool(
+                    os.getenv('CHALLENGE_API_CIRCUIT_BREAKER_ENABLED', 'True')
+                )
+            ),
+            'failure_rate': float(
+                os.getenv('CHALLENGE_API_CIRCUIT_BREAKER_FAILURE_RATE', '0.5')
+            ),
+            'minimum_calls': int(
+                os.getenv('CHALLENGE_API_CIRCUIT_BREAKER_MINIMUM_CALLS', '20')
+            ),
+            'window': int(
+                os.getenv('CHALLENGE_API_CIRCUIT_BREAKER_WINDOW', '10')
+            ),
+            'recovery_timeout': int(
+                os.getenv('CHALLENGE_API_CIRCUIT_BREAKER_RECOVERY', '30')
+            ),
+        },
+        'lease': {
+            'timeout': int(os.getenv('CHALLENGE_API_LEASE_TIMEOUT', '5')),
+            'wait': float(os.getenv('CHALLENGE_API_LEASE_WAIT', '1')),
+            'interval': float(
+                os.getenv('CHALLENGE_API_LEASE_WAIT_INTERVAL', '0.05')
+            ),
+        },
+        'invalidation': {
+            'refresh': bool(
+                strtobool(
+                    os.getenv('CHALLENGE_API_INVALIDATION_REFRESH', 'False')
+                )
+            ),
+            'local_sync_interval': float(
+                os.getenv('CHALLENGE_API_INVALIDATION_LOCAL_SYNC', '1')
+            ),
+            'consumer': os.getenv(
+                'CHALLENGE_API_INVALIDATION_CONSUMER',
+                'project.extensions.challenge.products.events.'
+                'RedisListProductEventConsumer'
+            ),
+            'queue': os.getenv(
+                'CHALLENGE_API_INVALIDATION_QUEUE', 'product-events'
+            ),
+        },
+        'warm_up': {
+            'on_startup': bool(
+                strtobool(
+                    os.getenv('CHALLENGE_API_WARM_UP_ON_STARTUP', 'False')
+                )
+            ),
+            'batch_size': int(
+                os.getenv('CHALLENGE_API_WARM_UP_BATCH_SIZE', '100')
+            ),
+            'rate': float(os.getenv('CHALLENGE_API_WARM_UP_RATE', '0')),
+        },
         'caches': {
             'product': int(
                 os.getenv('CHALLENGE_API_CACHE_TTL_PRODUCT', '10800')
-            )
+            ),
+            'product_soft': int(
+                os.getenv('CHALLENGE_API_CACHE_SOFT_TTL_PRODUCT', '0')
+            ),
+            'product_jitter': float(
+                os.getenv('CHALLENGE_API_CACHE_JITTER_PRODUCT', '0')
+            ),
+            'product_early_beta': float(
+                os.getenv('CHALLENGE_API_CACHE_EARLY_BETA_PRODUCT', '0')
+            ),
+            'product_not_found': int(
+                os.getenv('CHALLENGE_API_CACHE_TTL_PRODUCT_NOT_FOUND', '300')
+            ),
+            'product_local': {
+                'size': int(
+                    os.getenv('CHALLENGE_API_CACHE_LOCAL_SIZE_PRODUCT', '1024')
+                ),
+                'timeout': int(
+                    os.getenv('CHALLENGE_API_CACHE_LOCAL_TTL_PRODUCT', '60')
+                ),
+            },
         },
         'routes': {
             'product': os.getenv(
                 'CHALLENGE_API_ROUTE_PRODUCT', '/api/product/{product_id}/'
             ),
+            'products': os.getenv(
+                'CHALLENGE_API_ROUTE_PRODUCTS', '/api/product/?page={page}'
+            ),
         },
-    }
+    },
+    'fake': {
+        'latency': {
+            'distribution': os.getenv(
+                'FAKE_PRODUCT_LATENCY_DISTRIBUTION', 'constant'
+            ),
+            'mean': float(os.getenv('FAKE_PRODUCT_LATENCY_MEAN', '0')),
+            'sigma': float(os.getenv('FAKE_PRODUCT_LATENCY_SIGMA', '0.5')),
+        },
+        'error_rate': float(os.getenv('FAKE_PRODUCT_ERROR_RATE', '0')),
+        'not_found_rate': float(
+            os.getenv('FAKE_PRODUCT_NOT_FOUND_RATE', '0')
+        ),
+        'seed': os.getenv('FAKE_PRODUCT_SEED') or None,
+    },
 }
@@ -0,0 +1,78 @@
+import asyncio
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+import pytest
+from prometheus_client import REGISTRY
+
+from project.core.middlewares.metrics import MetricsMiddleware
+
+
+class TestMetricsMiddleware:
+
+    @staticmethod
+    def get_sample_value(name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    @pytest.mark.django_db
+    def test_should_label_the_metrics_with_the_resolved_route(
+        self,
+        client_authenticated,
+    ):
+        labels = {'route': 'v1:client-list', 'method': 'GET', 'status': '200'}
+        before = self.get_sample_value(
+            'http_request_duration_seconds_count',
+            **labels
+        )
+
+        response = client_authenticated.get('/v1/clients/')
+
+        assert response.status_code == 200
+        assert self.get_sample_value(
+            'http_request_duration_seconds_count',
+            **labels
+        ) == before + 1
+
+    def test_should_label_requests_without_a_route_as_unmatched(self):
+        request = RequestFactory().get('/nowhere/')
+        middleware = MetricsMiddleware(
+            lambda request: HttpResponse('abc', status=404)
+        )
+        before = self.get_sample_value(
+            'http_response_size_bytes_sum',
+            route='unmatched',
+            method='GET'
+        )
+
+        middleware(request)
+
+        assert self.get_sample_value(
+            'http_response_size_bytes_sum',
+            route='unmatched',
+            method='GET'
+        ) == before + 3
+
+    def test_should_record_the_metrics_of_async_responses(self):
+        async def get_response(request):
+            return StreamingHttpResponse(iter([b'abc']))
+
+        request = RequestFactory().post('/nowhere/')
+        middleware = MetricsMiddleware(get_response)
+        before = self.get_sample_value(
+            'http_request_duration_seconds_count',
+            route='unmatched',
+            method='POST',
+            status='200'
+        )
+
+        response = asyncio.run(middleware(request))
+
+        assert isinstance(response, StreamingHttpResponse)
+        assert asyncio.iscoroutinefunction(middleware)
+        assert self.get_sample_value(
+            'http_request_duration_seconds_count',
+            route='unmatched',
+            method='POST',
+            status='200'
+        ) == before + 1
@@ -14,3 +14,10 @@ from manage import set_settings_module
 set_settings_module()
 
 application = get_wsgi_application()
+
+# Imported after the application so the apps are already loaded
+from project.favorites.helpers import (  # noqa: E402 isort:skip
+    warm_up_products_cache_on_startup
+)
+
+warm_up_products_cache_on_startup()
@@ -1,8 +1,20 @@
-from typing import Optional
+import asyncio
+import math
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import copy_context
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from django.core.cache import cache
+from django.core.cache import cache, caches
+from django.utils import timezone
 
 import structlog
+from asgiref.sync import sync_to_async
+from django_redis import get_redis_connection
 from rest_framework.exceptions import ValidationError
 from simple_settings import settings
 
@@ -16,16 +28,143 @@ from project.backends.products.exceptions import (
 )
 from project.backends.products.interfaces import Product
 from project.backends.products.serializers import ProductSerializer
+from project.backends.products.signals import products_fetched
 from project.extensions.challenge.products.exceptions import (
     ChallengeProductClientException,
     ChallengeProductException,
     ChallengeProductNotFoundException,
     ChallengeProductTimeoutException
 )
-from project.extensions.challenge.products.http_client import get_product
+from project.extensions.challenge.products.http_client import (
+    aget_product,
+    get_product
+)
+from project.extensions.challenge.products.metrics import (
+    backend_errors,
+    cache_requests,
+    local_cache_size
+)
+from project.helpers.caches import LocalCache
+from project.helpers.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerOpenException
+)
+from project.helpers.singleflight import AsyncSingleFlight, SingleFlight
 
 logger = structlog.get_logger(__name__)
 
+NOT_FOUND_CACHE = 'not-found'
+
+# Products are cached as [version, stale_at, expires_at, delta, id, price,
+# image, brand, title], where delta is how long the fetch took. Bump the
+# version whenever this layout changes: entries of other versions are
+# treated as misses and overwritten by the next fetch.
+CACHE_VERSION = 2
+CACHE_HEADER_SIZE = 4
+CACHE_FIELDS = ('id', 'price', 'image', 'brand', 'title')
+
+local_cache_settings = (
+    settings.EXTENSIONS_CONFIG['challenge']['caches']['product_local']
+)
+local_cache = LocalCache(
+    max_size=local_cache_settings['size'],
+    timeout=min(
+        local_cache_settings['timeout'],
+        settings.EXTENSIONS_CONFIG['challenge']['caches']['product']
+    ),
+)
+
+# Fetches of the external API shared by the requests of the worker. It is
+# kept apart from refresh_executor because the refreshes wait for fetches
+fetch_executor = ThreadPoolExecutor(
+    max_workers=settings.EXTENSIONS_CONFIG['challenge']['concurrency'],
+    thread_name_prefix='product-fetch',
+)
+refresh_executor = ThreadPoolExecutor(
+    max_workers=settings.EXTENSIONS_CONFIG['challenge']['concurrency'],
+    thread_name_prefix='product-refresh',
+)
+_refreshing: Set[str] = set()
+_refreshing_lock = threading.Lock()
+
+# Bumped on every invalidation so the workers drop their local caches
+LOCAL_CACHE_EPOCH_KEY = 'product-local-epoch'
+_local_cache_epoch: Dict[str, Any] = {
+    'epoch': None,
+    'checked_at': float('-inf'),
+}
+_local_cache_epoch_lock = threading.Lock()
+
+single_flight = SingleFlight()
+async_single_flight = AsyncSingleFlight()
+
+
+def _is_failure_api(exc: BaseException) -> bool:
+    """
+    Products not found and errors of the request itself are answers of a
+    healthy API, so they do not count as failures of the circuit breaker.
+    """
+    if isinstance(exc, ChallengeProductNotFoundException):
+        return False
+    if isinstance(exc, ChallengeProductClientException):
+        return exc.status_code is None or exc.status_code >= 500
+    return isinstance(exc, ChallengeProductException)
+
+
+circuit_breaker = CircuitBreaker(
+    name='challenge-products',
+    is_failure=_is_failure_api,
+    **settings.EXTENSIONS_CONFIG['challenge']['circuit_breaker']
+)
+
+
+def _sync_local_cache() -> None:
+    """
+    Clears the local cache when products were invalidated by any worker
+    since the last check. The shared epoch is read at most once per
+    `local_sync_interval` seconds.
+    """
+    interval = settings.EXTENSIONS_CONFIG['challenge']['invalidation'][
+        'local_sync_interval'
+    ]
+    now = time.monotonic()
+    if (
+        not local_cache.enabled or
+        now - _local_cache_epoch['checked_at'] < interval
+    ):
+        return
+
+    epoch = caches['concurrent'].get(LOCAL_CACHE_EPOCH_KEY)
+    with _local_cache_epoch_lock:
+        _local_cache_epoch['checked_at'] = now
+        if epoch == _local_cache_epoch['epoch']:
+            return
+        _local_cache_epoch['epoch'] = epoch
+
+    local_cache.clear()
+    local_cache_size.set(0)
+
+
+def _bump_local_cache_epoch() -> None:
+    epoch = uuid.uuid4().hex
+    caches['concurrent'].set(LOCAL_CACHE_EPOCH_KEY, epoch, timeout=None)
+    with _local_cache_epoch_lock:
+        _local_cache_epoch['epoch'] = epoch
+
+
+@contextmanager
+def _count_backend_errors() -> Iterator[None]:
+    try:
+        yield
+    except ProductException as exc:
+        backend_errors.labels(exception=type(exc).__name__).inc()
+        raise
+
+
+def _count_cache_requests(layer: str, hits: int, misses: int) -> None:
+    cache_requests.labels(layer=layer, result='hit').inc(hits)
+    cache_requests.labels(layer=layer, result='miss').inc(misses)
+
 
 class ProductBackend(ProductAbstractBackend):
     @staticmethod
@@ -36,50 +175,325 @@ class ProductBackend(ProductAbstractBackend):
     def _get_key_cache(product_id: str) -> str:
         return f'product-{product_id}'
 
-    def _set_data_cache(self, product_id: str, data: dict) -> None:
-        cache.set(
-            key=self._get_key_cache(product_id),
-            value=data,
-            timeout=settings.EXTENSIONS_CONFIG['challenge']['caches']['product']  # noqa
+    @staticmethod
+    def _get_timeout_cache(not_found: bool = False) -> int:
+        caches = settings.EXTENSIONS_CONFIG['challenge']['caches']
+        if not_found:
+            return caches['product_not_found']
+        return caches['product']
+
+    @staticmethod
+    def _jitter_timeout_cache(timeout: int) -> int:
+        """
+        Shortens the timeout by a random share of up to `product_jitter`, so
+        products cached together do not expire at the same moment.
+        """
+        jitter = settings.EXTENSIONS_CONFIG['challenge']['caches'][
+            'product_jitter'
+        ]
+        if not jitter:
+            return timeout
+
+        return max(1, int(timeout * random.uniform(1 - jitter, 1)))
+
+    @staticmethod
+    def _build_data_cache(data: dict, timeout: int, delta: float) -> list:
+        """
+        Encodes the product data, already validated, in the compact cache
+        format along with the moment it becomes stale, the moment it expires
+        and how long it took to fetch. Stale entries are still served, but a
+        refresh is triggered in background.
+        """
+        soft_timeout = settings.EXTENSIONS_CONFIG['challenge']['caches'][
+            'product_soft'
+        ]
+        now = time.time()
+        return [
+            CACHE_VERSION,
+            now + soft_timeout if soft_timeout else None,
+            now + timeout,
+            round(delta, 4),
+            *(data[field] for field in CACHE_FIELDS),
+        ]
+
+    def _set_data_cache_many(
+        self,
+        data: Dict[str, Optional[dict]],
+        delta: float = 0.0
+    ) -> None:
+        """
+        Stores the products just fetched in the caches, each one with its own
+        jittered timeout, and announces them with `products_fetched`. The
+        keys are written with a SET EX per product sent in one pipeline.
+        `delta` is how long the products took to be fetched.
+        """
+        fetched_at = timezone.now()
+        timeout_found = self._get_timeout_cache()
+        timeout_not_found = self._get_timeout_cache(not_found=True)
+
+        pipeline = get_redis_connection('default').pipeline(
+            transaction=False
         )
+        found = {}
+        not_found = []
+        for product_id, value in data.items():
+            if value is None:
+                timeout = self._jitter_timeout_cache(timeout_not_found)
+                value_cache = NOT_FOUND_CACHE
+                not_found.append(product_id)
+            else:
+                timeout = self._jitter_timeout_cache(timeout_found)
+                value_cache = self._build_data_cache(value, timeout, delta)
+                found[product_id] = Product.from_dict(value)
 
-    def _get_data_cache(self, product_id: str) -> Optional[Product]:
-        cache_key = self._get_key_cache(product_id)
-        cache_data = cache.get(cache_key)
-        if cache_data:
-            serializer = self._get_serializer(data=cache_data)
-            validated = serializer.is_valid(
+            cache.set(
+                self._get_key_cache(product_id),
+                value_cache,
+                timeout=timeout,
+                client=pipeline
+            )
+        pipeline.execute()
+
+        if found:
+            local_cache.set_many(found)
+        if not_found:
+            local_cache.set_many(
+                dict.fromkeys(not_found, NOT_FOUND_CACHE),
+                timeout=min(local_cache.timeout, timeout_not_found)
+            )
+        local_cache_size.set(local_cache.stats()['size'])
+
+        if found:
+            products_fetched.send(
+                sender=self.__class__,
+                products={
+                    product_id: data[product_id] for product_id in found
+                },
+                fetched_at=fetched_at
+            )
+
+    def _load_data_cache(
+        self,
+        cache_key: str,
+        cache_data: Any
+    ) -> Tuple[Any, bool]:
+        """
+        Decodes an entry of the cache, returning the product (or the not found
+        marker) and whether it is stale. The product is None when the entry
+        is not valid.
+        """
+        if cache_data == NOT_FOUND_CACHE:
+            return NOT_FOUND_CACHE, False
+
+        if isinstance(cache_data, list):
+            return self._load_data_cache_compact(cache_key, cache_data)
+
+        return self._load_data_cache_legacy(cache_key, cache_data)
+
+    def _load_data_cache_compact(
+        self,
+        cache_key: str,
+        cache_data: list
+    ) -> Tuple[Optional[Product], bool]:
+        """
+        Entries in the compact format were validated before being written,
+        so they are decoded straight into the product.
+        """
+        if (
+            len(cache_data) != CACHE_HEADER_SIZE + len(CACHE_FIELDS) or
+            cache_data[0] != CACHE_VERSION
+        ):
+            logger.info(
+                'Ignoring product cache with an unknown format',
+                key_cache=cache_key,
+            )
+            return None, False
+
+        _, stale_at, expires_at, delta, *fields = cache_data
+        now = time.time()
+        stale = (
+            stale_at is not None and stale_at <= now or
+            self._should_refresh_early(expires_at, delta, now)
+        )
+        return Product.from_tuple(fields), stale
+
+    @staticmethod
+    def _should_refresh_early(
+        expires_at: float,
+        delta: float,
+        now: float
+    ) -> bool:
+        """
+        Probabilistic early expiration (XFetch): the closer the entry is to
+        expire and the slower it was to fetch, the more likely a read
+        triggers its refresh in background. `product_early_beta` scales it,
+        0 disables it.
+        """
+        beta = settings.EXTENSIONS_CONFIG['challenge']['caches'][
+            'product_early_beta'
+        ]
+        if not beta or not delta:
+            return False
+
+        return now - delta * beta * math.log(1 - random.random()) >= expires_at
+
+    def _load_data_cache_legacy(
+        self,
+        cache_key: str,
+        cache_data: Any
+    ) -> Tuple[Optional[Product], bool]:
+        """
+        Entries written before the compact format, as plain dicts or wrapped
+        with the stale time, are validated by the serializer.
+        """
+        stale_at = None
+        if isinstance(cache_data, dict) and 'stale_at' in cache_data:
+            stale_at = cache_data['stale_at']
+            cache_data = cache_data.get('product')
+
+        serializer = self._get_serializer(data=cache_data)
+        try:
+            serializer.is_valid(
                 cache=cache,
                 key_cache=cache_key,
                 remove_cache=True
             )
-            if validated:
-                return serializer.from_interface()
+        except ValidationError:
+            return None, False
 
-        return None
+        stale = stale_at is not None and stale_at <= time.time()
+        return serializer.from_interface(), stale
 
-    def get_product(self, product_id: str) -> Product:
-        try:
-            logger.bind(product_id=product_id)
+    def _get_data_cache(self, product_id: str) -> Optional[Product]:
+        """
+        Returns the product stored in the caches or None when it is not
+        cached. Raises ProductNotFoundException when the product is cached as
+        not found.
+        """
+        product_id = str(product_id)
+        products = self._get_data_cache_many([product_id])
+        if product_id not in products:
+            return None
 
-            cache_data = self._get_data_cache(product_id)
-            if cache_data:
-                logger.info(
-                    'Product data returned by cache',
-                    product_data=cache_data,
-                )
-                return cache_data
+        product = products[product_id]
+        if product is None:
+            logger.info(
+                'Product not found returned by cache',
+                product_id=product_id,
+            )
+            raise ProductNotFoundException
+
+        return product
+
+    def _get_data_cache_many(
+        self,
+        product_ids: List[str]
+    ) -> Dict[str, Optional[Product]]:
+        """
+        Returns the products stored in the caches indexed by id. Products
+        cached as not found are returned as None. Stale products are returned
+        as well and refreshed in background.
+        """
+        _sync_local_cache()
+        products = local_cache.get_many(product_ids)
+        if local_cache.enabled:
+            _count_cache_requests(
+                'local',
+                hits=len(products),
+                misses=len(product_ids) - len(products)
+            )
+
+        cache_keys = {
+            self._get_key_cache(product_id): product_id
+            for product_id in product_ids
+            if product_id not in products
+        }
+        if cache_keys:
+            cache_data = cache.get_many(cache_keys.keys())
+
+            cache_products = {}
+            stale_ids = []
+            for cache_key, data in cache_data.items():
+                product, stale = self._load_data_cache(cache_key, data)
+                if product is None:
+                    continue
+
+                cache_products[cache_keys[cache_key]] = product
+                if stale:
+                    stale_ids.append(cache_keys[cache_key])
+
+            _count_cache_requests(
+                'redis',
+                hits=len(cache_products),
+                misses=len(cache_keys) - len(cache_products)
+            )
+            local_cache.set_many(cache_products)
+            products.update(cache_products)
+
+            if stale_ids:
+                self._refresh_data_cache(stale_ids)
 
-            data = get_product(product_id)
-            serializer = self._get_serializer(data)
-            serializer.is_valid(raise_exception=True)
+        return {
+            product_id: None if product == NOT_FOUND_CACHE else product
+            for product_id, product in products.items()
+        }
 
-            self._set_data_cache(
-                data=serializer.data,
-                product_id=product_id
+    def _refresh_data_cache(self, product_ids: List[str]) -> None:
+        """
+        Schedules the refresh of stale products, at most one refresh per
+        product is running at a time in the worker.
+        """
+        with _refreshing_lock:
+            product_ids = [
+                product_id
+                for product_id in product_ids
+                if product_id not in _refreshing
+            ]
+            _refreshing.update(product_ids)
+
+        if not product_ids:
+            return
+
+        logger.info(
+            'Refreshing stale products in background',
+            product_ids=product_ids,
+        )
+        refresh_executor.submit(
+            copy_context().run,
+            self._refresh_products,
+            product_ids
+        )
+
+    def _refresh_products(self, product_ids: List[str]) -> None:
+        try:
+            self._fetch_products(product_ids)
+        except ProductException as exc:
+            logger.warning(
+                'Failed to refresh stale products, keeping the stale data',
+                product_ids=product_ids,
+                error_message=str(exc)
             )
+        finally:
+            with _refreshing_lock:
+                _refreshing.difference_update(product_ids)
+
+    def _validate_data_api(self, data: dict) -> dict:
+        serializer = self._get_serializer(data)
+        serializer.is_valid(raise_exception=True)
+        return serializer.data
 
-            return serializer.from_interface()
+    @staticmethod
+    @contextmanager
+    def _handle_api_exceptions() -> Iterator[None]:
+        try:
+            yield
+
+        except CircuitBreakerOpenException as exc:
+            logger.warning(
+                'Product API circuit breaker is open, failing fast',
+                error_message=str(exc)
+            )
+            raise ProductTimeoutException from exc
 
         except ValidationError as exc:
             logger.error(
@@ -118,3 +532,394 @@ class ProductBackend(ProductAbstractBackend):
                 exc_info=True
             )
             raise ProductException from exc
+
+    def _get_product_api(self, product_id: str) -> dict:
+        with _count_backend_errors(), self._handle_api_exceptions():
+            with circuit_breaker.protect():
+                data = get_product(product_id)
+            return self._validate_data_api(data)
+
+    async def _aget_product_api(self, product_id: str) -> dict:
+        with _count_backend_errors(), self._handle_api_exceptions():
+            async with circuit_breaker.aprotect():
+                data = await aget_product(product_id)
+            return self._validate_data_api(data)
+
+    def _get_product_api_or_none(self, product_id: str) -> Optional[dict]:
+        try:
+            return single_flight.do(
+                product_id,
+                self._get_product_api,
+                product_id
+            )
+        except ProductNotFoundException:
+            return None
+
+    def _get_products_api(
+        self,
+        product_ids: List[str]
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Fetches the products from the external API on the bounded thread
+        pool of the worker, so the latency follows the slowest product
+        instead of the sum of all of them. Each task runs on a copy of the
+        caller context to keep the correlation id in the logs. Products not
+        found are returned as None.
+        """
+        if len(product_ids) <= 1:
+            results = [
+                self._get_product_api_or_none(product_id)
+                for product_id in product_ids
+            ]
+        else:
+            futures = [
+                fetch_executor.submit(
+                    copy_context().run,
+                    self._get_product_api_or_none,
+                    product_id
+                )
+                for product_id in product_ids
+            ]
+            results = [future.result() for future in futures]
+
+        return dict(zip(product_ids, results))
+
+    async def _aget_product_api_or_none(
+        self,
+        product_id: str
+    ) -> Optional[dict]:
+        try:
+            return await async_single_flight.do(
+                product_id,
+                self._aget_product_api,
+                product_id
+            )
+        except ProductNotFoundException:
+            return None
+
+    async def _aget_products_api(
+        self,
+        product_ids: List[str]
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Async counterpart of `_get_products_api`, the products are fetched on
+        the running event loop limited by the same concurrency setting.
+        """
+        semaphore = asyncio.Semaphore(
+            settings.EXTENSIONS_CONFIG['challenge']['concurrency']
+        )
+
+        async def fetch(product_id: str) -> Optional[dict]:
+            async with semaphore:
+                return await self._aget_product_api_or_none(product_id)
+
+        results = await asyncio.gather(*map(fetch, product_ids))
+        return dict(zip(product_ids, results))
+
+    @staticmethod
+    def _get_key_lease(product_id: str) -> str:
+        return f'product-lease-{product_id}'
+
+    def _acquire_leases(
+        self,
+        product_ids: List[str]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Tries to take the fetch lease of each product in the concurrent
+        cache with a SET NX EX per product sent in one pipeline. Returns the
+        ids leased to this worker and the ids already being fetched by
+        another one.
+        """
+        if not product_ids:
+            return [], []
+
+        lease_cache = caches['concurrent']
+        timeout = settings.EXTENSIONS_CONFIG['challenge']['lease']['timeout']
+
+        pipeline = get_redis_connection('concurrent').pipeline(
+            transaction=False
+        )
+        for product_id in product_ids:
+            pipeline.set(
+                lease_cache.make_key(self._get_key_lease(product_id)),
+                1,
+                nx=True,
+                ex=timeout
+            )
+
+        leased_ids, busy_ids = [], []
+        for product_id, leased in zip(product_ids, pipeline.execute()):
+            (leased_ids if leased else busy_ids).append(product_id)
+
+        return leased_ids, busy_ids
+
+    def _release_leases(self, product_ids: List[str]) -> None:
+        if product_ids:
+            caches['concurrent'].delete_many(
+                [self._get_key_lease(product_id) for product_id in product_ids]
+            )
+
+    def _wait_data_cache(
+        self,
+        product_ids: List[str]
+    ) -> Dict[str, Optional[Product]]:
+        """
+        Waits briefly for other workers to fill the cache with the products
+        they hold the lease of. Returns the products that were filled.
+        """
+        lease_settings = settings.EXTENSIONS_CONFIG['challenge']['lease']
+        deadline = time.monotonic() + lease_settings['wait']
+
+        products: Dict[str, Optional[Product]] = {}
+        pending = list(product_ids)
+        while pending and time.monotonic() < deadline:
+            time.sleep(lease_settings['interval'])
+            products.update(self._get_data_cache_many(pending))
+            pending = [
+                product_id
+                for product_id in pending
+                if product_id not in products
+            ]
+
+        return products
+
+    async def _await_data_cache(
+        self,
+        product_ids: List[str]
+    ) -> Dict[str, Optional[Product]]:
+        lease_settings = settings.EXTENSIONS_CONFIG['challenge']['lease']
+        deadline = time.monotonic() + lease_settings['wait']
+        get_data_cache_many = sync_to_async(
+            self._get_data_cache_many,
+            thread_sensitive=False
+        )
+
+        products: Dict[str, Optional[Product]] = {}
+        pending = list(product_ids)
+        while pending and time.monotonic() < deadline:
+            await asyncio.sleep(lease_settings['interval'])
+            products.update(await get_data_cache_many(pending))
+            pending = [
+                product_id
+                for product_id in pending
+                if product_id not in products
+            ]
+
+        return products
+
+    @staticmethod
+    def _load_data_api(
+        fetched: Dict[str, Optional[dict]]
+    ) -> Dict[str, Optional[Product]]:
+        return {
+            product_id: None if data is None else Product.from_dict(data)
+            for product_id, data in fetched.items()
+        }
+
+    def _fetch_products(
+        self,
+        product_ids: List[str]
+    ) -> Dict[str, Optional[Product]]:
+        """
+        Fetches the products missing in the cache and stores them. Concurrent
+        fetches of the same product are coalesced: inside the worker callers
+        share one request, and across workers the one holding the lease
+        fetches while the others wait for it to fill the cache.
+        """
+        if not product_ids:
+            return {}
+
+        leased_ids, busy_ids = self._acquire_leases(product_ids)
+        try:
+            started_at = time.monotonic()
+            fetched = self._get_products_api(leased_ids)
+            delta = time.monotonic() - started_at
+            products = self._wait_data_cache(busy_ids)
+            fetched.update(
+                self._get_products_api([
+                    product_id
+                    for product_id in busy_ids
+                    if product_id not in products
+                ])
+            )
+            self._set_data_cache_many(fetched, delta=delta)
+        finally:
+            self._release_leases(leased_ids)
+
+        products.update(self._load_data_api(fetched))
+        return products
+
+    async def _afetch_products(
+        self,
+        product_ids: List[str]
+    ) -> Dict[str, Optional[Product]]:
+        if not product_ids:
+            return {}
+
+        leased_ids, busy_ids = await sync_to_async(
+            self._acquire_leases,
+            thread_sensitive=False
+        )(product_ids)
+        try:
+            started_at = time.monotonic()
+            fetched = await self._aget_products_api(leased_ids)
+            delta = time.monotonic() - started_at
+            products = await self._await_data_cache(busy_ids)
+            fetched.update(
+                await self._aget_products_api([
+                    product_id
+                    for product_id in busy_ids
+                    if product_id not in products
+                ])
+            )
+            await sync_to_async(
+                self._set_data_cache_many,
+                thread_sensitive=False
+            )(fetched, delta=delta)
+        finally:
+            await sync_to_async(
+                self._release_leases,
+                thread_sensitive=False
+            )(leased_ids)
+
+        products.update(self._load_data_api(fetched))
+        return products
+
+    @staticmethod
+    def _get_missing_ids(
+        product_ids: List[str],
+        products: Dict[str, Optional[Product]]
+    ) -> List[str]:
+        missing_ids = [
+            product_id
+            for product_id in product_ids
+            if product_id not in products
+        ]
+        logger.info(
+            'Products data returned by cache',
+            total=len(product_ids),
+            cache_hits=len(products),
+            cache_misses=len(missing_ids),
+        )
+        return missing_ids
+
+    @staticmethod
+    def _sort_products(
+        product_ids: List[str],
+        products: Dict[str, Optional[Product]]
+    ) -> Dict[str, Product]:
+        return {
+            product_id: products[product_id]
+            for product_id in product_ids
+            if products.get(product_id) is not None
+        }
+
+    def get_product(self, product_id: str) -> Product:
+        logger.bind(product_id=product_id)
+
+        cache_data = self._get_data_cache(product_id)
+        if cache_data:
+            logger.info(
+                'Product data returned by cache',
+                product_data=cache_data,
+            )
+            return cache_data
+
+        product_id = str(product_id)
+        product = self._fetch_products([product_id]).get(product_id)
+        if product is None:
+            raise ProductNotFoundException
+
+        return product
+
+    def get_products(self, product_ids: Iterable[str]) -> Dict[str, Product]:
+        product_ids = list(dict.fromkeys(map(str, product_ids)))
+        products = self._get_data_cache_many(product_ids)
+        missing_ids = self._get_missing_ids(product_ids, products)
+
+        products.update(self._fetch_products(missing_ids))
+        return self._sort_products(product_ids, products)
+
+    def invalidate_products(
+        self,
+        product_ids: Iterable[str],
+        refresh: bool = False
+    ) -> None:
+        """
+        Drops the products from Redis and from the local cache of every
+        worker. With `refresh` the products are fetched and stored again
+        instead, so they do not miss the cache meanwhile, falling back to
+        drop them when the API fails. The leases are skipped on purpose:
+        waiting for another worker could return the outdated entry.
+        """
+        product_ids = list(dict.fromkeys(map(str, product_ids)))
+        if not product_ids:
+            return
+
+        logger.info(
+            'Invalidating products cache',
+            product_ids=product_ids,
+            refresh=refresh,
+        )
+        local_cache.delete_many(product_ids)
+
+        refreshed = False
+        if refresh:
+            try:
+                started_at = time.monotonic()
+                fetched = self._get_products_api(product_ids)
+                self._set_data_cache_many(
+                    fetched,
+                    delta=time.monotonic() - started_at
+                )
+                refreshed = True
+            except ProductException as exc:
+                logger.warning(
+                    'Failed to refresh invalidated products, dropping them',
+                    product_ids=product_ids,
+                    error_message=str(exc)
+                )
+
+        if not refreshed:
+            cache.delete_many(
+                [self._get_key_cache(product_id) for product_id in product_ids]
+            )
+            local_cache.delete_many(product_ids)
+
+        _bump_local_cache_epoch()
+
+    async def aget_product(self, product_id: str) -> Product:
+        logger.bind(product_id=product_id)
+
+        cache_data = await sync_to_async(
+            self._get_data_cache,
+            thread_sensitive=False
+        )(product_id)
+        if cache_data:
+            logger.info(
+                'Product data returned by cache',
+                product_data=cache_data,
+            )
+            return cache_data
+
+        product_id = str(product_id)
+        products = await self._afetch_products([product_id])
+        product = products.get(product_id)
+        if product is None:
+            raise ProductNotFoundException
+
+        return product
+
+    async def aget_products(
+        self,
+        product_ids: Iterable[str]
+    ) -> Dict[str, Product]:
+        product_ids = list(dict.fromkeys(map(str, product_ids)))
+        products = await sync_to_async(
+            self._get_data_cache_many,
+            thread_sensitive=False
+        )(product_ids)
+        missing_ids = self._get_missing_ids(product_ids, products)
+
+        products.update(await self._afetch_products(missing_ids))
+        return self._sort_products(product_ids, products)
@@ -0,0 +1,48 @@
+import json
+from typing import Iterator, List
+
+import structlog
+from django_redis import get_redis_connection
+from simple_settings import settings
+
+from project.backends.products.events import ProductEventConsumer
+
+logger = structlog.get_logger(__name__)
+
+
+class RedisListProductEventConsumer(ProductEventConsumer):
+    """
+    Consumes product change events pushed to a Redis list as JSON messages
+    like {"product_ids": ["..."]}. Each message is a batch.
+    """
+
+    def __init__(self, cache_alias: str = 'concurrent', timeout: int = 5):
+        self.queue = settings.EXTENSIONS_CONFIG['challenge']['invalidation'][
+            'queue'
+        ]
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+
+    @staticmethod
+    def _load_message(message: bytes) -> List[str]:
+        try:
+            product_ids = json.loads(message)['product_ids']
+        except (ValueError, TypeError, KeyError):
+            logger.warning(
+                'Ignoring invalid product event',
+                message=message,
+            )
+            return []
+
+        return [str(product_id) for product_id in product_ids]
+
+    def consume(self) -> Iterator[List[str]]:
+        connection = get_redis_connection(self.cache_alias)
+        while True:
+            item = connection.blpop([self.queue], timeout=self.timeout)
+            if item is None:
+                continue
+
+            product_ids = self._load_message(item[1])
+            if product_ids:
+                yield product_ids
@@ -1,10 +1,21 @@
+import asyncio
+import atexit
+import os
+import threading
+import time
+from asyncio import AbstractEventLoop
+from contextlib import contextmanager
 from http import HTTPStatus
+from typing import Iterator, Optional
 from urllib.parse import urljoin
+from weakref import WeakKeyDictionary
 
-import requests
+import httpx
 import structlog
-from requests import HTTPError, Timeout
+from requests import HTTPError, Session, Timeout
+from requests.adapters import HTTPAdapter
 from simple_settings import settings
+from urllib3.util.retry import Retry
 
 from project.extensions.challenge.products.exceptions import (
     ChallengeProductClientException,
@@ -12,18 +23,160 @@ from project.extensions.challenge.products.exceptions import (
     ChallengeProductNotFoundException,
     ChallengeProductTimeoutException
 )
+from project.extensions.challenge.products.metrics import (
+    api_errors,
+    api_latency
+)
 
 logger = structlog.get_logger(__name__)
 challenge_settings = settings.EXTENSIONS_CONFIG['challenge']
 
+_session: Optional[Session] = None
+_session_lock = threading.Lock()
 
-def get_product(product_id: str) -> dict:
+_async_clients: 'WeakKeyDictionary[AbstractEventLoop, httpx.AsyncClient]' = (
+    WeakKeyDictionary()
+)
+
+
+def _build_session() -> Session:
+    session_settings = challenge_settings['session']
+
+    retry = Retry(
+        total=session_settings['retries'],
+        read=False,
+        status_forcelist=(
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        ),
+        backoff_factor=session_settings['backoff_factor'],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=session_settings['pool_size'],
+        max_retries=retry,
+    )
+
+    session = Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if not session_settings['keep_alive']:
+        session.headers['Connection'] = 'close'
+
+    return session
+
+
+def get_session() -> Session:
+    """
+    Returns the HTTP session of the worker, creating it on the first call.
+    The session keeps a pool of connections alive to reuse them between the
+    requests made to Product Challenge.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+
+    return _session
+
+
+def close_session() -> None:
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _build_async_client() -> httpx.AsyncClient:
+    session_settings = challenge_settings['session']
+
+    limits = httpx.Limits(
+        max_connections=session_settings['pool_size'],
+        max_keepalive_connections=(
+            session_settings['pool_size']
+            if session_settings['keep_alive'] else 0
+        ),
+    )
+    return httpx.AsyncClient(limits=limits)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Returns the async HTTP client bound to the running event loop, creating
+    it on the first call. Connections of an async client can not be shared
+    between event loops, so each loop has its own client.
+    """
+    loop = asyncio.get_running_loop()
+
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _build_async_client()
+        _async_clients[loop] = client
+
+    return client
+
+
+async def aclose_async_client() -> None:
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _reset_session_after_fork() -> None:
+    """
+    Forked workers must not share the connections of the parent process.
+    """
+    global _session, _session_lock
+
+    _session = None
+    _session_lock = threading.Lock()
+    _async_clients.clear()
+
+
+atexit.register(close_session)
+os.register_at_fork(after_in_child=_reset_session_after_fork)
+
+
+def _get_url_product(product_id: str) -> str:
+    return urljoin(
+        challenge_settings['host'],
+        challenge_settings['routes']['product']
+    ).format(product_id=product_id)
+
+
+def _get_url_products(page: int) -> str:
+    return urljoin(
+        challenge_settings['host'],
+        challenge_settings['routes']['products']
+    ).format(page=page)
+
+
+@contextmanager
+def _observe_request(route: str) -> Iterator[None]:
+    """
+    Records the latency of the request and the class of its error, if any.
+    """
+    started_at = time.perf_counter()
+    try:
+        yield
+    except ChallengeProductException as exc:
+        api_errors.labels(route=route, exception=type(exc).__name__).inc()
+        raise
+    finally:
+        api_latency.labels(route=route).observe(
+            time.perf_counter() - started_at
+        )
+
+
+def _get(url: str) -> dict:
     try:
         timeout = challenge_settings['timeout']
-        url = urljoin(
-            challenge_settings['host'],
-            challenge_settings['routes']['product']
-        ).format(product_id=product_id)
 
         logger.info(
             'Fetching product data from the external API',
@@ -31,7 +184,7 @@ def get_product(product_id: str) -> dict:
             timeout=timeout
         )
 
-        response = requests.get(url=url, timeout=timeout)
+        response = get_session().get(url=url, timeout=timeout)
         response.raise_for_status()
 
         data = response.json()
@@ -62,3 +215,65 @@ def get_product(product_id: str) -> dict:
             'An unhandled error occurred when making a request to '
             'Product Challenge'
         ) from exc
+
+
+def get_product(product_id: str) -> dict:
+    with _observe_request('product'):
+        return _get(_get_url_product(product_id))
+
+
+def get_products_page(page: int) -> dict:
+    """
+    Returns a page of the product listing of Product Challenge, with the
+    products of the page under the `products` key.
+    """
+    with _observe_request('products'):
+        return _get(_get_url_products(page))
+
+
+async def _aget(url: str) -> dict:
+    try:
+        timeout = challenge_settings['timeout']
+
+        logger.info(
+            'Fetching product data from the external API',
+            url=url,
+            timeout=timeout
+        )
+
+        response = await get_async_client().get(url=url, timeout=timeout)
+        response.raise_for_status()
+
+        data = response.json()
+        return data
+
+    except httpx.HTTPStatusError as exc:
+        status_code = exc.response.status_code
+
+        if status_code == HTTPStatus.NOT_FOUND:
+            raise ChallengeProductNotFoundException(
+                'Products Challenge API returned error product not found',
+            ) from exc
+
+        raise ChallengeProductClientException(
+            'Product Challenge API returned an error in the request',
+            status_code=status_code,
+            response=exc.response.text,
+        ) from exc
+
+    except httpx.TimeoutException as exc:
+        raise ChallengeProductTimeoutException(
+            'There was a timeout error during the requisition to '
+            'Product Challenge'
+        ) from exc
+
+    except Exception as exc:
+        raise ChallengeProductException(
+            'An unhandled error occurred when making a request to '
+            'Product Challenge'
+        ) from exc
+
+
+async def aget_product(product_id: str) -> dict:
+    with _observe_request('product'):
+        return await _aget(_get_url_product(product_id))
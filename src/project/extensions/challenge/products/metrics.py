@@ -0,0 +1,28 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+api_latency = Histogram(
+    'challenge_product_api_request_duration_seconds',
+    'Duration of the requests made to the Product Challenge API',
+    ['route'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
+)
+api_errors = Counter(
+    'challenge_product_api_errors_total',
+    'Errors of the requests made to the Product Challenge API',
+    ['route', 'exception'],
+)
+cache_requests = Counter(
+    'product_cache_requests_total',
+    'Products looked up in the caches, by layer and result',
+    ['layer', 'result'],
+)
+backend_errors = Counter(
+    'product_backend_errors_total',
+    'Errors raised by the product backend when fetching products',
+    ['exception'],
+)
+local_cache_size = Gauge(
+    'product_local_cache_size',
+    'Number of products held in the local caches of the workers',
+    multiprocess_mode='livesum',
+)
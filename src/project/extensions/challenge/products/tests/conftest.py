@@ -1,7 +1,67 @@
-from unittest.mock import patch
+import time
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
+from project.extensions.challenge.products.backend import (
+    CACHE_VERSION,
+    _local_cache_epoch,
+    _refreshing,
+    local_cache
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    local_cache.clear()
+    yield
+    local_cache.clear()
+    _refreshing.clear()
+    _local_cache_epoch.update(epoch=None, checked_at=float('-inf'))
+
+
+@pytest.fixture(autouse=True)
+def mock_cache():
+    """
+    Products cache, written through the pipelines of the Redis connection.
+    """
+    with patch(
+        'project.extensions.challenge.products.backend.cache'
+    ) as mock:
+        mock.get_many.return_value = {}
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def mock_redis_connection():
+    """
+    Redis connection of the leases. Each pipeline answers the SET NX of
+    every product with `leased` and is kept in `pipelines`.
+    """
+    with patch(
+        'project.extensions.challenge.products.backend.get_redis_connection'
+    ) as mock:
+        def pipeline(*args, **kwargs):
+            pipe = MagicMock()
+            pipe.execute.side_effect = lambda: (
+                [mock.leased] * pipe.set.call_count
+            )
+            mock.pipelines.append(pipe)
+            return pipe
+
+        mock.leased = True
+        mock.pipelines = []
+        mock.return_value.pipeline.side_effect = pipeline
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def mock_products_fetched():
+    with patch(
+        'project.extensions.challenge.products.backend.products_fetched'
+    ) as mock:
+        yield mock
+
 
 @pytest.fixture
 def mock_logger():
@@ -28,3 +88,32 @@ def mock_data_api_product():
         'id': '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
         'title': 'Cadeira para Auto Iseos Bébé Confort Earth Brown'
     }
+
+
+@pytest.fixture
+def mock_data_cache_product(mock_data_api_product):
+    return [
+        CACHE_VERSION,
+        None,
+        time.time() + 10800,
+        0.1,
+        mock_data_api_product['id'],
+        mock_data_api_product['price'],
+        mock_data_api_product['image'],
+        mock_data_api_product['brand'],
+        mock_data_api_product['title'],
+    ]
+
+
+@pytest.fixture
+def mock_data_cache_product_written(mock_data_cache_product):
+    """
+    Cache entry as written by the backend, whose expiration and fetch time
+    depend on the clock.
+    """
+    return [
+        *mock_data_cache_product[:2],
+        ANY,
+        ANY,
+        *mock_data_cache_product[4:],
+    ]
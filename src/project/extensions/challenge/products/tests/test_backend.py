@@ -1,6 +1,11 @@
-from unittest.mock import patch
+import asyncio
+import time
+from threading import Barrier, current_thread
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
+from prometheus_client import REGISTRY
+from simple_settings import settings
 
 from project.backends.products.exceptions import (
     ProductClientException,
@@ -10,13 +15,19 @@ from project.backends.products.exceptions import (
     ProductValidationException
 )
 from project.backends.products.interfaces import Product
-from project.extensions.challenge.products.backend import ProductBackend
+from project.extensions.challenge.products.backend import (
+    CACHE_VERSION,
+    NOT_FOUND_CACHE,
+    ProductBackend,
+    local_cache
+)
 from project.extensions.challenge.products.exceptions import (
     ChallengeProductClientException,
     ChallengeProductException,
     ChallengeProductNotFoundException,
     ChallengeProductTimeoutException
 )
+from project.helpers.circuit_breaker import CircuitBreakerOpenException
 
 
 class TestGetProduct:
@@ -42,6 +53,25 @@ class TestGetProduct:
         assert isinstance(response, Product)
         assert response == Product.from_dict(mock_data_api_product)
 
+    def test_should_return_the_product_from_the_local_cache_on_the_next_call(
+        self,
+        mock_get_product,
+        mock_data_api_product,
+        product_id,
+    ):
+        backend = ProductBackend()
+        backend.get_product(product_id)
+
+        with patch(
+            'project.extensions.challenge.products.backend.cache'
+        ) as mock_cache:
+            response = backend.get_product(product_id)
+
+        mock_get_product.assert_called_once_with(product_id)
+        mock_cache.get.assert_not_called()
+        assert response == Product.from_dict(mock_data_api_product)
+        assert local_cache.stats()['hits'] == 1
+
     def test_should_validate_return_when_function_throws_a_not_found_exception(
         self,
         mock_get_product,
@@ -61,6 +91,42 @@ class TestGetProduct:
         )
         mock_logger.bind(product_id=product_id)
 
+    def test_should_raise_not_found_exception_from_cache_on_the_next_call(
+        self,
+        mock_get_product,
+        product_id,
+    ):
+        mock_get_product.side_effect = ChallengeProductNotFoundException
+        backend = ProductBackend()
+
+        for _ in range(2):
+            with pytest.raises(ProductNotFoundException):
+                backend.get_product(product_id)
+
+        mock_get_product.assert_called_once_with(product_id)
+
+    def test_should_fail_fast_when_the_circuit_breaker_is_open(
+        self,
+        mock_get_product,
+        mock_logger,
+        product_id,
+    ):
+        with patch(
+            'project.extensions.challenge.products.backend.circuit_breaker.'
+            'before_call'
+        ) as mock_before_call:
+            mock_before_call.side_effect = CircuitBreakerOpenException
+
+            with pytest.raises(ProductTimeoutException):
+                backend = ProductBackend()
+                backend.get_product(product_id)
+
+        mock_get_product.assert_not_called()
+        mock_logger.warning.assert_called_once_with(
+            'Product API circuit breaker is open, failing fast',
+            error_message=''
+        )
+
     def test_should_validate_return_when_function_throws_a_client_exception(
         self,
         mock_get_product,
@@ -139,3 +205,808 @@ class TestGetProduct:
                 "code='required')]}"
             )
         )
+
+
+class TestGetProducts:
+    @pytest.fixture
+    def mock_get_product(self, mock_data_api_product):
+        with patch(
+            'project.extensions.challenge.products.backend.'
+            'get_product'
+        ) as mock:
+            mock.return_value = mock_data_api_product
+            yield mock
+
+    def test_should_return_products_from_cache_with_a_single_call(
+        self,
+        mock_get_product,
+        mock_cache,
+        mock_products_fetched,
+        mock_data_api_product,
+        product_id,
+    ):
+        mock_cache.get_many.return_value = {
+            f'product-{product_id}': mock_data_api_product
+        }
+
+        backend = ProductBackend()
+        response = backend.get_products([product_id, product_id])
+
+        assert response == {
+            product_id: Product.from_dict(mock_data_api_product)
+        }
+        mock_cache.get_many.assert_called_once()
+        mock_get_product.assert_not_called()
+        mock_cache.set.assert_not_called()
+        mock_products_fetched.send.assert_not_called()
+
+    def test_should_fetch_cache_misses_and_write_them_back_in_batch(
+        self,
+        mock_get_product,
+        mock_cache,
+        mock_redis_connection,
+        mock_data_api_product,
+        mock_data_cache_product_written,
+        product_id,
+    ):
+        backend = ProductBackend()
+        response = backend.get_products([product_id])
+
+        assert response == {
+            product_id: Product.from_dict(mock_data_api_product)
+        }
+        mock_get_product.assert_called_once_with(product_id)
+        mock_cache.set.assert_called_once_with(
+            f'product-{product_id}',
+            mock_data_cache_product_written,
+            timeout=10800,
+            client=mock_redis_connection.pipelines[-1]
+        )
+        mock_redis_connection.pipelines[-1].execute.assert_called_once()
+
+    def test_should_announce_the_fetched_products_with_the_fetch_time(
+        self,
+        mock_get_product,
+        mock_cache,
+        mock_products_fetched,
+        mock_data_api_product,
+        product_id,
+    ):
+        not_found_id = '6a512e6c-6627-d286-5d18-583558359ab6'
+
+        def get_product(requested_id):
+            if requested_id == not_found_id:
+                raise ChallengeProductNotFoundException
+            return mock_data_api_product
+
+        mock_get_product.side_effect = get_product
+
+        backend = ProductBackend()
+        backend.get_products([product_id, not_found_id])
+
+        mock_products_fetched.send.assert_called_once_with(
+            sender=ProductBackend,
+            products={product_id: mock_data_api_product},
+            fetched_at=ANY
+        )
+
+    def test_should_leave_out_products_that_do_not_exist(
+        self,
+        mock_get_product,
+        mock_cache,
+        product_id,
+    ):
+        mock_get_product.side_effect = ChallengeProductNotFoundException
+
+        backend = ProductBackend()
+        response = backend.get_products([product_id])
+
+        assert response == {}
+        mock_cache.set.assert_called_once_with(
+            f'product-{product_id}',
+            NOT_FOUND_CACHE,
+            timeout=300,
+            client=ANY
+        )
+
+    def test_should_not_fetch_products_cached_as_not_found(
+        self,
+        mock_get_product,
+        mock_cache,
+        product_id,
+    ):
+        mock_cache.get_many.return_value = {
+            f'product-{product_id}': NOT_FOUND_CACHE
+        }
+
+        backend = ProductBackend()
+        response = backend.get_products([product_id])
+
+        assert response == {}
+        mock_get_product.assert_not_called()
+
+    def test_should_raise_product_exception_when_api_fails(
+        self,
+        mock_get_product,
+        mock_cache,
+        product_id,
+    ):
+        mock_get_product.side_effect = ChallengeProductTimeoutException
+
+        with pytest.raises(ProductTimeoutException):
+            backend = ProductBackend()
+            backend.get_products([product_id])
+
+    def test_should_fetch_cache_misses_concurrently_keeping_the_order(
+        self,
+        mock_get_product,
+        mock_cache,
+        mock_data_api_product,
+    ):
+        product_ids = [
+            '6a512e6c-6627-d286-5d18-583558359ab6',
+            '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+            'ff31f647-f872-4e70-b886-fd3071cd2788',
+        ]
+        barrier = Barrier(len(product_ids), timeout=5)
+
+        def get_product(product_id):
+            barrier.wait()
+            return {**mock_data_api_product, 'id': product_id}
+
+        mock_get_product.side_effect = get_product
+
+        backend = ProductBackend()
+        response = backend.get_products(product_ids)
+
+        assert list(response.keys()) == product_ids
+        assert [product.id for product in response.values()] == product_ids
+
+    def test_should_fetch_the_products_on_the_shared_pool_when_function_is_called(  # noqa
+        self,
+        mock_get_product,
+        mock_data_api_product,
+    ):
+        product_ids = [
+            '6a512e6c-6627-d286-5d18-583558359ab6',
+            '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+            'ff31f647-f872-4e70-b886-fd3071cd2788',
+            '0f2a5d3e-7b1c-4e8a-9d6f-2c3b4a5e6f70',
+        ]
+        thread_names = []
+
+        def get_product(product_id):
+            thread_names.append(current_thread().name)
+            return {**mock_data_api_product, 'id': product_id}
+
+        mock_get_product.side_effect = get_product
+
+        backend = ProductBackend()
+        backend.get_products(product_ids[:2])
+        backend.get_products(product_ids[2:])
+
+        assert len(thread_names) == 4
+        assert all(
+            name.startswith('product-fetch') for name in thread_names
+        )
+
+
+class TestAsyncGetProducts:
+    @pytest.fixture
+    def mock_aget_product(self, mock_data_api_product):
+        with patch(
+            'project.extensions.challenge.products.backend.'
+            'aget_product',
+            new_callable=AsyncMock
+        ) as mock:
+            mock.return_value = mock_data_api_product
+            yield mock
+
+    def test_should_validate_the_return_when_aget_product_is_called(
+        self,
+        mock_aget_product,
+        mock_data_api_product,
+        product_id,
+    ):
+        backend = ProductBackend()
+        response = asyncio.run(backend.aget_product(product_id))
+
+        mock_aget_product.assert_awaited_once_with(product_id)
+        assert response == Product.from_dict(mock_data_api_product)
+
+    def test_should_raise_not_found_exception_when_aget_product_is_called(
+        self,
+        mock_aget_product,
+        product_id,
+    ):
+        mock_aget_product.side_effect = ChallengeProductNotFoundException
+
+        with pytest.raises(ProductNotFoundException):
+            backend = ProductBackend()
+            asyncio.run(backend.aget_product(product_id))
+
+    def test_should_return_products_in_order_leaving_out_not_found_ones(
+        self,
+        mock_aget_product,
+        mock_data_api_product,
+    ):
+        product_ids = [
+            '6a512e6c-6627-d286-5d18-583558359ab6',
+            '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+            'ff31f647-f872-4e70-b886-fd3071cd2788',
+        ]
+
+        async def aget_product(product_id):
+            if product_id == product_ids[1]:
+                raise ChallengeProductNotFoundException
+            return {**mock_data_api_product, 'id': product_id}
+
+        mock_aget_product.side_effect = aget_product
+
+        backend = ProductBackend()
+        response = asyncio.run(backend.aget_products(product_ids))
+
+        assert list(response.keys()) == [product_ids[0], product_ids[2]]
+
+
+class TestCacheFormat:
+    @pytest.fixture
+    def mock_cache(self):
+        with patch(
+            'project.extensions.challenge.products.backend.cache'
+        ) as mock:
+            yield mock
+
+    @pytest.fixture
+    def mock_serializer(self):
+        with patch(
+            'project.extensions.challenge.products.backend.'
+            'ProductBackend._get_serializer'
+        ) as mock:
+            yield mock
+
+    def test_should_decode_compact_entries_without_validating_them(
+        self,
+        mock_cache,
+        mock_serializer,
+        mock_data_api_product,
+        mock_data_cache_product,
+        product_id,
+    ):
+        mock_cache.get_many.return_value = {
+            f'product-{product_id}': mock_data_cache_product
+        }
+
+        backend = ProductBackend()
+        response = backend.get_products([product_id])
+
+        assert response == {
+            product_id: Product.from_dict(mock_data_api_product)
+        }
+        mock_serializer.assert_not_called()
+
+    def test_should_ignore_compact_entries_of_another_version(
+        self,
+        mock_cache,
+        mock_data_cache_product,
+        product_id,
+    ):
+        mock_data_cache_product[0] = CACHE_VERSION + 1
+        mock_cache.get_many.return_value = {
+            f'product-{product_id}': mock_data_cache_product
+        }
+
+        backend = ProductBackend()
+
+        assert backend._get_data_cache_many([product_id]) == {}
+
+    def test_should_validate_and_serve_legacy_entries(
+        self,
+        mock_cache,
+        mock_data_api_product,
+        product_id,
+    ):
+        mock_cache.get_many.return_value = {
+            f'product-{product_id}': {
+                'product': mock_data_api_product,
+                'stale_at': None,
+            }
+        }
+
+        backend = ProductBackend()
+        response = backend._get_data_cache_many([product_id])
+
+        assert response == {
+            product_id: Product.from_dict(mock_data_api_product)
+        }
+
+    def test_should_remove_legacy_entries_that_are_not_valid(
+        self,
+        mock_cache,
+        product_id,
+    ):
+        mock_cache.get_many.return_value = {
+            f'product-{product_id}': {'id': product_id}
+        }
+
+        backend = ProductBackend()
+        response = backend._get_data_cache_many([product_id])
+
+        assert response == {}
+        mock_cache.delete.assert_called_once_with(f'product-{product_id}')
+
+
+class TestCacheExpiration:
+    @pytest.fixture
+    def mock_refresh_executor(self):
+        with patch(
+            'project.extensions.challenge.products.backend.refresh_executor'
+        ) as mock:
+            yield mock
+
+    @pytest.fixture
+    def caches_settings(self):
+        caches_settings = settings.EXTENSIONS_CONFIG['challenge']['caches']
+        with patch.dict(caches_settings):
+            yield caches_settings
+
+    def test_should_spread_the_timeouts_of_products_cached_together(
+        self,
+        mock_cache,
+        mock_redis_connection,
+        caches_settings,
+        mock_data_api_product,
+    ):
+        caches_settings['product_jitter'] = 0.5
+        data = {
+            str(product_id): {**mock_data_api_product, 'id': str(product_id)}
+            for product_id in range(50)
+        }
+
+        backend = ProductBackend()
+        backend._set_data_cache_many(data)
+
+        timeouts = [
+            call.kwargs['timeout'] for call in mock_cache.set.call_args_list
+        ]
+        pytest.assume(len(timeouts) == 50)
+        pytest.assume(len(set(timeouts)) > 20)
+        pytest.assume(all(5400 <= timeout <= 10800 for timeout in timeouts))
+        pytest.assume(len(mock_redis_connection.pipelines) == 1)
+        mock_redis_connection.pipelines[0].execute.assert_called_once()
+
+    def test_should_use_the_same_timeout_when_jitter_is_disabled(
+        self,
+        mock_cache,
+        caches_settings,
+        mock_data_api_product,
+        product_id,
+    ):
+        caches_settings['product_jitter'] = 0
+
+        backend = ProductBackend()
+        backend._set_data_cache_many({
+            product_id: mock_data_api_product,
+            'other': None,
+        })
+
+        calls = mock_cache.set.call_args_list
+        assert [call.kwargs['timeout'] for call in calls] == [10800, 300]
+
+    def test_should_refresh_early_when_the_entry_is_about_to_expire(
+        self,
+        mock_cache,
+        mock_refresh_executor,
+        caches_settings,
+        mock_data_cache_product,
+        product_id,
+    ):
+        caches_settings['product_early_beta'] = 1
+        mock_data_cache_product[2] = time.time() + 0.1
+        mock_data_cache_product[3] = 10
+        mock_cache.get_many.return_value = {
+            f'product-{product_id}': mock_data_cache_product
+        }
+
+        backend = ProductBackend()
+        with patch(
+            'project.extensions.challenge.products.backend.random.random'
+        ) as mock_random:
+            mock_random.return_value = 0.5
+            response = backend.get_products([product_id])
+
+        pytest.assume(list(response) == [product_id])
+        mock_refresh_executor.submit.assert_called_once()
+
+    @pytest.mark.parametrize('beta,expires_in', [(1, 3600), (0, 0.1)])
+    def test_should_not_refresh_early_when_far_from_expiring_or_disabled(
+        self,
+        mock_cache,
+        mock_refresh_executor,
+        caches_settings,
+        mock_data_cache_product,
+        product_id,
+        beta,
+        expires_in,
+    ):
+        caches_settings['product_early_beta'] = beta
+        mock_data_cache_product[2] = time.time() + expires_in
+        mock_data_cache_product[3] = 1
+        mock_cache.get_many.return_value = {
+            f'product-{product_id}': mock_data_cache_product
+        }
+
+        backend = ProductBackend()
+        with patch(
+            'project.extensions.challenge.products.backend.random.random'
+        ) as mock_random:
+            mock_random.return_value = 0.5
+            backend.get_products([product_id])
+
+        mock_refresh_executor.submit.assert_not_called()
+
+
+class TestStaleWhileRevalidate:
+    @pytest.fixture
+    def mock_cache(self):
+        with patch(
+            'project.extensions.challenge.products.backend.cache'
+        ) as mock:
+            yield mock
+
+    @pytest.fixture
+    def mock_refresh_executor(self):
+        with patch(
+            'project.extensions.challenge.products.backend.refresh_executor'
+        ) as mock:
+            yield mock
+
+    def test_should_serve_stale_product_and_schedule_a_single_refresh(
+        self,
+        mock_cache,
+        mock_refresh_executor,
+        mock_data_api_product,
+        mock_data_cache_product,
+        product_id,
+    ):
+        mock_data_cache_product[1] = 0
+        mock_cache.get_many.return_value = {
+            f'product-{product_id}': mock_data_cache_product
+        }
+
+        backend = ProductBackend()
+        response = backend.get_products([product_id])
+        local_cache.clear()
+        backend.get_products([product_id])
+
+        assert response == {
+            product_id: Product.from_dict(mock_data_api_product)
+        }
+        mock_refresh_executor.submit.assert_called_once()
+
+    def test_should_not_schedule_refresh_when_product_is_fresh(
+        self,
+        mock_cache,
+        mock_refresh_executor,
+        mock_data_cache_product,
+        product_id,
+    ):
+        mock_data_cache_product[1] = time.time() + 60
+        mock_cache.get_many.return_value = {
+            f'product-{product_id}': mock_data_cache_product
+        }
+
+        backend = ProductBackend()
+        backend.get_products([product_id])
+
+        mock_refresh_executor.submit.assert_not_called()
+
+    def test_should_store_refreshed_product_in_cache(
+        self,
+        mock_cache,
+        mock_data_api_product,
+        product_id,
+    ):
+        with patch(
+            'project.extensions.challenge.products.backend.get_product'
+        ) as mock_get_product:
+            mock_get_product.return_value = mock_data_api_product
+
+            backend = ProductBackend()
+            backend._refresh_products([product_id])
+
+        mock_cache.set.assert_called_once()
+        assert local_cache.get(product_id) == Product.from_dict(
+            mock_data_api_product
+        )
+
+
+class TestProductLease:
+    @pytest.fixture
+    def mock_get_product(self, mock_data_api_product):
+        with patch(
+            'project.extensions.challenge.products.backend.get_product'
+        ) as mock:
+            mock.return_value = mock_data_api_product
+            yield mock
+
+    @pytest.fixture
+    def mock_caches(self):
+        with patch(
+            'project.extensions.challenge.products.backend.caches'
+        ) as mock:
+            yield mock
+
+    def test_should_fetch_and_release_the_lease_when_it_is_acquired(
+        self,
+        mock_get_product,
+        mock_caches,
+        mock_cache,
+        mock_redis_connection,
+        product_id,
+    ):
+        backend = ProductBackend()
+        backend.get_product(product_id)
+
+        lease_cache = mock_caches.__getitem__.return_value
+        mock_caches.__getitem__.assert_called_with('concurrent')
+        mock_redis_connection.assert_any_call('concurrent')
+        lease_cache.make_key.assert_called_once_with(
+            f'product-lease-{product_id}'
+        )
+        mock_redis_connection.pipelines[0].set.assert_called_once_with(
+            lease_cache.make_key.return_value,
+            1,
+            nx=True,
+            ex=5
+        )
+        lease_cache.delete_many.assert_called_once_with(
+            [f'product-lease-{product_id}']
+        )
+        mock_get_product.assert_called_once_with(product_id)
+
+    def test_should_wait_for_the_cache_when_another_worker_has_the_lease(
+        self,
+        mock_get_product,
+        mock_caches,
+        mock_cache,
+        mock_redis_connection,
+        mock_data_api_product,
+        mock_data_cache_product,
+        product_id,
+    ):
+        mock_redis_connection.leased = False
+        mock_cache.get_many.side_effect = [
+            {},
+            {},
+            {f'product-{product_id}': mock_data_cache_product},
+        ]
+
+        backend = ProductBackend()
+        response = backend.get_product(product_id)
+
+        assert response == Product.from_dict(mock_data_api_product)
+        mock_get_product.assert_not_called()
+        mock_caches.__getitem__.return_value.delete_many.assert_not_called()
+
+    def test_should_fetch_the_product_when_the_wait_for_the_lease_expires(
+        self,
+        mock_get_product,
+        mock_caches,
+        mock_cache,
+        mock_redis_connection,
+        product_id,
+    ):
+        mock_redis_connection.leased = False
+
+        lease_settings = {'timeout': 5, 'wait': 0, 'interval': 0}
+        with patch.dict(
+            settings.EXTENSIONS_CONFIG['challenge'],
+            {'lease': lease_settings}
+        ):
+            backend = ProductBackend()
+            backend.get_product(product_id)
+
+        mock_get_product.assert_called_once_with(product_id)
+
+    def test_should_take_the_leases_of_all_products_in_one_pipeline(
+        self,
+        mock_caches,
+        mock_cache,
+        mock_redis_connection,
+    ):
+        product_ids = [
+            '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+            '6a512e6c-6627-d286-5d18-583558359ab6',
+        ]
+        with patch.object(
+            ProductBackend,
+            '_get_products_api',
+            return_value={}
+        ), patch.object(ProductBackend, '_set_data_cache_many'):
+            ProductBackend()._fetch_products(product_ids)
+
+        pytest.assume(len(mock_redis_connection.pipelines) == 1)
+        pipeline = mock_redis_connection.pipelines[0]
+        pytest.assume(pipeline.set.call_count == 2)
+        pipeline.execute.assert_called_once_with()
+
+
+class TestInvalidateProducts:
+    @pytest.fixture
+    def mock_caches(self):
+        with patch(
+            'project.extensions.challenge.products.backend.caches'
+        ) as mock:
+            yield mock
+
+    @pytest.fixture
+    def mock_get_product(self, mock_data_api_product):
+        with patch(
+            'project.extensions.challenge.products.backend.get_product'
+        ) as mock:
+            mock.return_value = mock_data_api_product
+            yield mock
+
+    def test_should_drop_the_products_from_redis_and_the_local_cache(
+        self,
+        mock_cache,
+        mock_caches,
+        mock_data_api_product,
+        product_id,
+    ):
+        local_cache.set(product_id, Product.from_dict(mock_data_api_product))
+
+        backend = ProductBackend()
+        backend.invalidate_products([product_id, product_id])
+
+        mock_cache.delete_many.assert_called_once_with(
+            [f'product-{product_id}']
+        )
+        assert local_cache.get(product_id) is None
+        mock_caches.__getitem__.return_value.set.assert_called_once()
+
+    def test_should_store_the_products_again_when_refresh_is_requested(
+        self,
+        mock_cache,
+        mock_caches,
+        mock_get_product,
+        mock_data_api_product,
+        mock_data_cache_product_written,
+        mock_redis_connection,
+        product_id,
+    ):
+        mock_redis_connection.leased = False
+
+        backend = ProductBackend()
+        backend.invalidate_products([product_id], refresh=True)
+
+        mock_get_product.assert_called_once_with(product_id)
+        mock_cache.set.assert_called_once_with(
+            f'product-{product_id}',
+            mock_data_cache_product_written,
+            timeout=10800,
+            client=ANY
+        )
+        mock_cache.delete_many.assert_not_called()
+        assert local_cache.get(product_id) == Product.from_dict(
+            mock_data_api_product
+        )
+
+    def test_should_drop_the_products_when_the_refresh_fails(
+        self,
+        mock_cache,
+        mock_caches,
+        mock_get_product,
+        product_id,
+    ):
+        mock_get_product.side_effect = ChallengeProductTimeoutException
+
+        backend = ProductBackend()
+        backend.invalidate_products([product_id], refresh=True)
+
+        mock_cache.delete_many.assert_called_once_with(
+            [f'product-{product_id}']
+        )
+
+    def test_should_clear_the_local_cache_when_another_worker_invalidated(
+        self,
+        mock_cache,
+        mock_caches,
+        mock_data_api_product,
+        product_id,
+    ):
+        product = Product.from_dict(mock_data_api_product)
+        lease_cache = mock_caches.__getitem__.return_value
+        lease_cache.get.return_value = None
+        backend = ProductBackend()
+        backend._get_data_cache_many([product_id])
+        local_cache.set(product_id, product)
+
+        lease_cache.get.return_value = 'other-epoch'
+        now = time.monotonic()
+        with patch(
+            'project.extensions.challenge.products.backend.time.monotonic'
+        ) as mock_monotonic:
+            mock_monotonic.return_value = now + 10
+            response = backend._get_data_cache_many([product_id])
+
+        assert response == {}
+        lease_cache.get.assert_called_with('product-local-epoch')
+
+
+class TestBackendMetrics:
+    @pytest.fixture
+    def mock_get_product(self, mock_data_api_product):
+        with patch(
+            'project.extensions.challenge.products.backend.get_product'
+        ) as mock:
+            mock.return_value = mock_data_api_product
+            yield mock
+
+    @staticmethod
+    def get_sample_value(name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def get_cache_requests(self):
+        return {
+            (layer, result): self.get_sample_value(
+                'product_cache_requests_total',
+                layer=layer,
+                result=result
+            )
+            for layer in ('local', 'redis')
+            for result in ('hit', 'miss')
+        }
+
+    def test_should_count_the_hits_and_misses_of_each_cache_layer(
+        self,
+        mock_cache,
+        mock_get_product,
+        product_id,
+    ):
+        before = self.get_cache_requests()
+
+        backend = ProductBackend()
+        backend.get_product(product_id)
+        backend.get_product(product_id)
+
+        after = self.get_cache_requests()
+        assert {
+            key: after[key] - before[key] for key in after
+        } == {
+            ('local', 'hit'): 1,
+            ('local', 'miss'): 1,
+            ('redis', 'hit'): 0,
+            ('redis', 'miss'): 1,
+        }
+
+    def test_should_count_the_errors_of_the_backend_by_exception_class(
+        self,
+        mock_cache,
+        mock_get_product,
+        product_id,
+    ):
+        mock_get_product.side_effect = ChallengeProductTimeoutException
+        before = self.get_sample_value(
+            'product_backend_errors_total',
+            exception='ProductTimeoutException'
+        )
+
+        with pytest.raises(ProductTimeoutException):
+            ProductBackend().get_product(product_id)
+
+        assert self.get_sample_value(
+            'product_backend_errors_total',
+            exception='ProductTimeoutException'
+        ) == before + 1
+
+    def test_should_update_the_size_of_the_local_cache(
+        self,
+        mock_cache,
+        mock_get_product,
+        product_id,
+    ):
+        ProductBackend().get_product(product_id)
+
+        assert self.get_sample_value('product_local_cache_size') == 1
@@ -0,0 +1,37 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from project.extensions.challenge.products.events import (
+    RedisListProductEventConsumer
+)
+
+
+class TestRedisListProductEventConsumer:
+    @pytest.fixture
+    def mock_connection(self):
+        with patch(
+            'project.extensions.challenge.products.events.'
+            'get_redis_connection'
+        ) as mock:
+            yield mock.return_value
+
+    def test_should_yield_the_product_ids_of_each_message(
+        self,
+        mock_connection,
+        product_id,
+    ):
+        mock_connection.blpop.side_effect = [
+            None,
+            (b'product-events', json.dumps({'product_ids': [product_id]})),
+            (b'product-events', b'invalid'),
+            (b'product-events', json.dumps({'product_ids': [product_id]})),
+        ]
+
+        consumer = RedisListProductEventConsumer()
+        events = consumer.consume()
+
+        pytest.assume(next(events) == [product_id])
+        pytest.assume(next(events) == [product_id])
+        mock_connection.blpop.assert_called_with(['product-events'], timeout=5)
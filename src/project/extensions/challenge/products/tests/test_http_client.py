@@ -1,8 +1,12 @@
+import asyncio
 import json
+from unittest.mock import patch
 from urllib.parse import urljoin
 
+import httpx
 import pytest
 import responses
+from prometheus_client import REGISTRY
 from requests import Timeout
 from simple_settings import settings
 
@@ -12,7 +16,14 @@ from project.extensions.challenge.products.exceptions import (
     ChallengeProductNotFoundException,
     ChallengeProductTimeoutException
 )
-from project.extensions.challenge.products.http_client import get_product
+from project.extensions.challenge.products.http_client import (
+    aclose_async_client,
+    aget_product,
+    close_session,
+    get_product,
+    get_products_page,
+    get_session
+)
 
 
 class TestGetProduct:
@@ -114,3 +125,244 @@ class TestGetProduct:
         )
         with pytest.raises(ChallengeProductException):
             get_product(product_id)
+
+
+class TestRequestMetrics:
+    challenge_settings = settings.EXTENSIONS_CONFIG['challenge']
+
+    @pytest.fixture
+    def url(self, product_id):
+        return urljoin(
+            self.challenge_settings['host'],
+            self.challenge_settings['routes']['product']
+        ).format(
+            product_id=product_id
+        )
+
+    @staticmethod
+    def get_sample_value(name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    @responses.activate
+    def test_should_record_the_latency_of_the_requests(
+        self,
+        url,
+        product_id,
+        mock_data_api_product,
+    ):
+        responses.add(
+            responses.GET,
+            url,
+            json=mock_data_api_product,
+            status=200
+        )
+        before = self.get_sample_value(
+            'challenge_product_api_request_duration_seconds_count',
+            route='product'
+        )
+
+        get_product(product_id)
+
+        assert self.get_sample_value(
+            'challenge_product_api_request_duration_seconds_count',
+            route='product'
+        ) == before + 1
+
+    @responses.activate
+    def test_should_count_the_errors_by_exception_class(
+        self,
+        url,
+        product_id,
+    ):
+        responses.add(responses.GET, url, body=Timeout())
+        labels = {
+            'route': 'product',
+            'exception': 'ChallengeProductTimeoutException',
+        }
+        before = self.get_sample_value(
+            'challenge_product_api_errors_total',
+            **labels
+        )
+
+        with pytest.raises(ChallengeProductTimeoutException):
+            get_product(product_id)
+
+        assert self.get_sample_value(
+            'challenge_product_api_errors_total',
+            **labels
+        ) == before + 1
+
+
+class TestGetProductsPage:
+    challenge_settings = settings.EXTENSIONS_CONFIG['challenge']
+
+    @pytest.fixture
+    def url(self):
+        return urljoin(
+            self.challenge_settings['host'],
+            self.challenge_settings['routes']['products']
+        ).format(
+            page=2
+        )
+
+    @responses.activate
+    def test_should_return_the_page_of_the_listing_when_the_request_occurs_successfully(  # noqa
+        self,
+        url,
+        mock_data_api_product,
+    ):
+        data_api = {
+            'meta': {'page_number': 2, 'page_size': 100},
+            'products': [mock_data_api_product],
+        }
+        responses.add(responses.GET, url, json=data_api, status=200)
+
+        assert get_products_page(2) == data_api
+
+    @responses.activate
+    def test_should_return_exception_not_found_when_the_page_does_not_exist(
+        self,
+        url,
+    ):
+        responses.add(responses.GET, url, json={}, status=404)
+
+        with pytest.raises(ChallengeProductNotFoundException):
+            get_products_page(2)
+
+
+class TestSession:
+    challenge_settings = settings.EXTENSIONS_CONFIG['challenge']
+
+    @pytest.fixture(autouse=True)
+    def clean_session(self):
+        close_session()
+        yield
+        close_session()
+
+    def test_should_reuse_the_same_session_between_calls(self):
+        assert get_session() is get_session()
+
+    def test_should_create_a_new_session_after_it_is_closed(self):
+        session = get_session()
+        close_session()
+
+        assert get_session() is not session
+
+    def test_should_configure_connection_pool_and_retries_of_the_session(
+        self,
+    ):
+        session_settings = self.challenge_settings['session']
+        adapter = get_session().get_adapter(
+            self.challenge_settings['host']
+        )
+
+        assert adapter._pool_maxsize == session_settings['pool_size']
+        assert adapter.max_retries.total == session_settings['retries']
+        assert adapter.max_retries.backoff_factor == (
+            session_settings['backoff_factor']
+        )
+
+    def test_should_disable_keep_alive_when_configured(self):
+        session_settings = {
+            **self.challenge_settings['session'],
+            'keep_alive': False
+        }
+        with patch.dict(
+            self.challenge_settings,
+            {'session': session_settings}
+        ):
+            session = get_session()
+
+        assert session.headers['Connection'] == 'close'
+
+
+class TestAsyncGetProduct:
+    @pytest.fixture
+    def mock_transport(self):
+        def build_async_client(handler):
+            return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with patch(
+            'project.extensions.challenge.products.http_client.'
+            '_build_async_client'
+        ) as mock:
+            mock.side_effect = lambda: build_async_client(
+                mock.handler
+            )
+            yield mock
+
+    @staticmethod
+    def run(product_id):
+        async def get():
+            try:
+                return await aget_product(product_id)
+            finally:
+                await aclose_async_client()
+
+        return asyncio.run(get())
+
+    def test_should_validate_the_return_of_the_api_when_the_request_occurs_successfully(  # noqa
+        self,
+        mock_transport,
+        product_id,
+        mock_data_api_product,
+    ):
+        mock_transport.handler = lambda request: httpx.Response(
+            200,
+            json=mock_data_api_product
+        )
+
+        data = self.run(product_id)
+        assert data == mock_data_api_product
+
+    def test_should_return_exception_not_found_when_the_product_does_not_exist(
+        self,
+        mock_transport,
+        product_id,
+    ):
+        mock_transport.handler = lambda request: httpx.Response(404)
+
+        with pytest.raises(ChallengeProductNotFoundException):
+            self.run(product_id)
+
+    def test_should_return_client_exception_when_api_returns_an_error(
+        self,
+        mock_transport,
+        product_id,
+    ):
+        mock_transport.handler = lambda request: httpx.Response(
+            401,
+            text='unauthorized'
+        )
+
+        with pytest.raises(ChallengeProductClientException) as exc:
+            self.run(product_id)
+
+        assert exc.value.status_code == 401
+        assert exc.value.response == 'unauthorized'
+
+    def test_should_return_exception_timeout_when_api_takes_too_long_to_respond(  # noqa
+        self,
+        mock_transport,
+        product_id,
+    ):
+        def handler(request):
+            raise httpx.ReadTimeout('timeout', request=request)
+
+        mock_transport.handler = handler
+
+        with pytest.raises(ChallengeProductTimeoutException):
+            self.run(product_id)
+
+    def test_should_return_product_exception_when_a_generic_error_occurs(
+        self,
+        mock_transport,
+        product_id,
+    ):
+        def handler(request):
+            raise Exception()
+
+        mock_transport.handler = handler
+
+        with pytest.raises(ChallengeProductException):
+            self.run(product_id)
@@ -1,18 +1,154 @@
+import asyncio
+import hashlib
+import math
+import random
+import time
+from typing import Dict, Iterable, List, Optional
+
+from simple_settings import settings
+
 from project.backends.products.backend import ProductAbstractBackend
+from project.backends.products.exceptions import (
+    ProductNotFoundException,
+    ProductTimeoutException
+)
 from project.backends.products.interfaces import Product
 
+BRANDS = (
+    'bébé confort',
+    'burigotto',
+    'chicco',
+    'galzerano',
+    'safety 1st',
+    'tutti baby',
+)
+TITLES = (
+    'Cadeira para Auto',
+    'Carrinho de Bebê',
+    'Berço Portátil',
+    'Moisés',
+    'Cadeirão de Alimentação',
+    'Bebê Conforto',
+)
+COLORS = ('Black', 'Blue', 'Earth Brown', 'Grey', 'Pink', 'Red')
+
 
 class ProductFakeBackend(ProductAbstractBackend):
+    """
+    Synthetic catalog for load tests without network access. The data of
+    each product is derived from its id, so the same id always returns the
+    same product and the same share of ids does not exist. The latency and
+    the errors of each call are drawn from the distributions configured in
+    EXTENSIONS_CONFIG['fake'].
+    """
 
-    def get_product(self, product_id: str) -> Product:
-        data = {
-            'price': 1699.0,
-            'image': (
+    def __init__(self):
+        self.settings = settings.EXTENSIONS_CONFIG['fake']
+        self.random = random.Random(self.settings['seed'])
+
+    @staticmethod
+    def _get_digest(product_id: str) -> bytes:
+        return hashlib.sha256(str(product_id).encode()).digest()
+
+    def _exists(self, digest: bytes) -> bool:
+        ratio = int.from_bytes(digest[:4], 'big') / 2 ** 32
+        return ratio >= self.settings['not_found_rate']
+
+    @staticmethod
+    def _build_product(product_id: str, digest: bytes) -> Product:
+        cents = int.from_bytes(digest[4:8], 'big') % 500000
+        return Product(
+            id=str(product_id),
+            price=round(10 + cents / 100, 2),
+            image=(
                 'http://challenge-api.luizalabs.com/images/'
-                '1bf0f365-fbdd-4e21-9786-da459d78dd1f.jpg'
+                f'{product_id}.jpg'
+            ),
+            brand=BRANDS[digest[8] % len(BRANDS)],
+            title=(
+                f'{TITLES[digest[9] % len(TITLES)]} '
+                f'{BRANDS[digest[8] % len(BRANDS)].title()} '
+                f'{COLORS[digest[10] % len(COLORS)]}'
             ),
-            'brand': 'bébé confort',
-            'id': '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
-            'title': 'Cadeira para Auto Iseos Bébé Confort Earth Brown'
-        }
-        return Product.from_dict(data)
+        )
+
+    def _get_latency(self) -> float:
+        latency = self.settings['latency']
+        mean = latency['mean']
+        if mean <= 0:
+            return 0.0
+
+        distribution = latency['distribution']
+        if distribution == 'uniform':
+            return self.random.uniform(0, 2 * mean)
+        if distribution == 'lognormal':
+            sigma = latency['sigma']
+            return self.random.lognormvariate(
+                math.log(mean) - sigma ** 2 / 2,
+                sigma
+            )
+        return mean
+
+    def _should_fail(self) -> bool:
+        return self.random.random() < self.settings['error_rate']
+
+    def _resolve(self, product_id: str) -> Optional[Product]:
+        """
+        Returns the product of the id or None when it does not exist.
+        Raises ProductTimeoutException when the call draws an error.
+        """
+        if self._should_fail():
+            raise ProductTimeoutException(
+                f'Fake error injected for product {product_id}'
+            )
+
+        digest = self._get_digest(product_id)
+        if not self._exists(digest):
+            return None
+
+        return self._build_product(product_id, digest)
+
+    def _resolve_many(self, product_ids: List[str]) -> Dict[str, Product]:
+        products = {}
+        for product_id in product_ids:
+            product = self._resolve(product_id)
+            if product is not None:
+                products[product_id] = product
+
+        return products
+
+    def _get_latency_many(self, size: int) -> float:
+        """
+        Products are fetched concurrently, so a batch takes as long as its
+        slowest product.
+        """
+        return max((self._get_latency() for _ in range(size)), default=0.0)
+
+    def get_product(self, product_id: str) -> Product:
+        time.sleep(self._get_latency())
+
+        product = self._resolve(product_id)
+        if product is None:
+            raise ProductNotFoundException
+        return product
+
+    def get_products(self, product_ids: Iterable[str]) -> Dict[str, Product]:
+        product_ids = list(dict.fromkeys(map(str, product_ids)))
+        time.sleep(self._get_latency_many(len(product_ids)))
+        return self._resolve_many(product_ids)
+
+    async def aget_product(self, product_id: str) -> Product:
+        await asyncio.sleep(self._get_latency())
+
+        product = self._resolve(product_id)
+        if product is None:
+            raise ProductNotFoundException
+        return product
+
+    async def aget_products(
+        self,
+        product_ids: Iterable[str]
+    ) -> Dict[str, Product]:
+        product_ids = list(dict.fromkeys(map(str, product_ids)))
+        await asyncio.sleep(self._get_latency_many(len(product_ids)))
+        return self._resolve_many(product_ids)
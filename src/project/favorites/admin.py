@@ -1,12 +1,14 @@
 from django.contrib import admin
 from django.forms import forms
 from django.forms.models import ModelForm
+from django.utils import timezone
 
 from project.backends.products.exceptions import (
     ProductException,
     ProductNotFoundException
 )
-from project.extensions.challenge.products.backend import ProductBackend
+from project.backends.products.registry import get_product_backend
+from project.favorites.helpers import bump_favorites_version
 from project.favorites.models import Favorite
 
 
@@ -19,7 +21,10 @@ class FavoriteForm(ModelForm):
         data = self.cleaned_data['product_id']
 
         try:
-            ProductBackend().get_product(product_id=str(data))
+            # Kept to refresh the snapshot when the product is changed
+            self.product = get_product_backend().get_product(
+                product_id=str(data)
+            )
             return data
         except ProductNotFoundException:
             raise forms.ValidationError(
@@ -42,6 +47,11 @@ class FavoriteAdmin(admin.ModelAdmin):
         'updated_at',
     ]
 
+    readonly_fields = [
+        'product_snapshot',
+        'snapshot_at',
+    ]
+
     search_fields = [
         'id',
         'product_id',
@@ -51,3 +61,25 @@ class FavoriteAdmin(admin.ModelAdmin):
 
     list_per_page = 30
     list_max_show_all = 30
+
+    def save_model(self, request, obj, form, change):
+        if 'product_id' in form.changed_data:
+            obj.product_snapshot = form.product.as_dict()
+            obj.snapshot_at = timezone.now()
+        super().save_model(request, obj, form, change)
+        # A favorite moved to another client leaves the listing of the
+        # previous one as well
+        bump_favorites_version(
+            [obj.client_id, form.initial.get('client', obj.client_id)]
+        )
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        bump_favorites_version([obj.client_id])
+
+    def delete_queryset(self, request, queryset):
+        client_ids = list(
+            queryset.order_by().values_list('client_id', flat=True).distinct()
+        )
+        super().delete_queryset(request, queryset)
+        bump_favorites_version(client_ids)
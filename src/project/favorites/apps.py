@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FavoritesConfig(AppConfig):
     name = 'project.favorites'
     verbose_name = 'Favorites'
+
+    def ready(self):
+        from project.favorites import signals  # noqa: F401
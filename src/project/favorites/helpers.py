@@ -1,32 +1,473 @@
-from typing import Dict, List
+import hashlib
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.cache import cache, caches
+from django.db import connections
+from django.db.models import Case, JSONField, Q, Value, When
+from django.db.models.functions import Cast
+from django.utils import timezone
 
 import structlog
+from simple_settings import settings
 
-from project.backends.products.exceptions import ProductNotFoundException
-from project.extensions.challenge.products.backend import ProductBackend
+from project.backends.products.exceptions import ProductException
+from project.backends.products.registry import get_product_backend
+from project.clients.models import Client
 from project.favorites.models import Favorite
 
 logger = structlog.get_logger(__name__)
 
 
+# Writes deferred by the reads of favorites, a single thread keeps them off
+# the request path without piling up connections
+background_executor = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix='favorites-background',
+)
+
+# Snapshots waiting to be written by the background executor
+SNAPSHOTS_BATCH_SIZE = 500
+_pending_snapshots: Dict[str, Tuple[Dict, datetime]] = {}
+_pending_snapshots_lock = threading.Lock()
+
+FAVORITES_VERSION_KEY = 'favorites-version-{client_id}'
+FAVORITES_RESPONSE_KEY = 'favorites-response-{client_id}-{version}-{params}'
+
+
+def bump_favorites_version(client_ids: Iterable) -> None:
+    """
+    Gives a new version to the favorites of the clients, so their cached
+    listings are no longer read. A random version is used instead of a
+    counter so an evicted version can never be reused.
+    """
+    versions = {
+        FAVORITES_VERSION_KEY.format(client_id=client_id): uuid.uuid4().hex
+        for client_id in set(map(str, client_ids))
+    }
+    if versions:
+        cache.set_many(versions, timeout=None)
+
+
+def get_favorites_response_cache_key(
+    client_id: str,
+    cursor: Optional[str],
+    page_size: Optional[str]
+) -> str:
+    key = FAVORITES_VERSION_KEY.format(client_id=client_id)
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+
+    params = hashlib.md5(f'{cursor}:{page_size}'.encode()).hexdigest()
+    return FAVORITES_RESPONSE_KEY.format(
+        client_id=client_id,
+        version=version,
+        params=params
+    )
+
+
+def _is_snapshot_fresh(
+    snapshot_at: Optional[datetime],
+    max_age: int,
+    now: datetime
+) -> bool:
+    if snapshot_at is None:
+        return False
+    return not max_age or now - snapshot_at < timedelta(seconds=max_age)
+
+
+def _delete_favorites(queryset, client_ids: Iterable) -> int:
+    """
+    Deletes the favorites with a single DELETE and bumps the version of the
+    favorites of the clients.
+    """
+    deleted, _ = queryset.delete()
+    if deleted:
+        bump_favorites_version(client_ids)
+    return deleted
+
+
+def update_products_snapshots(
+    snapshots: Dict[str, Tuple[Dict, datetime]]
+) -> None:
+    """
+    Stores the given products, with the time they were fetched, as the
+    snapshot of the favorites pointing to them in a single UPDATE ... CASE.
+    The values are cast so the CASE is typed as the column on PostgreSQL.
+    """
+    product_ids = list(snapshots)
+    Favorite.objects.filter(product_id__in=product_ids).update(
+        product_snapshot=Case(*[
+            When(
+                product_id=product_id,
+                then=Cast(
+                    Value(product, output_field=JSONField()),
+                    output_field=JSONField()
+                )
+            )
+            for product_id, (product, _) in snapshots.items()
+        ]),
+        snapshot_at=Case(*[
+            When(product_id=product_id, then=Value(snapshot_at))
+            for product_id, (_, snapshot_at) in snapshots.items()
+        ])
+    )
+
+
+def _flush_products_snapshots() -> None:
+    with _pending_snapshots_lock:
+        snapshots = dict(_pending_snapshots)
+        _pending_snapshots.clear()
+
+    try:
+        product_ids = list(snapshots)
+        for start in range(0, len(product_ids), SNAPSHOTS_BATCH_SIZE):
+            update_products_snapshots({
+                product_id: snapshots[product_id]
+                for product_id in product_ids[
+                    start:start + SNAPSHOTS_BATCH_SIZE
+                ]
+            })
+    except Exception:
+        logger.exception(
+            'Failed to update the products snapshots of the favorites',
+            product_ids=list(snapshots)
+        )
+    finally:
+        connections.close_all()
+
+
+def schedule_products_snapshots(
+    products: Dict[str, Dict],
+    snapshot_at: datetime
+) -> None:
+    """
+    Queues the update of the snapshots of the given products. The products
+    waiting to be written are coalesced, so at most one update is pending in
+    the worker whatever the fetch load. They are only kept in memory: a
+    snapshot lost on a restart is written again on the next fetch.
+    """
+    with _pending_snapshots_lock:
+        scheduled = bool(_pending_snapshots)
+        _pending_snapshots.update({
+            product_id: (product, snapshot_at)
+            for product_id, product in products.items()
+        })
+
+    if not scheduled:
+        background_executor.submit(
+            copy_context().run,
+            _flush_products_snapshots
+        )
+
+
+def purge_favorites(favorite_ids: List[str], client_ids: List[str]) -> None:
+    """
+    Deletes the given favorites in a single DELETE ... WHERE id IN (...).
+    """
+    try:
+        deleted = _delete_favorites(
+            Favorite.objects.filter(id__in=favorite_ids),
+            client_ids
+        )
+        logger.info(
+            'Favorites of products that do not exist purged',
+            favorite_ids=favorite_ids,
+            deleted=deleted
+        )
+    except Exception:
+        logger.exception(
+            'Failed to purge the favorites',
+            favorite_ids=favorite_ids
+        )
+    finally:
+        connections.close_all()
+
+
 def get_details_products_favorites(favorites: List[Dict]) -> List:
-    backend = ProductBackend()
+    """
+    Adds the product data to the favorites. The snapshot stored in the
+    favorite is served while it is fresh, the other products are requested
+    to the backend. The snapshots are not written here, the backend may
+    answer with cached data: they are updated when the products are fetched
+    from their source (see `products_fetched`). The favorites of products
+    that no longer exist are left out and purged in background.
+    """
+    max_age = settings.FAVORITES['snapshot']['max_age']
+    now = timezone.now()
 
-    for index, favorite in enumerate(favorites):
-        product_id = favorite['product_id']
-        client_id = str(favorite['client_id'])
-        favorite_id = favorite['id']
+    product_ids = []
+    for favorite in favorites:
+        snapshot = favorite.pop('product_snapshot', None)
+        snapshot_at = favorite.pop('snapshot_at', None)
+        if snapshot and _is_snapshot_fresh(snapshot_at, max_age, now):
+            favorite['product'] = snapshot
+        else:
+            product_ids.append(str(favorite['product_id']))
 
-        try:
-            product_interface = backend.get_product(product_id)
-            favorite['product'] = product_interface.as_dict()
-        except ProductNotFoundException:
+    products = {}
+    if product_ids:
+        backend = get_product_backend()
+        products = {
+            product_id: product.as_dict()
+            for product_id, product in backend.get_products(
+                product_ids
+            ).items()
+        }
+
+    favorites_details = []
+    dead_favorite_ids = []
+    dead_client_ids = set()
+    for favorite in favorites:
+        if 'product' in favorite:
+            favorites_details.append(favorite)
+            continue
+
+        product_id = str(favorite['product_id'])
+        product = products.get(product_id)
+        if product is None:
             logger.info(
                 'Removing the favorite because the product does not exist',
                 product_id=product_id,
-                client_id=client_id
+                client_id=str(favorite['client_id'])
+            )
+            dead_favorite_ids.append(str(favorite['id']))
+            dead_client_ids.add(str(favorite['client_id']))
+            continue
+
+        favorite['product'] = product
+        favorites_details.append(favorite)
+
+    if dead_favorite_ids:
+        background_executor.submit(
+            copy_context().run,
+            purge_favorites,
+            dead_favorite_ids,
+            list(dead_client_ids)
+        )
+
+    return favorites_details
+
+
+FAVORITE_CREATED = 'created'
+FAVORITE_EXISTS = 'already_exists'
+FAVORITE_PRODUCT_NOT_FOUND = 'product_not_found'
+
+
+def bulk_create_favorites(client: Client, product_ids: List) -> List[Dict]:
+    """
+    Adds the given products to the favorites of the client. The existing
+    favorites are found with one query, the other products are validated
+    with one lookup on the backend and inserted with one INSERT. Returns the
+    result of each product in the order they were given.
+    """
+    product_ids = list(dict.fromkeys(map(str, product_ids)))
+
+    def _get_favorite_ids() -> Dict[str, str]:
+        return {
+            str(product_id): str(favorite_id)
+            for favorite_id, product_id in Favorite.objects.filter(
+                client=client,
+                product_id__in=product_ids
+            ).values_list('id', 'product_id')
+        }
+
+    favorite_ids = _get_favorite_ids()
+    existing = set(favorite_ids)
+
+    new_product_ids = [
+        product_id
+        for product_id in product_ids
+        if product_id not in existing
+    ]
+    products = {}
+    if new_product_ids:
+        products = get_product_backend().get_products(new_product_ids)
+
+    if products:
+        now = timezone.now()
+        Favorite.objects.bulk_create(
+            [
+                Favorite(
+                    client=client,
+                    product_id=product_id,
+                    product_snapshot=product.as_dict(),
+                    snapshot_at=now
+                )
+                for product_id, product in products.items()
+            ],
+            ignore_conflicts=True
+        )
+        bump_favorites_version([client.pk])
+        # The ids of the rows inserted by concurrent requests are only known
+        # after reading them back, the conflicting inserts were ignored
+        favorite_ids = _get_favorite_ids()
+
+    results = []
+    for product_id in product_ids:
+        if product_id in existing:
+            status = FAVORITE_EXISTS
+        elif product_id in favorite_ids:
+            status = FAVORITE_CREATED
+        else:
+            status = FAVORITE_PRODUCT_NOT_FOUND
+        results.append({
+            'product_id': product_id,
+            'favorite_id': favorite_ids.get(product_id),
+            'status': status,
+        })
+
+    logger.info(
+        'Favorites created in bulk',
+        client_id=str(client.pk),
+        created=sum(
+            result['status'] == FAVORITE_CREATED for result in results
+        )
+    )
+    return results
+
+
+def bulk_delete_favorites(
+    client: Client,
+    favorite_ids: List,
+    product_ids: List
+) -> int:
+    """
+    Removes the favorites of the client matching the given favorite ids or
+    product ids in a single DELETE. Returns the number of favorites removed.
+    """
+    deleted = _delete_favorites(
+        Favorite.objects.filter(
+            Q(id__in=favorite_ids) | Q(product_id__in=product_ids),
+            client=client
+        ),
+        [client.pk]
+    )
+
+    logger.info(
+        'Favorites removed in bulk',
+        client_id=str(client.pk),
+        deleted=deleted
+    )
+    return deleted
+
+
+WARM_UP_LOCK_KEY = 'products-warm-up'
+WARM_UP_LOCK_TIMEOUT = 300
+
+
+def _iter_favorites_product_ids(batch_size: int) -> Iterator[List[str]]:
+    """
+    Streams the distinct product ids of the favorites in batches. The
+    default ordering is cleared so the DISTINCT applies to the id only.
+    """
+    product_ids = (
+        Favorite.objects
+        .order_by()
+        .values_list('product_id', flat=True)
+        .distinct()
+        .iterator(chunk_size=batch_size)
+    )
+    while True:
+        batch = [str(product_id) for product_id in islice(
+            product_ids,
+            batch_size
+        )]
+        if not batch:
+            return
+        yield batch
+
+
+def warm_up_products_cache(
+    batch_size: int,
+    rate: float = 0,
+    on_progress: Optional[Callable[[int, int, float], None]] = None
+) -> Tuple[int, int, float]:
+    """
+    Prefetches the products of all favorites into the product cache. Each
+    batch is resolved by the backend, which fetches the cache misses with
+    its bounded concurrency. When `rate` is set, at most `rate` products per
+    second are requested. Returns the products processed, the ones that
+    failed and the elapsed time.
+    """
+    backend = get_product_backend()
+    processed = 0
+    failed = 0
+    started_at = time.monotonic()
+
+    for product_ids in _iter_favorites_product_ids(batch_size):
+        try:
+            backend.get_products(product_ids)
+        except ProductException as exc:
+            failed += len(product_ids)
+            logger.warning(
+                'Failed to warm up the products cache batch',
+                product_ids=product_ids,
+                error_message=str(exc)
             )
-            Favorite.objects.get(pk=favorite_id).delete()
-            favorites.pop(index)
+        processed += len(product_ids)
+
+        elapsed = time.monotonic() - started_at
+        if rate and processed / rate > elapsed:
+            time.sleep(processed / rate - elapsed)
+            elapsed = time.monotonic() - started_at
+
+        logger.info(
+            'Products cache warm-up progress',
+            processed=processed,
+            failed=failed,
+            throughput=round(processed / elapsed, 2) if elapsed else None,
+        )
+        if on_progress:
+            on_progress(processed, failed, elapsed)
+
+    return processed, failed, time.monotonic() - started_at
+
+
+def _warm_up_products_cache_in_background(batch_size: int, rate: float):
+    try:
+        warm_up_products_cache(batch_size=batch_size, rate=rate)
+    except Exception:
+        logger.exception('Products cache warm-up on startup failed')
+    finally:
+        connections.close_all()
+
+
+def warm_up_products_cache_on_startup() -> Optional[threading.Thread]:
+    """
+    Starts the warm-up of the products cache in background when enabled by
+    the settings. The cache is shared, so only the first worker to take the
+    lock does it.
+    """
+    warm_up_settings = settings.EXTENSIONS_CONFIG['challenge']['warm_up']
+    if not warm_up_settings['on_startup']:
+        return None
+
+    if not caches['concurrent'].add(
+        WARM_UP_LOCK_KEY,
+        1,
+        timeout=WARM_UP_LOCK_TIMEOUT
+    ):
+        return None
 
-    return favorites
+    logger.info('Starting the products cache warm-up in background')
+    thread = threading.Thread(
+        target=_warm_up_products_cache_in_background,
+        kwargs={
+            'batch_size': warm_up_settings['batch_size'],
+            'rate': warm_up_settings['rate'],
+        },
+        name='products-warm-up',
+        daemon=True,
+    )
+    thread.start()
+    return thread
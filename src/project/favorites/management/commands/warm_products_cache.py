@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+
+from simple_settings import settings
+
+from project.favorites.helpers import warm_up_products_cache
+
+
+class Command(BaseCommand):
+    help = (
+        'Prefetches the products of all favorites into the product cache, '
+        'useful after a deploy or a flush of Redis'
+    )
+
+    def add_arguments(self, parser):
+        warm_up_settings = settings.EXTENSIONS_CONFIG['challenge']['warm_up']
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=warm_up_settings['batch_size'],
+            help='Number of products requested to the backend at a time'
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=warm_up_settings['rate'],
+            help='Maximum number of products per second, 0 is unlimited'
+        )
+
+    def _write_progress(self, processed: int, failed: int, elapsed: float):
+        throughput = processed / elapsed if elapsed else 0
+        self.stdout.write(
+            f'{processed} products processed ({failed} failed), '
+            f'{throughput:.1f} products/s'
+        )
+
+    def handle(self, *args, **options):
+        processed, failed, elapsed = warm_up_products_cache(
+            batch_size=options['batch_size'],
+            rate=options['rate'],
+            on_progress=self._write_progress,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{processed} products warmed up ({failed} failed) in '
+                f'{elapsed:.1f}s'
+            )
+        )
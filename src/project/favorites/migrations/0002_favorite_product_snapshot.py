@@ -0,0 +1,23 @@
+# Generated by Django 3.2 on 2026-10-18 17:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('favorites', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='favorite',
+            name='product_snapshot',
+            field=models.JSONField(blank=True, help_text='Product data stored to list the favorites without querying the products backend', null=True, verbose_name='Product snapshot'),
+        ),
+        migrations.AddField(
+            model_name='favorite',
+            name='snapshot_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Snapshot at'),
+        ),
+    ]
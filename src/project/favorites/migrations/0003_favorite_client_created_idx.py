@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('favorites', '0002_favorite_product_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='favorite',
+            index=models.Index(fields=['client', '-created_at', 'id'], name='favorite_client_created_idx'),
+        ),
+    ]
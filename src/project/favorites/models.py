@@ -18,6 +18,18 @@ class Favorite(BaseModel):
         related_name='favorite_client',
         on_delete=models.PROTECT
     )
+    product_snapshot = models.JSONField(
+        verbose_name='Product snapshot',
+        null=True,
+        blank=True,
+        help_text='Product data stored to list the favorites without '
+                  'querying the products backend'
+    )
+    snapshot_at = models.DateTimeField(
+        verbose_name='Snapshot at',
+        null=True,
+        blank=True
+    )
 
     class Meta:
         app_label = 'favorites'
@@ -25,3 +37,9 @@ class Favorite(BaseModel):
         verbose_name_plural = 'Favorites'
         ordering = ['-created_at']
         unique_together = ('product_id', 'client',)
+        indexes = [
+            models.Index(
+                fields=['client', '-created_at', 'id'],
+                name='favorite_client_created_idx'
+            ),
+        ]
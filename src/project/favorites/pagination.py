@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+from simple_settings import settings
+
+
+class FavoriteCursorPagination(CursorPagination):
+    """
+    Keyset pagination of the favorites of a client, the ordering follows the
+    (client_id, created_at DESC, id) index so each page is an index range
+    scan no matter how deep the cursor is.
+    """
+
+    ordering = ('-created_at', 'id')
+    page_size = settings.FAVORITES['pagination']['page_size']
+    page_size_query_param = 'page_size'
+    max_page_size = settings.FAVORITES['pagination']['max_page_size']
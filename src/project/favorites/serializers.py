@@ -1,13 +1,17 @@
+from django.utils import timezone
+
 from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
+from simple_settings import settings
 
 from project.backends.products.exceptions import (
     ProductException,
     ProductNotFoundException
 )
+from project.backends.products.registry import get_product_backend
 from project.backends.products.serializers import ProductSerializer
 from project.clients.models import Client
-from project.extensions.challenge.products.backend import ProductBackend
+from project.favorites.helpers import bump_favorites_version
 from project.favorites.models import Favorite
 
 
@@ -17,11 +21,10 @@ class FavoriteCreateSerializer(ModelSerializer):
         queryset=Client.objects
     )
 
-    @staticmethod
-    def validate_product_id(value):
+    def validate_product_id(self, value):
         try:
-            backend = ProductBackend()
-            backend.get_product(value)
+            backend = get_product_backend()
+            self._product = backend.get_product(value)
         except ProductNotFoundException:
             raise serializers.ValidationError(
                 detail='Informed product does not exist in the database',
@@ -35,15 +38,68 @@ class FavoriteCreateSerializer(ModelSerializer):
 
         return value
 
+    def create(self, validated_data):
+        validated_data['product_snapshot'] = self._product.as_dict()
+        validated_data['snapshot_at'] = timezone.now()
+        favorite = super().create(validated_data)
+        bump_favorites_version([favorite.client_id])
+        return favorite
+
     class Meta:
         model = Favorite
         fields = ('id', 'client_id', 'product_id', 'created_at', 'updated_at')
         read_only_fields = ['id']
 
 
+class FavoriteBulkCreateSerializer(serializers.Serializer):
+    client_id = serializers.PrimaryKeyRelatedField(
+        source='client',
+        queryset=Client.objects
+    )
+    product_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=settings.FAVORITES['bulk']['max_size']
+    )
+
+
+class FavoriteBulkDestroySerializer(serializers.Serializer):
+    client_id = serializers.PrimaryKeyRelatedField(
+        source='client',
+        queryset=Client.objects
+    )
+    favorite_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        default=list,
+        max_length=settings.FAVORITES['bulk']['max_size']
+    )
+    product_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        default=list,
+        max_length=settings.FAVORITES['bulk']['max_size']
+    )
+
+    def validate(self, attrs):
+        if not attrs['favorite_ids'] and not attrs['product_ids']:
+            raise serializers.ValidationError(
+                detail='Inform the favorite_ids or the product_ids to remove',
+                code='required'
+            )
+        return attrs
+
+
 class FavoriteDetailSerializer(ModelSerializer):
+    client_id = serializers.UUIDField(read_only=True)
     product = ProductSerializer(read_only=True)
 
     class Meta:
         model = Favorite
-        fields = ['id', 'client_id', 'product_id', 'product']
+        fields = ['id', 'client_id', 'product_id', 'created_at', 'product']
+
+
+class FavoriteDetailPageSerializer(serializers.Serializer):
+    next = serializers.URLField(allow_null=True)
+    previous = serializers.URLField(allow_null=True)
+    results = FavoriteDetailSerializer(many=True)
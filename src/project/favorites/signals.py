@@ -0,0 +1,34 @@
+from django.dispatch import receiver
+
+from project.backends.products.signals import (
+    products_fetched,
+    products_invalidated
+)
+from project.favorites.helpers import (
+    bump_favorites_version,
+    schedule_products_snapshots
+)
+from project.favorites.models import Favorite
+
+
+@receiver(products_invalidated)
+def expire_products_favorites(sender, product_ids, **kwargs):
+    """
+    Expires the snapshots of the invalidated products, so the next listings
+    request them to the backend, and the cached listings that hold them.
+    """
+    favorites = Favorite.objects.filter(product_id__in=product_ids)
+    favorites.update(snapshot_at=None)
+    bump_favorites_version(
+        favorites.order_by().values_list('client_id', flat=True).distinct()
+    )
+
+
+@receiver(products_fetched)
+def snapshot_fetched_products(sender, products, fetched_at, **kwargs):
+    """
+    Stores the products fetched from their source as the snapshot of the
+    favorites, stamped with the time they were fetched. Products read from
+    a cache are never written, so a snapshot is never fresher than its data.
+    """
+    schedule_products_snapshots(products, fetched_at)
@@ -1,6 +1,15 @@
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from django.contrib.admin.sites import AdminSite
+from django.utils import timezone
+
 import pytest
+from model_bakery import baker
 
+from project.backends.products.interfaces import Product
 from project.favorites.admin import FavoriteAdmin
+from project.favorites.models import Favorite
 
 
 class TestAdmin:
@@ -28,3 +37,100 @@ class TestAdmin:
         pytest.assume(search_fields == search_fields_expected)
         pytest.assume(list_per_page == 30)
         pytest.assume(list_max_show_all == 30)
+
+
+@pytest.mark.django_db
+class TestAdminFavoritesVersion:
+    @pytest.fixture()
+    def model_admin(self):
+        return FavoriteAdmin(Favorite, AdminSite())
+
+    @pytest.fixture()
+    def mock_bump_favorites_version(self):
+        with patch(
+            'project.favorites.admin.bump_favorites_version'
+        ) as mock:
+            yield mock
+
+    def test_should_bump_the_version_of_the_clients_when_favorite_is_saved(
+        self,
+        model_admin,
+        mock_bump_favorites_version,
+    ):
+        favorite = baker.prepare('Favorite', client=baker.make('Client'))
+        previous = baker.make('Client')
+        form = Mock(initial={'client': previous.id}, changed_data=[])
+
+        model_admin.save_model(Mock(), favorite, form, change=True)
+
+        mock_bump_favorites_version.assert_called_once_with(
+            [favorite.client_id, previous.id]
+        )
+
+    def test_should_replace_the_snapshot_when_product_is_changed(
+        self,
+        model_admin,
+        mock_bump_favorites_version,
+    ):
+        favorite = baker.make(
+            'Favorite',
+            product_snapshot={'title': 'Previous product'},
+            snapshot_at=timezone.now() - timedelta(days=1),
+        )
+        product_id = '1bf0f365-fbdd-4e21-9786-da459d78dd1f'
+        product = Product(
+            id=product_id,
+            title='Moisés Dorel Windoo 1529',
+            price=1149.0,
+            image='http://challenge-api.luizalabs.com/images/6.jpg',
+            brand='bébé confort',
+        )
+        with patch(
+            'project.favorites.admin.get_product_backend'
+        ) as mock_get_product_backend:
+            mock_get_product_backend.return_value.get_product.return_value = (
+                product
+            )
+            form = model_admin.get_form(Mock(), favorite)(
+                data={
+                    'client': favorite.client_id,
+                    'product_id': product_id,
+                },
+                instance=favorite
+            )
+            pytest.assume(form.is_valid())
+
+        snapshot_at = favorite.snapshot_at
+        model_admin.save_model(Mock(), form.save(commit=False), form, True)
+
+        favorite.refresh_from_db()
+        pytest.assume(favorite.product_snapshot == product.as_dict())
+        pytest.assume(favorite.snapshot_at > snapshot_at)
+
+    def test_should_bump_the_version_of_the_client_when_favorite_is_deleted(
+        self,
+        model_admin,
+        mock_bump_favorites_version,
+    ):
+        favorite = baker.make('Favorite')
+
+        model_admin.delete_model(Mock(), favorite)
+
+        mock_bump_favorites_version.assert_called_once_with(
+            [favorite.client_id]
+        )
+
+    def test_should_bump_the_version_of_the_clients_of_the_deleted_favorites(
+        self,
+        model_admin,
+        mock_bump_favorites_version,
+    ):
+        favorites = baker.make('Favorite', _quantity=2)
+
+        model_admin.delete_queryset(Mock(), Favorite.objects.all())
+
+        pytest.assume(Favorite.objects.count() == 0)
+        pytest.assume(
+            sorted(mock_bump_favorites_version.call_args.args[0]) ==
+            sorted(favorite.client_id for favorite in favorites)
+        )
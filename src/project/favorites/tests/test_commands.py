@@ -0,0 +1,41 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+import pytest
+
+
+class TestWarmProductsCacheCommand:
+
+    @pytest.fixture
+    def mock_warm_up(self):
+        with patch(
+            'project.favorites.management.commands.warm_products_cache.'
+            'warm_up_products_cache'
+        ) as mock:
+            mock.return_value = (10, 1, 2.0)
+            yield mock
+
+    def test_should_warm_up_the_cache_with_the_given_options(
+        self,
+        mock_warm_up,
+    ):
+        out = StringIO()
+
+        call_command(
+            'warm_products_cache',
+            batch_size=50,
+            rate=20,
+            stdout=out
+        )
+
+        assert mock_warm_up.call_args.kwargs['batch_size'] == 50
+        assert mock_warm_up.call_args.kwargs['rate'] == 20
+        assert '10 products warmed up (1 failed) in 2.0s' in out.getvalue()
+
+    def test_should_use_the_settings_as_default_options(self, mock_warm_up):
+        call_command('warm_products_cache', stdout=StringIO())
+
+        assert mock_warm_up.call_args.kwargs['batch_size'] == 100
+        assert mock_warm_up.call_args.kwargs['rate'] == 0
@@ -1,11 +1,27 @@
-from unittest.mock import Mock, patch
+from datetime import timedelta
+from unittest.mock import ANY, Mock, patch
+
+from django.utils import timezone
 
 import pytest
 from model_bakery import baker
 
-from project.backends.products.exceptions import ProductNotFoundException
+from project.backends.products.exceptions import ProductTimeoutException
 from project.backends.products.interfaces import Product
-from project.favorites.helpers import get_details_products_favorites
+from project.favorites.helpers import (
+    _flush_products_snapshots,
+    _pending_snapshots,
+    bulk_create_favorites,
+    bulk_delete_favorites,
+    bump_favorites_version,
+    get_details_products_favorites,
+    get_favorites_response_cache_key,
+    purge_favorites,
+    schedule_products_snapshots,
+    update_products_snapshots,
+    warm_up_products_cache,
+    warm_up_products_cache_on_startup
+)
 from project.favorites.models import Favorite
 
 
@@ -24,15 +40,23 @@ class TestGetDetailsProductsFavorites:
     @pytest.fixture()
     def mock_get_product(self, product_interface):
         with patch(
-            'project.favorites.helpers.ProductBackend'
+            'project.favorites.helpers.get_product_backend'
         ) as mock:
             mock_return_value = Mock()
-            mock_return_value.get_product = Mock(
-                return_value=product_interface
+            mock_return_value.get_products = Mock(
+                return_value={product_interface.id: product_interface}
             )
             mock.return_value = mock_return_value
             yield mock
 
+    @pytest.fixture(autouse=True)
+    def mock_background_executor(self):
+        with patch(
+            'project.favorites.helpers.background_executor'
+        ) as mock:
+            yield mock
+        _pending_snapshots.clear()
+
     @pytest.fixture()
     def client_model(self):
         yield baker.make(
@@ -82,22 +106,83 @@ class TestGetDetailsProductsFavorites:
         favorites_detail = get_details_products_favorites(favorites_list)
 
         assert favorites_expected == favorites_detail
-        mock_get_product.return_value.get_product.assert_called_once_with(
-            '6a512e6c-6627-d286-5d18-583558359ab6'
+        mock_get_product.return_value.get_products.assert_called_once_with(
+            ['6a512e6c-6627-d286-5d18-583558359ab6']
+        )
+
+    def test_should_serve_the_fresh_snapshot_without_requesting_the_backend(  # noqa
+        self,
+        mock_get_product,
+        mock_background_executor,
+        product_interface,
+        favorites_list,
+    ):
+        favorites_list[0]['product_snapshot'] = product_interface.as_dict()
+        favorites_list[0]['snapshot_at'] = timezone.now()
+
+        favorites_detail = get_details_products_favorites(favorites_list)
+
+        assert favorites_detail == [{
+            'id': 'ff31f647-f872-4e70-b886-fd3071cd2788',
+            'client_id': favorites_list[0]['client_id'],
+            'product_id': '6a512e6c-6627-d286-5d18-583558359ab6',
+            'product': product_interface.as_dict(),
+        }]
+        mock_get_product.return_value.get_products.assert_not_called()
+        mock_background_executor.submit.assert_not_called()
+
+    def test_should_request_the_stale_snapshot_without_writing_it(
+        self,
+        mock_get_product,
+        mock_background_executor,
+        product_interface,
+        favorites_list,
+    ):
+        favorites_list[0]['product_snapshot'] = {'title': 'Old title'}
+        favorites_list[0]['snapshot_at'] = (
+            timezone.now() - timedelta(hours=2)
+        )
+
+        favorites_detail = get_details_products_favorites(favorites_list)
+
+        assert favorites_detail[0]['product'] == product_interface.as_dict()
+        assert 'snapshot_at' not in favorites_detail[0]
+        mock_get_product.return_value.get_products.assert_called_once_with(
+            ['6a512e6c-6627-d286-5d18-583558359ab6']
         )
+        mock_background_executor.submit.assert_not_called()
+        assert _pending_snapshots == {}
 
-    def test_should_validate_that_favorite_has_been_deleted_when_product_does_not_exist(  # noqa
+    def test_should_serve_any_snapshot_when_there_is_no_threshold(
         self,
         mock_get_product,
+        favorites_list,
+    ):
+        favorites_list[0]['product_snapshot'] = {'title': 'Old title'}
+        favorites_list[0]['snapshot_at'] = (
+            timezone.now() - timedelta(days=30)
+        )
+
+        with patch.dict(
+            'project.favorites.helpers.settings.FAVORITES',
+            {'snapshot': {'max_age': 0}}
+        ):
+            favorites_detail = get_details_products_favorites(favorites_list)
+
+        assert favorites_detail[0]['product'] == {'title': 'Old title'}
+        mock_get_product.return_value.get_products.assert_not_called()
+
+    def test_should_schedule_the_purge_of_the_favorite_when_product_does_not_exist(  # noqa
+        self,
+        mock_get_product,
+        mock_background_executor,
         product_interface,
         favorite_model,
         favorites_list,
         client_model,
     ):
         mock_return_value = Mock()
-        mock_return_value.get_product = Mock(
-            side_effect=ProductNotFoundException
-        )
+        mock_return_value.get_products = Mock(return_value={})
         mock_get_product.return_value = mock_return_value
 
         with patch(
@@ -106,9 +191,474 @@ class TestGetDetailsProductsFavorites:
             favorites_detail = get_details_products_favorites(favorites_list)
 
         assert favorites_detail == []
-        assert Favorite.objects.count() == 0
+        assert Favorite.objects.count() == 1
+        mock_background_executor.submit.assert_called_once_with(
+            ANY,
+            purge_favorites,
+            ['ff31f647-f872-4e70-b886-fd3071cd2788'],
+            [str(client_model.id)]
+        )
         mock_logger.info.assert_called_once_with(
             'Removing the favorite because the product does not exist',
             product_id='6a512e6c-6627-d286-5d18-583558359ab6',
             client_id=str(client_model.id)
         )
+
+
+class TestFavoritesResponseCacheKey:
+    client_id = 'f322a1a6-e07e-4f53-991d-ff73eff9484d'
+
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings):
+        settings.CACHES = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            },
+        }
+
+    def test_should_keep_the_key_while_the_version_is_not_bumped(self):
+        key = get_favorites_response_cache_key(self.client_id, None, None)
+
+        pytest.assume(
+            get_favorites_response_cache_key(self.client_id, None, None) ==
+            key
+        )
+        pytest.assume(
+            get_favorites_response_cache_key(self.client_id, 'abc', None) !=
+            key
+        )
+
+    def test_should_change_the_key_when_the_version_is_bumped(self):
+        key = get_favorites_response_cache_key(self.client_id, None, None)
+
+        bump_favorites_version([self.client_id])
+
+        assert get_favorites_response_cache_key(
+            self.client_id,
+            None,
+            None
+        ) != key
+
+    @pytest.mark.django_db
+    def test_should_change_the_key_when_favorites_are_deleted_in_bulk(self):
+        favorite = baker.make('Favorite', client__id=self.client_id)
+        key = get_favorites_response_cache_key(self.client_id, None, None)
+
+        bulk_delete_favorites(
+            favorite.client,
+            favorite_ids=[favorite.id],
+            product_ids=[]
+        )
+
+        assert get_favorites_response_cache_key(
+            self.client_id,
+            None,
+            None
+        ) != key
+
+
+class TestScheduleProductsSnapshots:
+    @pytest.fixture(autouse=True)
+    def mock_background_executor(self):
+        with patch(
+            'project.favorites.helpers.background_executor'
+        ) as mock:
+            yield mock
+        _pending_snapshots.clear()
+
+    def test_should_coalesce_the_pending_snapshots_updates(
+        self,
+        mock_background_executor,
+    ):
+        product_id = '6a512e6c-6627-d286-5d18-583558359ab6'
+        fetched_at = timezone.now()
+
+        schedule_products_snapshots(
+            {product_id: {'title': 'Old title'}},
+            fetched_at - timedelta(minutes=1)
+        )
+        schedule_products_snapshots(
+            {product_id: {'title': 'New title'}},
+            fetched_at
+        )
+
+        mock_background_executor.submit.assert_called_once_with(
+            ANY,
+            _flush_products_snapshots
+        )
+        assert _pending_snapshots == {
+            product_id: ({'title': 'New title'}, fetched_at)
+        }
+
+
+@pytest.mark.django_db
+class TestUpdateProductsSnapshots:
+    def test_should_store_the_snapshots_of_the_products_in_one_query(
+        self,
+        django_assert_num_queries,
+    ):
+        product_ids = [
+            '6a512e6c-6627-d286-5d18-583558359ab6',
+            '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+        ]
+        favorites = [
+            baker.make('Favorite', product_id=product_id)
+            for product_id in product_ids * 2
+        ]
+        other = baker.make(
+            'Favorite',
+            product_id='58ec015c-cfcf-258d-c6df-1721de0ab6ea'
+        )
+        snapshot_at = timezone.now()
+
+        with django_assert_num_queries(1):
+            update_products_snapshots({
+                product_id: ({'title': product_id}, snapshot_at)
+                for product_id in product_ids
+            })
+
+        for favorite in favorites:
+            favorite.refresh_from_db()
+            pytest.assume(favorite.product_snapshot == {
+                'title': str(favorite.product_id)
+            })
+            pytest.assume(favorite.snapshot_at == snapshot_at)
+        other.refresh_from_db()
+        pytest.assume(other.product_snapshot is None)
+
+    def test_should_flush_the_pending_snapshots(self):
+        product_id = '6a512e6c-6627-d286-5d18-583558359ab6'
+        favorite = baker.make('Favorite', product_id=product_id)
+        _pending_snapshots[product_id] = (
+            {'title': 'New title'},
+            timezone.now()
+        )
+
+        with patch('project.favorites.helpers.connections'):
+            _flush_products_snapshots()
+
+        favorite.refresh_from_db()
+        pytest.assume(favorite.product_snapshot == {'title': 'New title'})
+        pytest.assume(_pending_snapshots == {})
+
+
+@pytest.mark.django_db
+class TestPurgeFavorites:
+    def test_should_delete_the_given_favorites_in_one_query(
+        self,
+        django_assert_num_queries,
+    ):
+        favorites = baker.make('Favorite', _quantity=2)
+        other = baker.make('Favorite')
+
+        with patch('project.favorites.helpers.connections'):
+            with django_assert_num_queries(1):
+                purge_favorites(
+                    [str(favorite.id) for favorite in favorites],
+                    [str(favorites[0].client_id)]
+                )
+
+        assert list(Favorite.objects.all()) == [other]
+
+
+@pytest.mark.django_db
+class TestBulkCreateFavorites:
+    @pytest.fixture()
+    def products(self):
+        return {
+            product_id: Product(
+                id=product_id,
+                price=10.0,
+                image=f'http://challenge-api.luizalabs.com/images/{i}.jpg',
+                brand='brand',
+                title=f'Product {i}'
+            )
+            for i, product_id in enumerate([
+                '6a512e6c-6627-d286-5d18-583558359ab6',
+                '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+            ])
+        }
+
+    @pytest.fixture()
+    def mock_backend(self, products):
+        with patch(
+            'project.favorites.helpers.get_product_backend'
+        ) as mock:
+            mock.return_value.get_products.return_value = products
+            yield mock.return_value
+
+    @pytest.fixture()
+    def client_model(self):
+        return baker.make('Client')
+
+    @pytest.fixture()
+    def existing(self, client_model):
+        return baker.make(
+            'Favorite',
+            client=client_model,
+            product_id='58ec015c-cfcf-258d-c6df-1721de0ab6ea'
+        )
+
+    def test_should_return_the_result_of_each_product(
+        self,
+        mock_backend,
+        client_model,
+        existing,
+        django_assert_num_queries,
+    ):
+        product_ids = [
+            '58ec015c-cfcf-258d-c6df-1721de0ab6ea',
+            '6a512e6c-6627-d286-5d18-583558359ab6',
+            '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+            '6a512e6c-6627-d286-5d18-583558359ab6',
+            'a96cc2be-5f5e-4a5c-b4a4-4e2b0b3b0f7f',
+        ]
+
+        with django_assert_num_queries(3):
+            results = bulk_create_favorites(client_model, product_ids)
+
+        favorite_ids = {
+            str(product_id): str(favorite_id)
+            for favorite_id, product_id in Favorite.objects.values_list(
+                'id',
+                'product_id'
+            )
+        }
+        assert results == [
+            {
+                'product_id': '58ec015c-cfcf-258d-c6df-1721de0ab6ea',
+                'favorite_id': str(existing.id),
+                'status': 'already_exists',
+            },
+            {
+                'product_id': '6a512e6c-6627-d286-5d18-583558359ab6',
+                'favorite_id': favorite_ids[
+                    '6a512e6c-6627-d286-5d18-583558359ab6'
+                ],
+                'status': 'created',
+            },
+            {
+                'product_id': '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+                'favorite_id': favorite_ids[
+                    '1bf0f365-fbdd-4e21-9786-da459d78dd1f'
+                ],
+                'status': 'created',
+            },
+            {
+                'product_id': 'a96cc2be-5f5e-4a5c-b4a4-4e2b0b3b0f7f',
+                'favorite_id': None,
+                'status': 'product_not_found',
+            },
+        ]
+        mock_backend.get_products.assert_called_once_with([
+            '6a512e6c-6627-d286-5d18-583558359ab6',
+            '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+            'a96cc2be-5f5e-4a5c-b4a4-4e2b0b3b0f7f',
+        ])
+
+    def test_should_store_the_snapshot_of_the_created_favorites(
+        self,
+        mock_backend,
+        client_model,
+        products,
+    ):
+        bulk_create_favorites(client_model, list(products))
+
+        favorite = Favorite.objects.get(
+            product_id='6a512e6c-6627-d286-5d18-583558359ab6'
+        )
+        pytest.assume(favorite.product_snapshot == products[
+            '6a512e6c-6627-d286-5d18-583558359ab6'
+        ].as_dict())
+        pytest.assume(favorite.snapshot_at is not None)
+
+    def test_should_not_request_the_backend_when_all_favorites_exist(
+        self,
+        mock_backend,
+        client_model,
+        existing,
+    ):
+        results = bulk_create_favorites(
+            client_model,
+            [existing.product_id]
+        )
+
+        assert results[0]['status'] == 'already_exists'
+        mock_backend.get_products.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestBulkDeleteFavorites:
+    @pytest.fixture()
+    def client_model(self):
+        return baker.make('Client')
+
+    @pytest.fixture()
+    def favorites(self, client_model):
+        return baker.make('Favorite', client=client_model, _quantity=3)
+
+    def test_should_delete_by_favorite_or_product_in_one_query(
+        self,
+        client_model,
+        favorites,
+        django_assert_num_queries,
+    ):
+        with django_assert_num_queries(1):
+            deleted = bulk_delete_favorites(
+                client_model,
+                favorite_ids=[favorites[0].id],
+                product_ids=[favorites[1].product_id]
+            )
+
+        assert deleted == 2
+        assert list(Favorite.objects.all()) == [favorites[2]]
+
+    def test_should_not_delete_the_favorites_of_other_clients(
+        self,
+        client_model,
+    ):
+        other = baker.make('Favorite')
+
+        deleted = bulk_delete_favorites(
+            client_model,
+            favorite_ids=[other.id],
+            product_ids=[other.product_id]
+        )
+
+        assert deleted == 0
+        assert Favorite.objects.filter(pk=other.pk).exists()
+
+
+@pytest.mark.django_db
+class TestWarmUpProductsCache:
+    @pytest.fixture()
+    def mock_backend(self):
+        with patch(
+            'project.favorites.helpers.get_product_backend'
+        ) as mock:
+            yield mock.return_value
+
+    @pytest.fixture()
+    def product_ids(self):
+        return [
+            '6a512e6c-6627-d286-5d18-583558359ab6',
+            '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+            '58ec015c-cfcf-258d-c6df-1721de0ab6ea',
+        ]
+
+    @pytest.fixture()
+    def favorites(self, product_ids):
+        clients = baker.make('Client', _quantity=2)
+        for client in clients:
+            for product_id in product_ids:
+                baker.make('Favorite', client=client, product_id=product_id)
+
+    def test_should_request_each_product_once_in_batches(
+        self,
+        mock_backend,
+        favorites,
+        product_ids,
+    ):
+        on_progress = Mock()
+
+        processed, failed, _ = warm_up_products_cache(
+            batch_size=2,
+            on_progress=on_progress
+        )
+
+        requested = [
+            product_id
+            for call in mock_backend.get_products.call_args_list
+            for product_id in call.args[0]
+        ]
+        pytest.assume(sorted(requested) == sorted(product_ids))
+        pytest.assume(
+            [len(call.args[0])
+             for call in mock_backend.get_products.call_args_list] == [2, 1]
+        )
+        pytest.assume((processed, failed) == (3, 0))
+        pytest.assume(on_progress.call_count == 2)
+
+    def test_should_count_the_failed_batches_and_keep_going(
+        self,
+        mock_backend,
+        favorites,
+    ):
+        mock_backend.get_products.side_effect = [
+            ProductTimeoutException,
+            {},
+        ]
+
+        processed, failed, _ = warm_up_products_cache(batch_size=2)
+
+        assert (processed, failed) == (3, 2)
+
+    def test_should_wait_to_respect_the_rate_limit(
+        self,
+        mock_backend,
+        favorites,
+    ):
+        with patch('project.favorites.helpers.time.sleep') as mock_sleep:
+            warm_up_products_cache(batch_size=3, rate=1)
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(3, abs=0.5)
+
+    def test_should_do_nothing_when_there_are_no_favorites(
+        self,
+        mock_backend,
+    ):
+        assert warm_up_products_cache(batch_size=2)[:2] == (0, 0)
+        mock_backend.get_products.assert_not_called()
+
+
+class TestWarmUpProductsCacheOnStartup:
+    @pytest.fixture()
+    def mock_settings(self):
+        with patch(
+            'project.favorites.helpers.settings'
+        ) as mock:
+            mock.EXTENSIONS_CONFIG = {
+                'challenge': {
+                    'warm_up': {
+                        'on_startup': True,
+                        'batch_size': 100,
+                        'rate': 0,
+                    }
+                }
+            }
+            yield mock
+
+    @pytest.fixture()
+    def mock_thread(self):
+        with patch(
+            'project.favorites.helpers.threading.Thread'
+        ) as mock:
+            yield mock
+
+    def test_should_not_start_when_it_is_disabled(self, mock_thread):
+        assert warm_up_products_cache_on_startup() is None
+        mock_thread.assert_not_called()
+
+    def test_should_start_the_warm_up_in_background_when_it_is_enabled(
+        self,
+        mock_settings,
+        mock_thread,
+    ):
+        thread = warm_up_products_cache_on_startup()
+
+        assert thread == mock_thread.return_value
+        mock_thread.return_value.start.assert_called_once()
+        assert mock_thread.call_args.kwargs['daemon'] is True
+
+    def test_should_not_start_when_another_worker_holds_the_lock(
+        self,
+        mock_settings,
+        mock_thread,
+    ):
+        with patch('project.favorites.helpers.caches') as mock_caches:
+            mock_caches.__getitem__.return_value.add.return_value = False
+
+            assert warm_up_products_cache_on_startup() is None
+
+        mock_thread.assert_not_called()
@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+from django.utils import timezone
+
+import pytest
+from model_bakery import baker
+
+from project.backends.products.signals import (
+    products_fetched,
+    products_invalidated
+)
+from project.favorites.models import Favorite
+
+
+@pytest.mark.django_db
+class TestFavoritesSignals:
+    @pytest.fixture()
+    def mock_bump_favorites_version(self):
+        with patch(
+            'project.favorites.signals.bump_favorites_version'
+        ) as mock:
+            yield mock
+
+    def test_should_expire_the_favorites_of_the_invalidated_products(
+        self,
+        mock_bump_favorites_version,
+    ):
+        product_id = '6a512e6c-6627-d286-5d18-583558359ab6'
+        favorites = baker.make(
+            'Favorite',
+            product_id=product_id,
+            product_snapshot={'title': 'Old title'},
+            _fill_optional=['snapshot_at'],
+            _quantity=2
+        )
+        other = baker.make('Favorite', _fill_optional=['snapshot_at'])
+
+        products_invalidated.send(sender=None, product_ids=[product_id])
+
+        pytest.assume(not Favorite.objects.filter(
+            product_id=product_id,
+            snapshot_at__isnull=False
+        ).exists())
+        pytest.assume(
+            Favorite.objects.get(pk=other.pk).snapshot_at is not None
+        )
+        pytest.assume(
+            sorted(mock_bump_favorites_version.call_args.args[0]) ==
+            sorted(favorite.client_id for favorite in favorites)
+        )
+
+    def test_should_snapshot_the_fetched_products_with_the_fetch_time(self):
+        product_id = '6a512e6c-6627-d286-5d18-583558359ab6'
+        fetched_at = timezone.now()
+
+        with patch(
+            'project.favorites.signals.schedule_products_snapshots'
+        ) as mock_schedule_products_snapshots:
+            products_fetched.send(
+                sender=None,
+                products={product_id: {'title': 'New title'}},
+                fetched_at=fetched_at
+            )
+
+        mock_schedule_products_snapshots.assert_called_once_with(
+            {product_id: {'title': 'New title'}},
+            fetched_at
+        )
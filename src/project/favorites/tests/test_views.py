@@ -1,12 +1,14 @@
 from unittest.mock import Mock, patch
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
+from model_bakery import baker
 
 from project.backends.products.exceptions import (
     ProductException,
     ProductNotFoundException
 )
+from project.backends.products.interfaces import Product
 from project.favorites.models import Favorite
 from project.favorites.tests.schemas import FavoriteSchema
 
@@ -32,10 +34,19 @@ class TestFavoriteCreateView:
     @pytest.fixture()
     def mock_get_product(self):
         with patch(
-            'project.favorites.serializers.ProductBackend'
+            'project.favorites.serializers.get_product_backend'
         ) as mock:
             mock_return_value = Mock()
-            mock_return_value.get_product = Mock(name='mock_get_product')
+            mock_return_value.get_product = Mock(
+                name='mock_get_product',
+                return_value=Product(
+                    id='6a512e6c-6627-d286-5d18-583558359ab6',
+                    price=1149.0,
+                    image='http://challenge-api.luizalabs.com/images/6.jpg',
+                    brand='bébé confort',
+                    title='Moisés Dorel Windoo 1529'
+                )
+            )
             mock.return_value = mock_return_value
             yield mock
 
@@ -66,6 +77,42 @@ class TestFavoriteCreateView:
         count = Favorite.objects.count()
         assert count == 1
 
+    def test_should_store_the_product_snapshot_when_favorite_is_created(
+        self,
+        client_authenticated,
+        data_post,
+        mock_get_product,
+    ):
+        response = client_authenticated.post(
+            path='/v1/favorites/',
+            data=data_post,
+            format='json'
+        )
+
+        favorite = Favorite.objects.get(pk=response.json()['id'])
+        assert favorite.product_snapshot == (
+            mock_get_product.return_value.get_product.return_value.as_dict()
+        )
+        assert favorite.snapshot_at is not None
+
+    def test_should_bump_the_favorites_version_of_the_client(
+        self,
+        client_authenticated,
+        client,
+        data_post,
+        mock_get_product,
+    ):
+        with patch(
+            'project.favorites.serializers.bump_favorites_version'
+        ) as mock_bump:
+            client_authenticated.post(
+                path='/v1/favorites/',
+                data=data_post,
+                format='json'
+            )
+
+        mock_bump.assert_called_once_with([client.id])
+
     def test_should_valid_when_favorite_is_already_registered(
         self,
         client_authenticated,
@@ -185,6 +232,206 @@ class TestFavoriteCreateView:
         assert self.contract.validate(data, self.contract.error_schema)
 
 
+@pytest.mark.django_db
+class TestFavoriteBulkCreateView:
+    contract = FavoriteSchema()
+
+    @pytest.fixture()
+    def data_post(self, client):
+        return {
+            'client_id': str(client.id),
+            'product_ids': [
+                '6a512e6c-6627-d286-5d18-583558359ab6',
+                '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+            ],
+        }
+
+    @pytest.fixture()
+    def mock_bulk_create_favorites(self):
+        with patch(
+            'project.favorites.views.bulk_create_favorites'
+        ) as mock:
+            mock.return_value = [
+                {
+                    'product_id': '6a512e6c-6627-d286-5d18-583558359ab6',
+                    'favorite_id': 'ff31f647-f872-4e70-b886-fd3071cd2788',
+                    'status': 'created',
+                },
+                {
+                    'product_id': '1bf0f365-fbdd-4e21-9786-da459d78dd1f',
+                    'favorite_id': None,
+                    'status': 'product_not_found',
+                },
+            ]
+            yield mock
+
+    def test_should_return_the_result_of_each_product(
+        self,
+        client_authenticated,
+        client,
+        data_post,
+        mock_bulk_create_favorites,
+    ):
+        response = client_authenticated.post(
+            path='/v1/favorites/bulk/',
+            data=data_post,
+            format='json'
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            'client_id': str(client.id),
+            'results': mock_bulk_create_favorites.return_value,
+        }
+        mock_bulk_create_favorites.assert_called_once_with(
+            client=client,
+            product_ids=[UUID(product_id)
+                         for product_id in data_post['product_ids']]
+        )
+
+    def test_should_valid_when_client_id_informed_not_exists_in_database(
+        self,
+        client_authenticated,
+        data_post,
+        mock_bulk_create_favorites,
+    ):
+        data_post['client_id'] = '6a512e6c-6627-d286-5d18-583558359ab6'
+
+        response = client_authenticated.post(
+            path='/v1/favorites/bulk/',
+            data=data_post,
+            format='json'
+        )
+        data = response.json()
+
+        assert response.status_code == 404
+        assert self.contract.validate(data, self.contract.error_schema)
+        assert data['code'] == 'client_not_found'
+        mock_bulk_create_favorites.assert_not_called()
+
+    def test_should_valid_when_request_for_products_throw_exception(
+        self,
+        client_authenticated,
+        data_post,
+        mock_bulk_create_favorites,
+    ):
+        mock_bulk_create_favorites.side_effect = ProductException
+
+        response = client_authenticated.post(
+            path='/v1/favorites/bulk/',
+            data=data_post,
+            format='json'
+        )
+        data = response.json()
+
+        assert response.status_code == 500
+        assert data['code'] == 'product_internal_error'
+
+    def test_should_limit_the_number_of_products(
+        self,
+        client_authenticated,
+        data_post,
+        mock_bulk_create_favorites,
+    ):
+        data_post['product_ids'] = [
+            str(uuid4()) for _ in range(101)
+        ]
+
+        response = client_authenticated.post(
+            path='/v1/favorites/bulk/',
+            data=data_post,
+            format='json'
+        )
+
+        assert response.status_code == 400
+        assert response.json().get('product_ids')
+        mock_bulk_create_favorites.assert_not_called()
+
+    def test_should_checks_whether_route_is_protected(
+        self,
+        client_unauthenticated,
+        data_post
+    ):
+        response = client_unauthenticated.post(
+            path='/v1/favorites/bulk/',
+            data=data_post,
+            format='json'
+        )
+
+        assert response.status_code == 401
+
+
+@pytest.mark.django_db
+class TestFavoriteBulkDestroyView:
+    contract = FavoriteSchema()
+
+    def test_should_return_the_number_of_favorites_removed(
+        self,
+        client_authenticated,
+        client,
+        favorite,
+    ):
+        other = baker.make('Favorite', client=client)
+
+        response = client_authenticated.delete(
+            path='/v1/favorites/bulk/',
+            data={
+                'client_id': str(client.id),
+                'favorite_ids': [str(other.id)],
+                'product_ids': [str(favorite.product_id)],
+            },
+            format='json'
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {'deleted': 2}
+        assert Favorite.objects.count() == 0
+
+    def test_should_require_the_favorites_or_products_to_remove(
+        self,
+        client_authenticated,
+        client,
+    ):
+        response = client_authenticated.delete(
+            path='/v1/favorites/bulk/',
+            data={'client_id': str(client.id)},
+            format='json'
+        )
+        data = response.json()
+
+        assert response.status_code == 400
+        assert self.contract.validate(data, self.contract.error_schema)
+
+    def test_should_valid_when_client_id_informed_not_exists_in_database(
+        self,
+        client_authenticated,
+    ):
+        response = client_authenticated.delete(
+            path='/v1/favorites/bulk/',
+            data={
+                'client_id': '6a512e6c-6627-d286-5d18-583558359ab6',
+                'product_ids': ['6a512e6c-6627-d286-5d18-583558359ab6'],
+            },
+            format='json'
+        )
+        data = response.json()
+
+        assert response.status_code == 404
+        assert data['code'] == 'client_not_found'
+
+    def test_should_checks_whether_route_is_protected(
+        self,
+        client_unauthenticated,
+    ):
+        response = client_unauthenticated.delete(
+            path='/v1/favorites/bulk/',
+            data={},
+            format='json'
+        )
+
+        assert response.status_code == 401
+
+
 @pytest.mark.django_db
 class TestFavoriteDestroyView:
     contract = FavoriteSchema()
@@ -201,6 +448,21 @@ class TestFavoriteDestroyView:
 
         assert response.status_code == 204
 
+    def test_should_bump_the_favorites_version_of_the_client(
+        self,
+        client_authenticated,
+        favorite,
+    ):
+        with patch(
+            'project.favorites.views.bump_favorites_version'
+        ) as mock_bump:
+            client_authenticated.delete(
+                path=f'/v1/favorites/{str(favorite.id)}/',
+                format='json'
+            )
+
+        mock_bump.assert_called_once_with([favorite.client_id])
+
     def test_should_valid_returned_when_it_does_not_find_favorite(
         self,
         client_authenticated,
@@ -3,10 +3,12 @@ from django.http import Http404
 import structlog
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, status
+from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from project.backends.products.exceptions import ProductException
 from project.core.exceptions import Conflict
 from project.favorites.exceptions import (
     ClientNotFoundApiException,
@@ -14,8 +16,17 @@ from project.favorites.exceptions import (
     ProductNotFoundApiException,
     ProductRequestApiException
 )
+from project.favorites.helpers import (
+    bulk_create_favorites,
+    bulk_delete_favorites,
+    bump_favorites_version
+)
 from project.favorites.models import Favorite
-from project.favorites.serializers import FavoriteCreateSerializer
+from project.favorites.serializers import (
+    FavoriteBulkCreateSerializer,
+    FavoriteBulkDestroySerializer,
+    FavoriteCreateSerializer
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -73,6 +84,92 @@ class FavoriteListView(
 
             raise
 
+    @swagger_auto_schema(
+        operation_summary='Adds favorites in bulk',
+        operation_description='Adds many products to the favorites of a client at once. The products already favorited are skipped and the result of each product is returned.',  # noqa
+        request_body=FavoriteBulkCreateSerializer,
+        responses={
+            200: 'Result of each product',
+            404: 'Client not found',
+            400: 'Invalid body',
+            500: 'Internal or Product error'
+        },
+    )
+    @action(
+        methods=['POST'],
+        detail=False,
+        url_path='bulk',
+        serializer_class=FavoriteBulkCreateSerializer
+    )
+    def bulk_create(self, request):
+        try:
+            logger.info(
+                'Data received to create favorites in bulk',
+                data=request.data
+            )
+
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            results = bulk_create_favorites(
+                client=serializer.validated_data['client'],
+                product_ids=serializer.validated_data['product_ids']
+            )
+
+            return Response(
+                data={
+                    'client_id': serializer.data['client_id'],
+                    'results': results,
+                },
+                status=status.HTTP_200_OK
+            )
+
+        except ValidationError as e:
+            client = e.detail.get('client_id')
+            if client and client[0].code == 'does_not_exist':
+                raise ClientNotFoundApiException()
+
+            raise
+        except ProductException:
+            raise ProductRequestApiException()
+
+    @swagger_auto_schema(
+        operation_summary='Removes favorites in bulk',
+        operation_description='Removes the favorites of a client by favorite ID or product ID at once and returns how many were removed.',  # noqa
+        request_body=FavoriteBulkDestroySerializer,
+        responses={
+            200: 'Number of favorites removed',
+            404: 'Client not found',
+            400: 'Invalid body',
+        },
+    )
+    @bulk_create.mapping.delete
+    def bulk_destroy(self, request):
+        try:
+            logger.info(
+                'Request for favorites deleting in bulk',
+                data=request.data
+            )
+
+            serializer = FavoriteBulkDestroySerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            deleted = bulk_delete_favorites(
+                client=serializer.validated_data['client'],
+                favorite_ids=serializer.validated_data['favorite_ids'],
+                product_ids=serializer.validated_data['product_ids']
+            )
+
+            return Response(
+                data={'deleted': deleted},
+                status=status.HTTP_200_OK
+            )
+
+        except ValidationError as e:
+            client = e.detail.get('client_id')
+            if client and client[0].code == 'does_not_exist':
+                raise ClientNotFoundApiException()
+
+            raise
+
 
 class FavoriteDetailView(
     mixins.DestroyModelMixin,
@@ -96,6 +193,7 @@ class FavoriteDetailView(
 
             favorite = self.get_object()
             favorite.delete()
+            bump_favorites_version([favorite.client_id])
 
             return Response(
                 status=status.HTTP_204_NO_CONTENT
@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+
+class LocalCache:
+    """
+    Bounded in-process cache with LRU eviction and a TTL per entry.
+    It is meant to sit in front of a shared cache, so each worker keeps the
+    hot entries in memory without a round-trip to Redis. It is thread safe.
+    """
+
+    def __init__(self, max_size: int, timeout: float):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.timeout > 0
+
+    def _get(self, key: Hashable, now: float) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= now:
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _set(
+        self,
+        key: Hashable,
+        value: Any,
+        now: float,
+        timeout: Optional[float]
+    ) -> None:
+        timeout = self.timeout if timeout is None else timeout
+        self._data[key] = (now + timeout, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            return self._get(key, time.monotonic())
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Any, Any]:
+        if not self.enabled:
+            return {}
+
+        with self._lock:
+            now = time.monotonic()
+            values = ((key, self._get(key, now)) for key in keys)
+            return {key: value for key, value in values if value is not None}
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        timeout: Optional[float] = None
+    ) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._set(key, value, time.monotonic(), timeout)
+
+    def set_many(
+        self,
+        data: Dict[Any, Any],
+        timeout: Optional[float] = None
+    ) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            for key, value in data.items():
+                self._set(key, value, now, timeout)
+
+    def delete_many(self, keys: Iterable[Hashable]) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def delete(self, key: Hashable) -> None:
+        self.delete_many([key])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'max_size': self.max_size,
+            }
@@ -0,0 +1,208 @@
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Iterator
+
+from django.core.cache import caches
+
+import structlog
+from asgiref.sync import sync_to_async
+from prometheus_client import Counter
+
+logger = structlog.get_logger(__name__)
+
+state_changes = Counter(
+    'circuit_breaker_state_changes_total',
+    'Changes of state of the circuit breakers',
+    ['circuit_breaker', 'state'],
+)
+
+
+class CircuitBreakerOpenException(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker with the state shared between the workers through a
+    cache, usually Redis.
+
+    While closed, the calls and failures are counted in windows of
+    `window` seconds and the circuit opens when the failure rate of the
+    window reaches `failure_rate` after at least `minimum_calls` calls.
+    While open, calls fail fast with CircuitBreakerOpenException. After
+    `recovery_timeout` seconds the circuit becomes half-open and a single
+    call is let through as a probe: its success closes the circuit and its
+    failure opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float,
+        minimum_calls: int,
+        window: int,
+        recovery_timeout: int,
+        is_failure: Callable[[BaseException], bool] = lambda exc: True,
+        cache_alias: str = 'concurrent',
+        enabled: bool = True,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.minimum_calls = minimum_calls
+        self.window = window
+        self.recovery_timeout = recovery_timeout
+        self.is_failure = is_failure
+        self.cache_alias = cache_alias
+        self.enabled = enabled
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _get_key(self, suffix: str) -> str:
+        return f'circuit-breaker-{self.name}-{suffix}'
+
+    def _get_keys_window(self) -> tuple:
+        window = int(time.time() // self.window)
+        return (
+            self._get_key(f'calls-{window}'),
+            self._get_key(f'failures-{window}'),
+        )
+
+    def _incr(self, key: str) -> int:
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            if self.cache.add(key, 1, timeout=self.window * 2):
+                return 1
+            return self.cache.incr(key)
+
+    def _change_state(self, state: str, **kwargs) -> None:
+        state_changes.labels(circuit_breaker=self.name, state=state).inc()
+        logger.warning(
+            'Circuit breaker state changed',
+            circuit_breaker=self.name,
+            state=state,
+            **kwargs
+        )
+
+    def _open(self, **kwargs) -> None:
+        self.cache.set(self._get_key('half-open'), 1, timeout=None)
+        self.cache.set(
+            self._get_key('open'),
+            1,
+            timeout=self.recovery_timeout
+        )
+        self.cache.delete(self._get_key('probe'))
+        self._change_state(self.OPEN, **kwargs)
+
+    def _close(self) -> None:
+        self.cache.delete_many([
+            self._get_key('half-open'),
+            self._get_key('probe'),
+            *self._get_keys_window(),
+        ])
+        self._change_state(self.CLOSED)
+
+    def get_state(self) -> str:
+        state = self.cache.get_many([
+            self._get_key('open'),
+            self._get_key('half-open'),
+        ])
+        if self._get_key('open') in state:
+            return self.OPEN
+        if self._get_key('half-open') in state:
+            return self.HALF_OPEN
+        return self.CLOSED
+
+    def before_call(self) -> bool:
+        """
+        Raises CircuitBreakerOpenException when the call is not allowed.
+        Returns whether the call is the probe of a half-open circuit.
+        """
+        if not self.enabled:
+            return False
+
+        state = self.get_state()
+        if state == self.CLOSED:
+            return False
+
+        if state == self.HALF_OPEN and self.cache.add(
+            self._get_key('probe'),
+            1,
+            timeout=self.recovery_timeout
+        ):
+            logger.info(
+                'Circuit breaker is half-open, probing',
+                circuit_breaker=self.name,
+            )
+            return True
+
+        raise CircuitBreakerOpenException(
+            f'Circuit breaker {self.name} is {state}'
+        )
+
+    def on_success(self, probe: bool) -> None:
+        if not self.enabled:
+            return
+
+        if probe:
+            self._close()
+            return
+
+        key_calls, _ = self._get_keys_window()
+        self._incr(key_calls)
+
+    def on_failure(self, probe: bool) -> None:
+        if not self.enabled:
+            return
+
+        if probe:
+            self._open(reason='probe failed')
+            return
+
+        key_calls, key_failures = self._get_keys_window()
+        calls = self._incr(key_calls)
+        failures = self._incr(key_failures)
+
+        if (
+            calls >= self.minimum_calls and
+            failures / calls >= self.failure_rate
+        ):
+            self._open(calls=calls, failures=failures)
+
+    def _on_exception(self, probe: bool, exc: BaseException) -> None:
+        if self.is_failure(exc):
+            self.on_failure(probe)
+        else:
+            self.on_success(probe)
+
+    @contextmanager
+    def protect(self) -> Iterator[None]:
+        probe = self.before_call()
+        try:
+            yield
+        except Exception as exc:
+            self._on_exception(probe, exc)
+            raise
+        self.on_success(probe)
+
+    @asynccontextmanager
+    async def aprotect(self) -> AsyncIterator[None]:
+        probe = await sync_to_async(
+            self.before_call,
+            thread_sensitive=False
+        )()
+        try:
+            yield
+        except Exception as exc:
+            await sync_to_async(
+                self._on_exception,
+                thread_sensitive=False
+            )(probe, exc)
+            raise
+        await sync_to_async(self.on_success, thread_sensitive=False)(probe)
@@ -0,0 +1,32 @@
+import os
+
+from django.http import HttpResponse
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess
+)
+
+
+def get_registry() -> CollectorRegistry:
+    """
+    Returns the registry to be exposed. When PROMETHEUS_MULTIPROC_DIR is set,
+    as it must be under gunicorn, the metrics of all the workers are read
+    from that directory and aggregated.
+    """
+    if not os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def metrics_view(request):
+    return HttpResponse(
+        generate_latest(get_registry()),
+        content_type=CONTENT_TYPE_LATEST
+    )
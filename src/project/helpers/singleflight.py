@@ -0,0 +1,92 @@
+import asyncio
+import threading
+from asyncio import AbstractEventLoop
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from weakref import WeakKeyDictionary
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: while a call is running,
+    the other threads asking for the same key wait for it and share its
+    result (or exception) instead of running the function again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+
+        if not leader:
+            return call.result()
+
+        try:
+            call.set_result(func(*args, **kwargs))
+        except BaseException as exc:
+            call.set_exception(exc)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return call.result()
+
+
+# Result given to the followers when the leader is cancelled, so they run
+# the function again instead of failing with the cancellation of another task
+_RETRY = object()
+
+
+class AsyncSingleFlight:
+    """
+    Same as SingleFlight for coroutines. Futures belong to an event loop, so
+    the calls are coalesced per running loop.
+    """
+
+    def __init__(self):
+        self._calls: 'WeakKeyDictionary[AbstractEventLoop, dict]' = (
+            WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _get_calls(self) -> Dict[Hashable, asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._calls.get(loop)
+            if calls is None:
+                calls = self._calls[loop] = {}
+        return calls
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[..., Awaitable],
+        *args,
+        **kwargs
+    ) -> Any:
+        calls = self._get_calls()
+        call = calls.get(key)
+        while call is not None:
+            result = await asyncio.shield(call)
+            if result is not _RETRY:
+                return result
+            call = calls.get(key)
+
+        call = calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            call.set_result(await func(*args, **kwargs))
+        except asyncio.CancelledError:
+            call.set_result(_RETRY)
+            raise
+        except BaseException as exc:
+            call.set_exception(exc)
+        finally:
+            del calls[key]
+
+        return call.result()
@@ -0,0 +1,52 @@
+from freezegun import freeze_time
+
+from project.helpers.caches import LocalCache
+
+
+class TestLocalCache:
+    def test_should_return_the_value_stored_and_count_hits_and_misses(self):
+        local_cache = LocalCache(max_size=2, timeout=60)
+        local_cache.set('key', 'value')
+
+        assert local_cache.get('key') == 'value'
+        assert local_cache.get('other') is None
+        assert local_cache.stats() == {
+            'hits': 1,
+            'misses': 1,
+            'size': 1,
+            'max_size': 2,
+        }
+
+    def test_should_evict_the_least_recently_used_key_when_it_is_full(self):
+        local_cache = LocalCache(max_size=2, timeout=60)
+        local_cache.set_many({'first': 1, 'second': 2})
+        local_cache.get('first')
+        local_cache.set('third', 3)
+
+        assert local_cache.get_many(['first', 'second', 'third']) == {
+            'first': 1,
+            'third': 3,
+        }
+
+    def test_should_expire_the_value_when_the_timeout_is_reached(self):
+        local_cache = LocalCache(max_size=2, timeout=60)
+
+        with freeze_time('2021-04-13 10:00:00') as frozen_time:
+            local_cache.set('key', 'value')
+            frozen_time.tick(61)
+
+            assert local_cache.get('key') is None
+
+    def test_should_not_store_values_when_it_is_disabled(self):
+        local_cache = LocalCache(max_size=0, timeout=60)
+        local_cache.set('key', 'value')
+
+        assert local_cache.get('key') is None
+        assert local_cache.stats()['size'] == 0
+
+    def test_should_remove_the_values_when_delete_is_called(self):
+        local_cache = LocalCache(max_size=2, timeout=60)
+        local_cache.set_many({'first': 1, 'second': 2})
+        local_cache.delete('first')
+
+        assert local_cache.get_many(['first', 'second']) == {'second': 2}
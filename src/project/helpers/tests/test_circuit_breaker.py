@@ -0,0 +1,133 @@
+from unittest.mock import PropertyMock, patch
+
+from django.core.cache.backends.locmem import LocMemCache
+
+import pytest
+from prometheus_client import REGISTRY
+
+from project.helpers.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerOpenException
+)
+
+
+class TestCircuitBreaker:
+    @pytest.fixture
+    def cache(self):
+        cache = LocMemCache('circuit-breaker', {})
+        with patch.object(
+            CircuitBreaker,
+            'cache',
+            new_callable=PropertyMock,
+            return_value=cache
+        ):
+            yield cache
+        cache.clear()
+
+    @pytest.fixture
+    def circuit_breaker(self, cache):
+        return CircuitBreaker(
+            name='test',
+            failure_rate=0.5,
+            minimum_calls=4,
+            window=60,
+            recovery_timeout=30,
+            is_failure=lambda exc: isinstance(exc, TimeoutError),
+        )
+
+    @staticmethod
+    def fail(circuit_breaker, exception=TimeoutError):
+        with pytest.raises(exception):
+            with circuit_breaker.protect():
+                raise exception
+
+    def test_should_keep_the_circuit_closed_below_the_minimum_calls(
+        self,
+        circuit_breaker,
+    ):
+        for _ in range(3):
+            self.fail(circuit_breaker)
+
+        assert circuit_breaker.get_state() == CircuitBreaker.CLOSED
+
+    def test_should_open_the_circuit_when_the_failure_rate_is_reached(
+        self,
+        circuit_breaker,
+    ):
+        with circuit_breaker.protect():
+            pass
+        for _ in range(3):
+            self.fail(circuit_breaker)
+
+        assert circuit_breaker.get_state() == CircuitBreaker.OPEN
+        with pytest.raises(CircuitBreakerOpenException):
+            with circuit_breaker.protect():
+                pass
+
+    def test_should_count_the_changes_of_state_in_the_metrics(
+        self,
+        circuit_breaker,
+    ):
+        labels = {'circuit_breaker': 'test', 'state': CircuitBreaker.OPEN}
+        before = REGISTRY.get_sample_value(
+            'circuit_breaker_state_changes_total',
+            labels
+        ) or 0
+
+        for _ in range(4):
+            self.fail(circuit_breaker)
+
+        assert REGISTRY.get_sample_value(
+            'circuit_breaker_state_changes_total',
+            labels
+        ) == before + 1
+
+    def test_should_not_count_exceptions_that_are_not_failures(
+        self,
+        circuit_breaker,
+    ):
+        for _ in range(4):
+            self.fail(circuit_breaker, exception=KeyError)
+
+        assert circuit_breaker.get_state() == CircuitBreaker.CLOSED
+
+    def test_should_close_the_circuit_when_the_probe_succeeds(
+        self,
+        circuit_breaker,
+        cache,
+    ):
+        for _ in range(4):
+            self.fail(circuit_breaker)
+        cache.delete(circuit_breaker._get_key('open'))
+
+        assert circuit_breaker.get_state() == CircuitBreaker.HALF_OPEN
+        with circuit_breaker.protect():
+            pass
+
+        assert circuit_breaker.get_state() == CircuitBreaker.CLOSED
+
+    def test_should_let_a_single_probe_through_when_half_open(
+        self,
+        circuit_breaker,
+        cache,
+    ):
+        for _ in range(4):
+            self.fail(circuit_breaker)
+        cache.delete(circuit_breaker._get_key('open'))
+
+        assert circuit_breaker.before_call() is True
+        with pytest.raises(CircuitBreakerOpenException):
+            circuit_breaker.before_call()
+
+        circuit_breaker.on_failure(probe=True)
+        assert circuit_breaker.get_state() == CircuitBreaker.OPEN
+
+    def test_should_let_every_call_through_when_it_is_disabled(
+        self,
+        circuit_breaker,
+    ):
+        circuit_breaker.enabled = False
+        for _ in range(4):
+            self.fail(circuit_breaker)
+
+        assert circuit_breaker.get_state() == CircuitBreaker.CLOSED
@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY, CollectorRegistry
+
+from project.helpers.metrics import get_registry
+
+
+class TestGetRegistry:
+
+    def test_should_return_the_default_registry_without_multiprocess_dir(
+        self,
+        monkeypatch,
+    ):
+        monkeypatch.delenv('PROMETHEUS_MULTIPROC_DIR', raising=False)
+
+        assert get_registry() is REGISTRY
+
+    def test_should_aggregate_the_workers_with_multiprocess_dir(
+        self,
+        monkeypatch,
+        tmp_path,
+    ):
+        monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', str(tmp_path))
+
+        with patch(
+            'project.helpers.metrics.multiprocess.MultiProcessCollector'
+        ) as mock_collector:
+            registry = get_registry()
+
+        pytest.assume(isinstance(registry, CollectorRegistry))
+        pytest.assume(registry is not REGISTRY)
+        mock_collector.assert_called_once_with(registry)
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+
+    def test_should_expose_the_metrics_without_authentication(
+        self,
+        client_unauthenticated,
+    ):
+        response = client_unauthenticated.get('/metrics/')
+
+        pytest.assume(response.status_code == 200)
+        pytest.assume(response['Content-Type'].startswith('text/plain'))
+        pytest.assume(b'product_cache_requests_total' in response.content)
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from project.helpers.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    def test_should_share_a_single_call_between_concurrent_callers(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def func(value):
+            calls.append(value)
+            started.set()
+            release.wait(timeout=5)
+            return value
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, 'key', func, 'value')
+            started.wait(timeout=5)
+            follower = executor.submit(single_flight.do, 'key', func, 'other')
+            release.set()
+
+            assert leader.result() == 'value'
+            assert follower.result() == 'value'
+
+        assert calls == ['value']
+
+    def test_should_raise_the_exception_of_the_call(self):
+        single_flight = SingleFlight()
+
+        def func():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            single_flight.do('key', func)
+
+    def test_should_run_the_function_again_after_the_call_finished(self):
+        single_flight = SingleFlight()
+
+        assert single_flight.do('key', lambda: 1) == 1
+        assert single_flight.do('key', lambda: 2) == 2
+
+
+class TestAsyncSingleFlight:
+    def test_should_share_a_single_call_between_concurrent_callers(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def func(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        async def run():
+            return await asyncio.gather(
+                single_flight.do('key', func, 'value'),
+                single_flight.do('key', func, 'other'),
+            )
+
+        assert asyncio.run(run()) == ['value', 'value']
+        assert calls == ['value']
+
+    def test_should_not_share_calls_between_event_loops(self):
+        single_flight = AsyncSingleFlight()
+        started = threading.Event()
+        calls = []
+
+        async def func(value):
+            calls.append(value)
+            started.set()
+            await asyncio.sleep(0.05)
+            return value
+
+        def run(value):
+            return asyncio.run(single_flight.do('key', func, value))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(run, 'first')
+            started.wait(timeout=5)
+            second = executor.submit(run, 'second')
+
+            assert first.result() == 'first'
+            assert second.result() == 'second'
+
+        assert sorted(calls) == ['first', 'second']
+
+    def test_should_run_again_for_the_followers_when_leader_is_cancelled(
+        self
+    ):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def func(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        async def run():
+            leader = asyncio.ensure_future(
+                single_flight.do('key', func, 'leader')
+            )
+            await asyncio.sleep(0)
+            followers = asyncio.gather(
+                single_flight.do('key', func, 'first'),
+                single_flight.do('key', func, 'second'),
+            )
+            await asyncio.sleep(0)
+            leader.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await followers
+
+        assert asyncio.run(run()) == ['first', 'first']
+        assert calls == ['leader', 'first']
+
+    def test_should_raise_the_exception_of_the_call(self):
+        single_flight = AsyncSingleFlight()
+
+        async def func():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            asyncio.run(single_flight.do('key', func))
@@ -0,0 +1,23 @@
+from django.contrib import admin
+
+from project.products.models import Product
+
+
+@admin.register(Product)
+class ProductAdmin(admin.ModelAdmin):
+    list_display = [
+        'id',
+        'title',
+        'brand',
+        'price',
+        'updated_at',
+    ]
+
+    search_fields = [
+        'id',
+        'title',
+        'brand'
+    ]
+
+    list_per_page = 30
+    list_max_show_all = 30
@@ -0,0 +1,110 @@
+from typing import Dict, Iterable, Optional
+
+from django.core.exceptions import ValidationError
+
+import structlog
+
+from project.backends.products.backend import ProductAbstractBackend
+from project.backends.products.exceptions import ProductException
+from project.backends.products.interfaces import Product as ProductInterface
+from project.extensions.challenge.products.backend import ProductBackend
+from project.products.helpers import upsert_products
+from project.products.models import Product
+
+logger = structlog.get_logger(__name__)
+
+
+class ProductLocalBackend(ProductAbstractBackend):
+    """
+    Reads the products from the local catalog and falls back to another
+    backend, by default the Product Challenge one, for the products that
+    are not there.
+    """
+
+    def __init__(self, fallback: Optional[ProductAbstractBackend] = None):
+        self.fallback = fallback or ProductBackend()
+
+    def get_product(self, product_id: str) -> ProductInterface:
+        try:
+            return Product.objects.get(pk=product_id).as_interface()
+        except (Product.DoesNotExist, ValidationError):
+            logger.info(
+                'Product not found in the local catalog',
+                product_id=product_id,
+            )
+            return self.fallback.get_product(product_id)
+
+    def get_products(
+        self,
+        product_ids: Iterable[str]
+    ) -> Dict[str, ProductInterface]:
+        product_ids = list(dict.fromkeys(map(str, product_ids)))
+
+        try:
+            products = {
+                str(product.id): product.as_interface()
+                for product in Product.objects.filter(pk__in=product_ids)
+            }
+        except ValidationError:
+            products = {}
+
+        missing_ids = [
+            product_id
+            for product_id in product_ids
+            if product_id not in products
+        ]
+        if missing_ids:
+            logger.info(
+                'Products not found in the local catalog',
+                product_ids=missing_ids,
+            )
+            products.update(self.fallback.get_products(missing_ids))
+
+        return {
+            product_id: products[product_id]
+            for product_id in product_ids
+            if product_id in products
+        }
+
+    def invalidate_products(
+        self,
+        product_ids: Iterable[str],
+        refresh: bool = False
+    ) -> None:
+        """
+        Invalidates the products in the fallback and then in the local
+        catalog: with `refresh` the rows are updated with the products
+        fetched again from the fallback, otherwise they are deleted so the
+        next reads go to the fallback.
+        """
+        product_ids = list(dict.fromkeys(map(str, product_ids)))
+        self.fallback.invalidate_products(product_ids, refresh=refresh)
+
+        products = {}
+        if refresh:
+            try:
+                products = self.fallback.get_products(product_ids)
+            except ProductException as exc:
+                logger.warning(
+                    'Failed to refresh the products of the local catalog, '
+                    'removing them instead',
+                    product_ids=product_ids,
+                    error_message=str(exc)
+                )
+            upsert_products(list(products.values()))
+
+        removed_ids = [
+            product_id
+            for product_id in product_ids
+            if product_id not in products
+        ]
+        try:
+            Product.objects.filter(pk__in=removed_ids).delete()
+        except ValidationError:
+            pass
+
+        logger.info(
+            'Invalidating products of the local catalog',
+            product_ids=product_ids,
+            refreshed=list(products),
+        )
@@ -0,0 +1,43 @@
+from typing import List
+
+from django.db import transaction
+from django.utils import timezone
+
+from project.backends.products.interfaces import Product as ProductInterface
+from project.products.models import Product
+
+
+def upsert_products(products: List[ProductInterface]) -> int:
+    """
+    Inserts or updates the products in the local catalog with one query to
+    find the existing ones plus one bulk query for each operation.
+    """
+    instances = {
+        str(product.id): Product.from_interface(product)
+        for product in products
+    }
+    existing_ids = {
+        str(product_id)
+        for product_id in Product.objects.filter(
+            pk__in=instances.keys()
+        ).values_list('pk', flat=True)
+    }
+
+    now = timezone.now()
+    to_create = []
+    to_update = []
+    for product_id, instance in instances.items():
+        if product_id in existing_ids:
+            instance.updated_at = now
+            to_update.append(instance)
+        else:
+            to_create.append(instance)
+
+    with transaction.atomic():
+        Product.objects.bulk_create(to_create, ignore_conflicts=True)
+        Product.objects.bulk_update(
+            to_update,
+            fields=['title', 'price', 'brand', 'image', 'updated_at']
+        )
+
+    return len(instances)
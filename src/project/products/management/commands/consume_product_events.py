@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+
+import structlog
+from simple_settings import settings
+
+from project.backends.products.events import get_product_event_consumer
+from project.backends.products.registry import get_product_backend
+from project.backends.products.signals import products_invalidated
+
+logger = structlog.get_logger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        'Consumes the product change events of the configured consumer and '
+        'invalidates the cache of the changed products'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            default=settings.EXTENSIONS_CONFIG['challenge']['invalidation'][
+                'refresh'
+            ],
+            help='Fetch the changed products again instead of dropping them'
+        )
+
+    def handle(self, *args, **options):
+        backend = get_product_backend()
+        consumer = get_product_event_consumer()
+
+        logger.info(
+            'Consuming product events',
+            consumer=type(consumer).__name__,
+        )
+        for product_ids in consumer.consume():
+            backend.invalidate_products(
+                product_ids,
+                refresh=options['refresh']
+            )
+            products_invalidated.send(
+                sender=self.__class__,
+                product_ids=product_ids
+            )
@@ -0,0 +1,84 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+import structlog
+
+from project.backends.products.serializers import ProductSerializer
+from project.extensions.challenge.products.exceptions import (
+    ChallengeProductNotFoundException
+)
+from project.extensions.challenge.products.http_client import get_products_page
+from project.products.helpers import upsert_products
+
+logger = structlog.get_logger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        'Crawls the product listing of Product Challenge page by page and '
+        'upserts the products in the local catalog'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start-page',
+            type=int,
+            default=1,
+            help='First page of the listing to be crawled'
+        )
+        parser.add_argument(
+            '--max-pages',
+            type=int,
+            default=None,
+            help='Maximum number of pages to be crawled'
+        )
+
+    @staticmethod
+    def _get_valid_products(data: list) -> list:
+        products = []
+        for item in data:
+            serializer = ProductSerializer(data=item)
+            if not serializer.is_valid():
+                logger.warning(
+                    'Ignoring invalid product of the listing',
+                    product=item,
+                    errors=serializer.errors,
+                )
+                continue
+            products.append(serializer.from_interface())
+
+        return products
+
+    def handle(self, *args, **options):
+        page = options['start_page']
+        max_pages = options['max_pages']
+        pages = 0
+        total = 0
+        started_at = time.monotonic()
+
+        while max_pages is None or pages < max_pages:
+            try:
+                data = get_products_page(page)
+            except ChallengeProductNotFoundException:
+                break
+
+            if not data.get('products'):
+                break
+
+            products = self._get_valid_products(data['products'])
+            total += upsert_products(products)
+            pages += 1
+            logger.info(
+                'Products page synchronized',
+                page=page,
+                products=len(products),
+            )
+            page += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{total} products synchronized from {pages} pages in '
+                f'{time.monotonic() - started_at:.1f}s'
+            )
+        )
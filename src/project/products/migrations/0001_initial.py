@@ -0,0 +1,31 @@
+# Generated by Django 3.2 on 2026-10-18 16:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False, verbose_name='Id')),
+                ('title', models.CharField(max_length=255, verbose_name='Title')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=12, verbose_name='Price')),
+                ('brand', models.CharField(max_length=255, verbose_name='Brand')),
+                ('image', models.URLField(max_length=500, verbose_name='Image')),
+            ],
+            options={
+                'verbose_name': 'Product',
+                'verbose_name_plural': 'Products',
+                'ordering': ['title'],
+            },
+        ),
+    ]
@@ -0,0 +1,61 @@
+from django.db import models
+
+from project.backends.products.interfaces import Product as ProductInterface
+from project.core.models import BaseModel
+
+
+class Product(BaseModel):
+    """
+    Local mirror of the product catalog of Product Challenge, filled by the
+    crawl_products command.
+    """
+    id = models.UUIDField(
+        verbose_name='Id',
+        primary_key=True,
+        editable=False
+    )
+    title = models.CharField(
+        verbose_name='Title',
+        max_length=255
+    )
+    price = models.DecimalField(
+        verbose_name='Price',
+        max_digits=12,
+        decimal_places=2
+    )
+    brand = models.CharField(
+        verbose_name='Brand',
+        max_length=255
+    )
+    image = models.URLField(
+        verbose_name='Image',
+        max_length=500
+    )
+
+    class Meta:
+        app_label = 'products'
+        verbose_name = 'Product'
+        verbose_name_plural = 'Products'
+        ordering = ['title']
+
+    def __str__(self):
+        return self.title
+
+    def as_interface(self) -> ProductInterface:
+        return ProductInterface(
+            id=str(self.id),
+            price=float(self.price),
+            image=self.image,
+            brand=self.brand,
+            title=self.title,
+        )
+
+    @classmethod
+    def from_interface(cls, product: ProductInterface) -> 'Product':
+        return cls(
+            id=product.id,
+            price=product.price,
+            image=product.image,
+            brand=product.brand,
+            title=product.title,
+        )
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+
+class ProductInvalidationSerializer(serializers.Serializer):
+    product_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=1000
+    )
+    refresh = serializers.BooleanField(
+        required=False,
+        default=False
+    )
@@ -0,0 +1,33 @@
+import pytest
+from model_bakery import baker
+
+from project.backends.products.interfaces import Product as ProductInterface
+
+
+@pytest.fixture
+def product_id():
+    return '1bf0f365-fbdd-4e21-9786-da459d78dd1f'
+
+
+@pytest.fixture
+def mock_data_api_product(product_id):
+    return {
+        'id': product_id,
+        'price': 1699.0,
+        'image': (
+            'http://challenge-api.luizalabs.com/images/'
+            '1bf0f365-fbdd-4e21-9786-da459d78dd1f.jpg'
+        ),
+        'brand': 'bébé confort',
+        'title': 'Cadeira para Auto Iseos Bébé Confort Earth Brown',
+    }
+
+
+@pytest.fixture
+def product_interface(mock_data_api_product):
+    return ProductInterface.from_dict(mock_data_api_product)
+
+
+@pytest.fixture
+def product(db, mock_data_api_product):
+    yield baker.make('products.Product', **mock_data_api_product)
@@ -0,0 +1,30 @@
+import pytest
+
+from project.products.admin import ProductAdmin
+
+
+class TestAdmin:
+    def test_should_validate_static_elements_of_admin_when_it_is_called(self):
+        product_class = ProductAdmin
+        list_display = product_class.list_display
+        search_fields = product_class.search_fields
+        list_per_page = product_class.list_per_page
+        list_max_show_all = product_class.list_max_show_all
+
+        list_display_expected = [
+            'id',
+            'title',
+            'brand',
+            'price',
+            'updated_at',
+        ]
+        search_fields_expected = [
+            'id',
+            'title',
+            'brand',
+        ]
+
+        pytest.assume(list_display == list_display_expected)
+        pytest.assume(search_fields == search_fields_expected)
+        pytest.assume(list_per_page == 30)
+        pytest.assume(list_max_show_all == 30)
@@ -0,0 +1,8 @@
+from project.products.apps import ProductsConfig
+
+
+class TestApps:
+    def test_should_be_successful_when_application_name_is_as_expected(self):
+        app_name = ProductsConfig.name
+
+        assert app_name == 'project.products'
@@ -0,0 +1,198 @@
+from unittest import mock
+
+import pytest
+
+from project.backends.products.exceptions import (
+    ProductNotFoundException,
+    ProductTimeoutException
+)
+from project.backends.products.interfaces import Product as ProductInterface
+from project.backends.products.registry import build_product_backend
+from project.products.backend import ProductLocalBackend
+from project.products.models import Product
+
+
+@pytest.mark.django_db
+class TestProductLocalBackend:
+
+    @pytest.fixture
+    def fallback(self):
+        return mock.Mock()
+
+    @pytest.fixture
+    def backend(self, fallback):
+        return ProductLocalBackend(fallback=fallback)
+
+    @pytest.fixture
+    def other_product(self):
+        return ProductInterface(
+            id='6a512e6c-6627-d286-5d18-583558359ab6',
+            price=10.0,
+            image='http://challenge-api.luizalabs.com/images/1.jpg',
+            brand='brand',
+            title='title',
+        )
+
+    def test_should_return_the_product_of_the_local_catalog(
+        self,
+        backend,
+        fallback,
+        product,
+        product_interface,
+    ):
+        assert backend.get_product(product_interface.id) == product_interface
+        fallback.get_product.assert_not_called()
+
+    def test_should_fall_back_when_the_product_is_not_in_the_local_catalog(
+        self,
+        backend,
+        fallback,
+        product_interface,
+    ):
+        fallback.get_product.return_value = product_interface
+
+        assert backend.get_product(product_interface.id) == product_interface
+        fallback.get_product.assert_called_once_with(product_interface.id)
+
+    def test_should_fall_back_when_the_product_id_is_not_a_uuid(
+        self,
+        backend,
+        fallback,
+    ):
+        fallback.get_product.side_effect = ProductNotFoundException
+
+        with pytest.raises(ProductNotFoundException):
+            backend.get_product('invalid')
+
+    def test_should_return_the_products_in_order_falling_back_for_missing_ones(  # noqa
+        self,
+        backend,
+        fallback,
+        product,
+        product_interface,
+        other_product,
+    ):
+        fallback.get_products.return_value = {
+            other_product.id: other_product
+        }
+
+        products = backend.get_products([
+            other_product.id,
+            product_interface.id,
+            other_product.id,
+        ])
+
+        pytest.assume(list(products) == [
+            other_product.id,
+            product_interface.id,
+        ])
+        pytest.assume(products[product_interface.id] == product_interface)
+        fallback.get_products.assert_called_once_with([other_product.id])
+
+    def test_should_not_call_the_fallback_when_all_products_are_local(
+        self,
+        backend,
+        fallback,
+        product,
+        product_interface,
+    ):
+        products = backend.get_products([product_interface.id])
+
+        pytest.assume(products == {product_interface.id: product_interface})
+        fallback.get_products.assert_not_called()
+
+    def test_should_invalidate_the_products_in_the_fallback(
+        self,
+        backend,
+        fallback,
+        product_id,
+    ):
+        fallback.get_products.return_value = {}
+
+        backend.invalidate_products([product_id], refresh=True)
+
+        fallback.invalidate_products.assert_called_once_with(
+            [product_id],
+            refresh=True
+        )
+
+    def test_should_remove_the_invalidated_products_of_the_local_catalog(
+        self,
+        backend,
+        fallback,
+        product,
+        product_id,
+    ):
+        backend.invalidate_products([product_id])
+
+        pytest.assume(not Product.objects.filter(pk=product_id).exists())
+        fallback.get_products.assert_not_called()
+
+    def test_should_update_the_local_catalog_when_refreshing(
+        self,
+        backend,
+        fallback,
+        product,
+        product_interface,
+    ):
+        refreshed = product_interface._replace(title='New title')
+        fallback.get_products.return_value = {refreshed.id: refreshed}
+
+        backend.invalidate_products([refreshed.id], refresh=True)
+
+        assert Product.objects.get(pk=refreshed.id).title == 'New title'
+
+    def test_should_remove_the_products_when_refreshing_fails(
+        self,
+        backend,
+        fallback,
+        product,
+        product_id,
+    ):
+        fallback.get_products.side_effect = ProductTimeoutException
+
+        backend.invalidate_products([product_id], refresh=True)
+
+        assert not Product.objects.filter(pk=product_id).exists()
+
+
+@pytest.mark.django_db
+class TestProductLocalBackendChain:
+    @pytest.fixture
+    def backend(self):
+        return build_product_backend([
+            'project.products.backend.ProductLocalBackend',
+            'project.extensions.fake.challenge.products.backend.'
+            'ProductFakeBackend',
+        ])
+
+    def test_should_serve_the_fallback_after_the_invalidation(
+        self,
+        backend,
+        product,
+        product_interface,
+    ):
+        fake_product = backend.fallback.get_product(product_interface.id)
+        pytest.assume(
+            backend.get_product(product_interface.id) == product_interface
+        )
+
+        backend.invalidate_products([product_interface.id])
+
+        pytest.assume(
+            backend.get_product(product_interface.id) == fake_product
+        )
+
+    def test_should_store_the_fallback_product_when_refreshing(
+        self,
+        backend,
+        product,
+        product_interface,
+    ):
+        fake_product = backend.fallback.get_product(product_interface.id)
+
+        backend.invalidate_products([product_interface.id], refresh=True)
+
+        assert Product.objects.get(
+            pk=product_interface.id
+        ).as_interface() == fake_product
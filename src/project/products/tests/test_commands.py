@@ -0,0 +1,123 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+
+import pytest
+
+from project.extensions.challenge.products.exceptions import (
+    ChallengeProductNotFoundException
+)
+from project.products.models import Product
+
+
+@pytest.mark.django_db
+class TestCrawlProductsCommand:
+
+    @pytest.fixture
+    def mock_get_products_page(self):
+        with mock.patch(
+            'project.products.management.commands.crawl_products.'
+            'get_products_page'
+        ) as mock_get:
+            yield mock_get
+
+    def test_should_crawl_the_pages_until_the_listing_ends(
+        self,
+        mock_get_products_page,
+        mock_data_api_product,
+    ):
+        mock_get_products_page.side_effect = [
+            {'products': [mock_data_api_product]},
+            {'products': []},
+        ]
+        out = StringIO()
+
+        call_command('crawl_products', stdout=out)
+
+        pytest.assume(Product.objects.count() == 1)
+        pytest.assume(mock_get_products_page.call_args_list == [
+            mock.call(1),
+            mock.call(2),
+        ])
+        pytest.assume('1 products synchronized from 1 pages' in out.getvalue())
+
+    def test_should_stop_when_the_page_is_not_found(
+        self,
+        mock_get_products_page,
+    ):
+        mock_get_products_page.side_effect = ChallengeProductNotFoundException
+
+        call_command('crawl_products', stdout=StringIO())
+
+        assert Product.objects.count() == 0
+
+    def test_should_ignore_the_invalid_products_of_the_page(
+        self,
+        mock_get_products_page,
+        mock_data_api_product,
+    ):
+        mock_get_products_page.side_effect = [
+            {'products': [mock_data_api_product, {'id': 'invalid'}]},
+            {'products': []},
+        ]
+
+        call_command('crawl_products', stdout=StringIO())
+
+        assert Product.objects.count() == 1
+
+    def test_should_respect_the_start_page_and_the_maximum_of_pages(
+        self,
+        mock_get_products_page,
+        mock_data_api_product,
+    ):
+        mock_get_products_page.return_value = {
+            'products': [mock_data_api_product]
+        }
+
+        call_command(
+            'crawl_products',
+            start_page=3,
+            max_pages=2,
+            stdout=StringIO()
+        )
+
+        assert mock_get_products_page.call_args_list == [
+            mock.call(3),
+            mock.call(4),
+        ]
+
+
+@pytest.mark.django_db
+class TestConsumeProductEventsCommand:
+
+    @pytest.fixture
+    def mock_backend(self):
+        with mock.patch(
+            'project.products.management.commands.consume_product_events.'
+            'get_product_backend'
+        ) as mock_backend:
+            yield mock_backend.return_value
+
+    @pytest.fixture
+    def mock_consumer(self):
+        with mock.patch(
+            'project.products.management.commands.consume_product_events.'
+            'get_product_event_consumer'
+        ) as mock_get:
+            yield mock_get.return_value
+
+    def test_should_invalidate_each_batch_of_products_consumed(
+        self,
+        mock_backend,
+        mock_consumer,
+        product_id,
+    ):
+        mock_consumer.consume.return_value = iter([[product_id], [product_id]])
+
+        call_command('consume_product_events', refresh=True)
+
+        assert mock_backend.invalidate_products.call_args_list == [
+            mock.call([product_id], refresh=True),
+            mock.call([product_id], refresh=True),
+        ]
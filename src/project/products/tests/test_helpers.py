@@ -0,0 +1,39 @@
+import pytest
+
+from project.products.helpers import upsert_products
+from project.products.models import Product
+
+
+@pytest.mark.django_db
+class TestUpsertProducts:
+
+    def test_should_create_the_products_that_do_not_exist(
+        self,
+        product_interface,
+    ):
+        total = upsert_products([product_interface])
+
+        pytest.assume(total == 1)
+        pytest.assume(
+            Product.objects.get(pk=product_interface.id).as_interface() ==
+            product_interface
+        )
+
+    def test_should_update_the_products_that_already_exist(
+        self,
+        product,
+        product_interface,
+    ):
+        product_updated = product_interface._replace(price=10.5)
+
+        total = upsert_products([product_updated])
+
+        pytest.assume(total == 1)
+        pytest.assume(Product.objects.count() == 1)
+        pytest.assume(
+            Product.objects.get(pk=product.id).as_interface() ==
+            product_updated
+        )
+
+    def test_should_do_nothing_when_there_are_no_products(self):
+        assert upsert_products([]) == 0
@@ -0,0 +1,33 @@
+import pytest
+
+from project.backends.products.interfaces import Product as ProductInterface
+from project.products.models import Product
+
+
+@pytest.mark.django_db
+class TestProductModel:
+
+    def test_product_creation(self, product):
+        assert isinstance(product, Product)
+
+    def test_should_return_the_title_when_converted_to_string(self, product):
+        assert str(product) == product.title
+
+    def test_should_convert_to_the_product_interface(
+        self,
+        product,
+        product_interface,
+    ):
+        assert product.as_interface() == product_interface
+
+    def test_should_create_an_instance_from_the_product_interface(
+        self,
+        product_interface,
+    ):
+        product = Product.from_interface(product_interface)
+        product.save()
+
+        product.refresh_from_db()
+
+        assert isinstance(product.as_interface(), ProductInterface)
+        assert product.as_interface() == product_interface
@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.mark.django_db
+class TestProductInvalidationView:
+    path = '/v1/products/invalidate/'
+
+    @pytest.fixture()
+    def mock_backend(self):
+        with patch(
+            'project.products.views.get_product_backend'
+        ) as mock:
+            yield mock.return_value
+
+    @pytest.fixture()
+    def client_staff(self, client_authenticated, user_model):
+        user_model.is_staff = True
+        user_model.save()
+        yield client_authenticated
+
+    def test_should_invalidate_the_products_informed(
+        self,
+        client_staff,
+        mock_backend,
+        product_id,
+    ):
+        response = client_staff.post(
+            path=self.path,
+            data={'product_ids': [product_id, product_id], 'refresh': True},
+            format='json'
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            'product_ids': [product_id, product_id],
+            'refresh': True,
+        }
+        mock_backend.invalidate_products.assert_called_once_with(
+            [product_id, product_id],
+            refresh=True
+        )
+
+    def test_should_not_allow_users_that_are_not_staff(
+        self,
+        client_authenticated,
+        mock_backend,
+        product_id,
+    ):
+        response = client_authenticated.post(
+            path=self.path,
+            data={'product_ids': [product_id]},
+            format='json'
+        )
+
+        assert response.status_code == 403
+        mock_backend.invalidate_products.assert_not_called()
+
+    def test_should_not_allow_unauthenticated_requests(
+        self,
+        client_unauthenticated,
+        product_id,
+    ):
+        response = client_unauthenticated.post(
+            path=self.path,
+            data={'product_ids': [product_id]},
+            format='json'
+        )
+
+        assert response.status_code == 401
+
+    @pytest.mark.parametrize('data', [
+        {},
+        {'product_ids': []},
+        {'product_ids': ['invalid']},
+    ])
+    def test_should_return_bad_request_when_the_body_is_invalid(
+        self,
+        client_staff,
+        mock_backend,
+        data,
+    ):
+        response = client_staff.post(path=self.path, data=data, format='json')
+
+        assert response.status_code == 400
+        mock_backend.invalidate_products.assert_not_called()
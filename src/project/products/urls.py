@@ -0,0 +1,12 @@
+from rest_framework import routers
+
+from project.products import views
+
+router = routers.DefaultRouter(trailing_slash=True)
+router.register(
+    'invalidate',
+    views.ProductInvalidationView,
+    basename='products-invalidate'
+)
+
+urlpatterns = router.urls
@@ -0,0 +1,51 @@
+import structlog
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from project.backends.products.registry import get_product_backend
+from project.backends.products.signals import products_invalidated
+from project.products.serializers import ProductInvalidationSerializer
+
+logger = structlog.get_logger(__name__)
+
+
+class ProductInvalidationView(GenericViewSet):
+    permission_classes = (IsAdminUser,)
+    serializer_class = ProductInvalidationSerializer
+
+    @swagger_auto_schema(
+        operation_summary='Invalidates the cache of products',
+        operation_description='Drops the given products from the caches, or fetches them again when refresh is true. Restricted to staff users.',  # noqa
+        request_body=ProductInvalidationSerializer,
+        responses={
+            200: ProductInvalidationSerializer(),
+            400: 'Invalid body',
+            403: 'Forbidden',
+        },
+    )
+    def create(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        product_ids = [
+            str(product_id)
+            for product_id in serializer.validated_data['product_ids']
+        ]
+        logger.info(
+            'Products invalidation requested',
+            product_ids=product_ids,
+            refresh=serializer.validated_data['refresh'],
+        )
+        get_product_backend().invalidate_products(
+            product_ids,
+            refresh=serializer.validated_data['refresh']
+        )
+        products_invalidated.send(
+            sender=self.__class__,
+            product_ids=product_ids
+        )
+
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
@@ -8,6 +8,7 @@ from simple_settings import settings
 
 from project.core.exceptions import custom_handler_404
 from project.core.swagger import schema_view
+from project.helpers.metrics import metrics_view
 
 admin.site.site_header = settings.ADMIN_SITE_HEADER
 admin.site.site_title = settings.ADMIN_SITE_TITLE
@@ -24,6 +25,7 @@ routers_v1: List = [
     path('auth/', include(auth)),
     path('clients/', include('project.clients.urls')),
     path('favorites/', include('project.favorites.urls')),
+    path('products/', include('project.products.urls')),
 ]
 
 admin_i18n: List = i18n_patterns(
@@ -34,5 +36,6 @@ admin_i18n: List = i18n_patterns(
 urlpatterns: List = [
     path('healthcheck/', include('health_check.urls')),
     path('ping/', include('project.ping.urls')),
+    path('metrics/', metrics_view),
     path('v1/', include((routers_v1, 'v1'), namespace='v1')),
 ] + admin_i18n